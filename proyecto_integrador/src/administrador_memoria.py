@@ -1,7 +1,16 @@
 from frame import Frame
 from tabla_paginas import PageTable
-from algoritmo_remplazo import ReplacementAlgorithm
-from proceso import Process
+from algoritmo_remplazo import create_replacement_algorithm
+from grupos_memoria import GroupController, MemoryGroup
+from proceso import Process, PidAllocator
+from aleatorio import SimulationRandom
+from metricas import MetricsRecorder
+from instrumentacion import Instrumentation
+from modelo_latencia import LatencyModel
+from memoria_comprimida import CompressedPool
+from deduplicacion import PageDeduplicator
+from registro_eventos import EventSink
+import asyncio
 import time
 
 class MemoryManager:
@@ -11,55 +20,148 @@ class MemoryManager:
     Inicializa el gestor de memoria
     """
     
-    def __init__(self, config):
+    def __init__(self, config, rng=None):
         self.config = config
+
+        # Flujos aleatorios y PIDs propios de esta simulación
+        self.random = rng if rng is not None else SimulationRandom(config.seed)
+        self.pid_allocator = PidAllocator()
+
+        # Reloj lógico: ordena cargas y accesos de forma reproducible
+        self.clock = 0
+
+        # Pool de memoria comprimida opcional; sus marcos se descuentan de la RAM
+        self.compressed_pool = None
+        ram_frame_count = config.ram_frames
+        if getattr(config, 'compressed_pool_enabled', False):
+            self.compressed_pool = CompressedPool(
+                config.compressed_pool_kb,
+                config.page_size,
+                self.random.compression,
+                min_ratio=config.compression_min_ratio,
+                max_ratio=config.compression_max_ratio,
+                incompressible_fraction=config.incompressible_fraction,
+                compress_ns=config.compress_ns,
+                decompress_ns=config.decompress_ns
+            )
+            ram_frame_count = max(1, ram_frame_count - self.compressed_pool.frames_reserved())
         
         # Crear marcos de RAM
-        self.ram_frames = []
-        for i in range(config.ram_frames):
-            self.ram_frames.append(Frame(i, 'RAM'))
+        self.ram_frames = [Frame(i, 'RAM') for i in range(ram_frame_count)]
         
+        # Paginación bajo demanda: los marcos se asignan en el primer acceso a cada página
+        self.demand_paging = getattr(config, 'demand_paging', False)
+
+        # Páginas enormes: cada una ocupa pages_per_huge marcos contiguos y alineados
+        huge_page_size = getattr(config, 'huge_page_size', 0)
+        self.pages_per_huge = huge_page_size // config.page_size if huge_page_size else 1
+        self.huge_page_min_fill = getattr(config, 'huge_page_min_fill', 1.0)
+        self.huge_splits = 0
+
         # Crear marcos de SWAP
-        self.swap_frames = []
-        for i in range(config.swap_frames):
-            self.swap_frames.append(Frame(i, 'SWAP'))
+        self.swap_frames = [Frame(i, 'SWAP') for i in range(config.swap_frames)]
         
-        # Lista de procesos activos
+        # Lista de procesos activos e índice por PID para búsquedas O(1)
         self.processes = []
+        self.processes_by_pid = {}
         
         # Algoritmo de reemplazo
-        self.replacement_algorithm = ReplacementAlgorithm(config.replacement_algorithm)
+        self.replacement_algorithm = create_replacement_algorithm(config.replacement_algorithm, len(self.ram_frames))
+
+        # Grupos de procesos con límites de RAM (al estilo cgroups), si están configurados
+        self.groups = None
+        if getattr(config, 'groups_enabled', False):
+            self.groups = GroupController(self, [
+                MemoryGroup(spec['name'], spec['members'], spec['hard_kb'] // config.page_size,
+                            spec['soft_kb'] // config.page_size)
+                for spec in config.memory_groups
+            ])
         
         # Estadísticas
         self.total_page_faults = 0
         self.total_swaps = 0
+        self.total_forks = 0
+        self.first_touch_faults = 0
+        self.cow_copies = 0
+        self.direct_reclaims = 0
         self.event_log = []
+
+        # Registro de eventos en disco (opcional, escrito por un hilo de fondo)
+        self.event_sink = None
+        if getattr(config, 'event_log_enabled', False):
+            self.event_sink = EventSink(
+                config.event_log_path,
+                fmt=config.event_log_format,
+                max_bytes=config.event_log_max_kb * 1024,
+                max_files=config.event_log_max_files,
+                compress=config.event_log_compress
+            )
+
+        # Series de tiempo por proceso y globales
+        self.metrics = MetricsRecorder(self)
+
+        # Deduplicación de páginas idénticas (opcional, avanza en cada ciclo)
+        self.deduplicator = None
+        if getattr(config, 'dedup_enabled', False):
+            self.deduplicator = PageDeduplicator(
+                self,
+                pages_per_scan=config.dedup_pages_per_scan,
+                library_pages=config.dedup_library_pages,
+                code_fraction=config.dedup_code_fraction,
+                scan_ns=config.dedup_scan_ns,
+                merge_ns=config.dedup_merge_ns
+            )
+
+        # Modelo de costos de acceso (reloj simulado por proceso)
+        self.latency_model = LatencyModel.from_config(config)
+        self._access_cost = 0
+
+        # Oyentes de accesos: reciben (pid, página, escritura) de cada referencia válida
+        self.access_listeners = []
+
+        # Marcos que cambiaron de dueño por ubicación, solo mientras alguien los sigue (grabación)
+        self.frame_changes = None
+
+        # Temporizadores de rutas críticas (sin costo mientras esté deshabilitada)
+        self.instrumentation = Instrumentation(self)
+        if getattr(config, 'instrumentation_enabled', False):
+            self.instrumentation.enable()
         
         self._log_event("Sistema inicializado", "INFO")
 
+    #Avanza el reloj lógico y retorna el nuevo instante
+    def _tick(self):
+        self.clock += 1
+        return self.clock
+
     #Registra un evento en el log
     def _log_event(self, message, event_type="INFO"):
         timestamp = time.strftime("%H:%M:%S")
         event = {
             'timestamp': timestamp,
+            'tick': self.clock,
             'type': event_type,
             'message': message
         }
         self.event_log.append(event)
+        if self.event_sink is not None:
+            self.event_sink.emit(self.clock, event_type, message)
 
     #Crea y carga un nuevo proceso en memoria
     def create_process(self, name, size):
         # Crear el proceso
-        process = Process(name, size)
+        process = Process(name, size, pid=self.pid_allocator.allocate(), rng=self.random.lifetimes)
         
         # Calcular páginas necesarias
-        num_pages = process.calculate_pages(self.config.page_size)
+        num_pages = process.calculate_pages(self.config.page_size, self.pages_per_huge, self.huge_page_min_fill)
         
         self._log_event(f"Creando proceso {process} ({size} KB, {num_pages} páginas)", "INFO")
         
-        # Verificar si hay espacio total (RAM + SWAP)
+        # Verificar si hay espacio total (RAM + SWAP), descontando lo reservado y aún no tocado
         total_free_frames = self._count_free_frames(self.ram_frames) + \
                            self._count_free_frames(self.swap_frames)
+        if self.demand_paging:
+            total_free_frames -= self._count_reserved_pages()
         
         if num_pages > total_free_frames:
             error_msg = f"No hay suficiente espacio para {process}"
@@ -67,18 +169,27 @@ class MemoryManager:
             return (False, error_msg, None)
         
         # Crear tabla de páginas
-        page_table = PageTable(process, num_pages)
+        page_table = PageTable(process, num_pages, self.pages_per_huge)
         process.page_table = page_table
         
-        # Intentar asignar páginas en RAM
-        success = self._allocate_process(process)
+        # Con paginación bajo demanda solo se reserva la capacidad; si no, carga completa
+        if self.demand_paging:
+            process.set_state(Process.ACTIVE)
+            self._log_event(f"{num_pages} páginas de {process} reservadas (asignación en primer acceso)", "INFO")
+            success = True
+        else:
+            success = self._allocate_process(process)
         
         if success:
             self.processes.append(process)
+            self.processes_by_pid[process.pid] = process
             msg = f"Proceso {process} cargado exitosamente"
             self._log_event(msg, "INFO")
             return (True, msg, process)
         else:
+            # La carga pudo fallar a mitad de camino (por ejemplo si el pool comprimido usó
+            # el SWAP al bajar páginas): se liberan los marcos que ya se habían asignado
+            self._release_process_memory(process)
             error_msg = f"Error al cargar {process}"
             self._log_event(error_msg, "ERROR")
             return (False, error_msg, None)
@@ -86,15 +197,28 @@ class MemoryManager:
     #Asigna marcos de memoria a las páginas de un proceso
     def _allocate_process(self, process):
         page_table = process.page_table
+        huge = self.pages_per_huge
+        page_num = 0
         
-        for page_num in range(process.num_pages):
+        while page_num < process.num_pages:
+            # Región alineada completa: intentar mapearla con una página enorme
+            if (huge > 1 and page_num % huge == 0 and page_num + huge <= process.num_pages
+                    and (self.groups is None or self.groups.has_room(process, huge))):
+                start = self._find_free_huge_run()
+                if start is not None:
+                    for offset in range(huge):
+                        self._load_frame(self.ram_frames[start + offset], process, page_num + offset)
+                    page_table.set_huge_region(page_num // huge)
+                    self._log_event(f"Páginas {page_num}-{page_num + huge - 1} de {process} asignadas como página enorme a Marcos RAM {start}-{start + huge - 1}", "INFO")
+                    page_num += huge
+                    continue
+
             # Intentar asignar en RAM primero
             free_frame = self._find_free_frame(self.ram_frames)
             
             if free_frame:
                 # Asignar en RAM directamente (no es fallo de página, es primera carga)
-                free_frame.allocate(process, page_num)
-                page_table.set_page_in_ram(page_num, free_frame.frame_id)
+                self._load_frame(free_frame, process, page_num)
                 self._log_event(f"Página {page_num} de {process} asignada a Marco RAM {free_frame.frame_id}", "INFO")
             else:
                 # RAM llena, necesitamos hacer swapping (esto SÍ genera fallo de página)
@@ -103,13 +227,16 @@ class MemoryManager:
                 if not swap_success:
                     self._log_event(f"Error al hacer swap para {process}", "ERROR")
                     return False
+
+            page_num += 1
         
         # Proceso creado exitosamente, está ACTIVO
         process.set_state(Process.ACTIVE)
         return True
 
     #Simula el acceso a una página de un proceso, puede generar fallo de página
-    def simulate_page_access(self, pid, page_num):
+    #Si write es True la página queda marcada como modificada (dirty bit)
+    def simulate_page_access(self, pid, page_num, write=False):
         process = self._find_process_by_pid(pid)
         
         if not process:
@@ -117,19 +244,77 @@ class MemoryManager:
         
         if page_num >= process.num_pages:
             return (False, f"Página {page_num} no existe en el proceso")
-        
+
+        for listener in self.access_listeners:
+            listener(pid, page_num, write)
+
+        # Costo de traducción (TLB); el resto se acumula mientras se resuelve el acceso
+        self._access_cost = self.latency_model.translate(pid, process.page_table.tlb_key(page_num))
+
+        result = self._access_page(process, page_num)
+
+        entry = process.page_table.entries[page_num]
+        if write and entry.valid:
+            # Escribir en una página compartida obliga a copiarla primero
+            if entry.cow and not self._break_cow(process, page_num):
+                msg = f"Copy-on-write: sin marco para copiar la Página {page_num} de {process}, escritura no realizada"
+                self._log_event(msg, "ERROR")
+                result = (False, msg)
+            else:
+                entry.modified = True
+                if self.deduplicator is not None:
+                    self.deduplicator.note_write(pid, page_num)
+
+        self.latency_model.record_access(process, self._access_cost)
+        return result
+
+    #Registra un oyente de accesos (por ejemplo un analizador de la curva de fallos)
+    def add_access_listener(self, listener):
+        self.access_listeners.append(listener)
+
+    #Quita un oyente de accesos
+    def remove_access_listener(self, listener):
+        if listener in self.access_listeners:
+            self.access_listeners.remove(listener)
+
+    #Empieza (o reinicia) el seguimiento de los marcos que cambian de dueño
+    #None en una ubicación indica que hay que revisar todos sus marcos
+    def track_frame_changes(self):
+        self.frame_changes = {'RAM': None, 'SWAP': None}
+
+    #Deja de seguir los cambios de los marcos
+    def untrack_frame_changes(self):
+        self.frame_changes = None
+
+    #Anota que un marco cambió de dueño
+    def _frame_changed(self, frame):
+        if self.frame_changes is not None:
+            changed = self.frame_changes[frame.location]
+            if changed is not None:
+                changed.add(frame.frame_id)
+
+    #Resuelve el acceso a una página ya validada
+    def _access_page(self, process, page_num):
+        latency = self.latency_model
+
         # Verificar si la página está en RAM
         if process.page_table.is_page_in_ram(page_num):
             # Página en RAM, acceso exitoso sin fallo
             # Actualizar timestamp para LRU
             frame_num, _ = process.page_table.get_frame(page_num)
-            self.ram_frames[frame_num].access()
+            frame = self.ram_frames[frame_num]
+            frame.access(self._tick())
+            self.replacement_algorithm.on_access(frame)
+            if self.groups is not None:
+                self.groups.touch(frame)
+            self._access_cost += latency.ram_access
             return (True, f"Acceso exitoso a página {page_num} en RAM")
         
         elif process.page_table.is_page_in_swap(page_num):
             # Página en SWAP, hay que traerla (FALLO DE PÁGINA)
             process.increment_page_fault()
             self.total_page_faults += 1
+            self._access_cost += latency.swap_read + latency.ram_access
             
             # Buscar marco libre en RAM
             free_frame = self._find_free_frame(self.ram_frames)
@@ -138,12 +323,11 @@ class MemoryManager:
                 # Hay espacio libre, traer de SWAP sin necesidad de swap-out
                 old_swap_frame_num, _ = process.page_table.get_frame(page_num)
                 
-                # Liberar del SWAP
-                self.swap_frames[old_swap_frame_num].free()
+                # Liberar del SWAP (si el marco es compartido, solo esta referencia)
+                self._release_mapping(self.swap_frames[old_swap_frame_num], process, page_num)
                 
                 # Asignar en RAM
-                free_frame.allocate(process, page_num)
-                process.page_table.set_page_in_ram(page_num, free_frame.frame_id)
+                self._load_frame(free_frame, process, page_num)
                 
                 msg = f"Fallo de página: Página {page_num} de {process} traída de SWAP a RAM (sin swap-out)"
                 self._log_event(msg, "WARNING")
@@ -159,43 +343,57 @@ class MemoryManager:
                     return (True, msg)
                 else:
                     return (False, "Error al hacer swap")
+
+        elif process.page_table.is_page_compressed(page_num):
+            # Página en el pool comprimido (FALLO DE PÁGINA menor, sin E/S de SWAP)
+            process.increment_page_fault()
+            self.total_page_faults += 1
+            return self._bring_in_from_pool(process, page_num)
+        elif self.demand_paging:
+            # Primer acceso a una página reservada: se le asigna un marco ahora
+            return self._allocate_on_first_touch(process, page_num)
         else:
             # Página no asignada
             process.increment_page_fault()
             self.total_page_faults += 1
             return (False, f"Fallo de página: Página {page_num} no está asignada")
 
+    #Versión awaitable del acceso a página: un fallo de página espera la latencia de E/S
+    #antes de resolverse, permitiendo que otras tareas se ejecuten mientras tanto
+    async def simulate_page_access_async(self, pid, page_num, fault_latency=0.0, write=False):
+        process = self._find_process_by_pid(pid)
+
+        if (process and fault_latency > 0 and page_num < process.num_pages
+                and not process.page_table.is_page_in_ram(page_num)):
+            await asyncio.sleep(fault_latency)
+
+        return self.simulate_page_access(pid, page_num, write)
+
     #Hace swap-out de una página y trae otra del SWAP
     def _swap_out_and_bring_in(self, process, page_to_bring):
-        # Seleccionar víctima
-        victim_frame = self.replacement_algorithm.select_victim(self.ram_frames)
+        # Seleccionar víctima (reclamo directo: el fallo espera el desalojo)
+        victim_frame = self._select_victim(process)
         
         if not victim_frame:
             return False
         
-        victim_process = victim_frame.process
-        victim_page = victim_frame.page_number
-        
-        # Obtener el marco en SWAP de la página que queremos traer
+        # Liberar el marco en SWAP de la página que queremos traer (queda disponible para la víctima)
         swap_frame_num, _ = process.page_table.get_frame(page_to_bring)
-        
-        # Mover víctima a SWAP (reusar el marco que liberamos)
-        self.swap_frames[swap_frame_num].allocate(victim_process, victim_page)
-        victim_process.page_table.set_page_in_swap(victim_page, swap_frame_num)
-        
-        # Actualizar estado del proceso víctima
-        self._update_process_state(victim_process)
-        
-        # Incrementar contador de swaps
-        self.total_swaps += 1
-        
-        msg = f"Swap: Página {victim_page} de {victim_process} movida a SWAP"
-        self._log_event(msg, "WARNING")
+        swap_frame = self.swap_frames[swap_frame_num]
+        self._release_mapping(swap_frame, process, page_to_bring)
+
+        # Sacar la víctima de RAM (al pool comprimido o a SWAP)
+        eviction_cost = self._evict_frame(victim_frame)
+
+        if eviction_cost is None:
+            self._map_frame(swap_frame, process, page_to_bring)
+            return False
+
+        self.direct_reclaims += 1
+        self._access_cost += eviction_cost
         
         # Traer la página deseada a RAM
-        ram_frame_id = victim_frame.frame_id
-        victim_frame.allocate(process, page_to_bring)
-        process.page_table.set_page_in_ram(page_to_bring, ram_frame_id)
+        self._load_frame(victim_frame, process, page_to_bring)
         
         # Actualizar estado del proceso
         self._update_process_state(process)
@@ -211,40 +409,27 @@ class MemoryManager:
         new_process.increment_page_fault()
         self.total_page_faults += 1
         
-        # Seleccionar víctima usando el algoritmo de reemplazo
-        victim_frame = self.replacement_algorithm.select_victim(self.ram_frames)
+        # Seleccionar víctima usando el algoritmo de reemplazo (reclamo directo)
+        victim_frame = self._select_victim(new_process)
         
         if not victim_frame:
             self._log_event("No se encontró marco víctima", "ERROR")
             return False
         
-        victim_process = victim_frame.process
-        victim_page = victim_frame.page_number
-        
-        # Buscar espacio en SWAP
-        swap_frame = self._find_free_frame(self.swap_frames)
-        
-        if not swap_frame:
+        # Sacar la víctima de RAM (al pool comprimido o a SWAP)
+        eviction_cost = self._evict_frame(victim_frame)
+
+        if eviction_cost is None:
             self._log_event("SWAP lleno, no se puede hacer intercambio", "ERROR")
             return False
-        
-        # Mover víctima a SWAP (esto es el SWAP, diferente al fallo de página)
-        swap_frame.allocate(victim_process, victim_page)
-        victim_process.page_table.set_page_in_swap(victim_page, swap_frame.frame_id)
-        
-        # Actualizar estadísticas de swap
-        self.total_swaps += 1
-        
-        # Verificar si el proceso víctima tiene TODAS sus páginas en SWAP ahora
-        self._update_process_state(victim_process)
-        
-        msg = f"Página {victim_page} de {victim_process} movida a SWAP (Marco {swap_frame.frame_id}) - Algoritmo: {self.replacement_algorithm.algorithm_type}"
-        self._log_event(msg, "WARNING")
+
+        self.direct_reclaims += 1
+        # El costo de desalojar la víctima se carga al proceso que necesita el marco
+        self.latency_model.charge(new_process, eviction_cost)
         
         # Liberar marco de RAM y asignar al nuevo proceso
         old_frame_id = victim_frame.frame_id
-        victim_frame.allocate(new_process, new_page_num)
-        new_process.page_table.set_page_in_ram(new_page_num, victim_frame.frame_id)
+        self._load_frame(victim_frame, new_process, new_page_num)
         
         # Asegurar que el nuevo proceso esté ACTIVO (tiene páginas en RAM)
         new_process.set_state(Process.ACTIVE)
@@ -253,21 +438,378 @@ class MemoryManager:
         
         return True
 
+    #Asigna un marco a una página en su primer acceso (fallo de página sin lectura de SWAP)
+    def _allocate_on_first_touch(self, process, page_num):
+        free_frame = self._find_free_frame(self.ram_frames)
+
+        if free_frame:
+            process.increment_page_fault()
+            self.total_page_faults += 1
+            self._load_frame(free_frame, process, page_num)
+        elif not self._swap_out_and_allocate(process, page_num):
+            return (False, "Error al hacer swap")
+
+        self.first_touch_faults += 1
+        self._access_cost += self.latency_model.ram_access
+        self._update_process_state(process)
+
+        msg = f"Fallo de página: Página {page_num} de {process} asignada en su primer acceso"
+        self._log_event(msg, "INFO")
+
+        return (True, msg)
+
+    #Saca de RAM todas las páginas de un proceso (planificación de mediano plazo)
+    #Retorna (éxito, mensaje, páginas movidas); falla si no pudo mover ninguna
+    def swap_out_process(self, pid):
+        process = self._find_process_by_pid(pid)
+
+        if not process:
+            return (False, f"Proceso con PID {pid} no encontrado", 0)
+
+        moved = 0
+        for entry in process.page_table.entries:
+            if entry.valid:
+                eviction_cost = self._evict_frame(self.ram_frames[entry.frame_number])
+                if eviction_cost is None:
+                    break
+                self.latency_model.charge(process, eviction_cost)
+                moved += 1
+
+        self._update_process_state(process)
+
+        if moved == 0 and process.page_table.count_pages_in_ram() > 0:
+            error_msg = f"SWAP lleno, no se pudo sacar de memoria a {process}"
+            self._log_event(error_msg, "ERROR")
+            return (False, error_msg, 0)
+
+        msg = f"{process} sacado de memoria ({moved} páginas)"
+        self._log_event(msg, "WARNING")
+        return (True, msg, moved)
+
+    #Páginas reservadas por procesos que todavía no recibieron marco
+    def _count_reserved_pages(self):
+        reserved = 0
+        for process in self.processes:
+            table = process.page_table
+            reserved += table.num_pages - table.count_pages_in_ram() - table.count_pages_in_swap() \
+                - table.count_pages_compressed()
+        return reserved
+
+    #Escribe en SWAP una página que sale de RAM o del pool comprimido
+    #Retorna el costo de la escritura, o None si el SWAP está lleno
+    def _write_page_to_swap(self, process, page_num):
+        swap_frame = self._find_free_frame(self.swap_frames)
+
+        if not swap_frame:
+            return None
+
+        cost = self.latency_model.eviction_cost(process.page_table, page_num)
+        swap_frame.allocate(process, page_num, self._tick())
+        self._frame_changed(swap_frame)
+        process.page_table.set_page_in_swap(page_num, swap_frame.frame_id)
+
+        # Actualizar estadísticas de swap
+        self.total_swaps += 1
+
+        # Verificar si el proceso tiene TODAS sus páginas fuera de RAM ahora
+        self._update_process_state(process)
+
+        msg = f"Página {page_num} de {process} movida a SWAP (Marco {swap_frame.frame_id}) - Algoritmo: {self.replacement_algorithm.algorithm_type}"
+        self._log_event(msg, "WARNING")
+
+        return cost
+
+    #Divide la página enorme que contiene una página, si la hay
+    def _split_huge_page(self, process, page_num):
+        page_table = process.page_table
+        region = page_table.region_of(page_num)
+
+        if page_table.split_huge_region(region):
+            self.latency_model.tlb.invalidate(process.pid, -region - 1)
+            self.huge_splits += 1
+            self._log_event(f"Página enorme {region} de {process} dividida en páginas base", "WARNING")
+
+    #Saca de RAM la página del marco víctima: al pool comprimido si existe y la página
+    #comprime, si no a SWAP. Deja el marco libre y retorna el costo, o None si no hubo lugar
+    def _evict_frame(self, victim_frame):
+        if victim_frame.ref_count() > 1:
+            return self._evict_shared_frame(victim_frame)
+
+        victim_process = victim_frame.process
+        victim_page = victim_frame.page_number
+        pool = self.compressed_pool
+
+        # Desalojar parte de una página enorme obliga a dividirla en páginas base
+        self._split_huge_page(victim_process, victim_page)
+
+        cost = 0
+        overflow = False
+        compressed_kb = pool.compressed_size() if pool is not None else None
+
+        if compressed_kb is not None:
+            # Hacer lugar antes de guardar: bajar a SWAP las páginas comprimidas más antiguas
+            while not pool.fits(compressed_kb) and pool.entries and self._find_free_frame(self.swap_frames):
+                process, page_num = pool.demote_oldest()
+                cost += pool.decompress_ns + self._write_page_to_swap(process, page_num)
+            if not pool.fits(compressed_kb):
+                # El pool sigue lleno (SWAP sin lugar para degradar): la víctima va a SWAP
+                overflow = True
+                compressed_kb = None
+
+        if compressed_kb is None:
+            swap_cost = self._write_page_to_swap(victim_process, victim_page)
+            if swap_cost is None:
+                return None
+            if overflow:
+                pool.overflows += 1
+            victim_frame.free()
+            self._frame_evicted(victim_frame)
+            return cost + swap_cost
+
+        cost += pool.store(victim_process, victim_page, compressed_kb)
+        self.latency_model.tlb.invalidate(victim_process.pid, victim_page)
+        victim_process.page_table.set_page_compressed(victim_page)
+        victim_frame.free()
+        self._frame_evicted(victim_frame)
+        self._update_process_state(victim_process)
+        self._log_event(f"Página {victim_page} de {victim_process} comprimida en el pool", "WARNING")
+
+        return cost
+
+    #Mueve a SWAP un marco compartido: todas las páginas que lo referencian pasan
+    #a compartir el mismo marco de SWAP. Retorna el costo o None si el SWAP está lleno
+    def _evict_shared_frame(self, victim_frame):
+        swap_frame = self._find_free_frame(self.swap_frames)
+
+        if not swap_frame:
+            return None
+
+        mappings = victim_frame.mappings()
+        owner, owner_page = mappings[0]
+        cost = self.latency_model.eviction_cost(owner.page_table, owner_page)
+        victim_frame.free()
+        self._frame_evicted(victim_frame)
+
+        for process, page_num in mappings:
+            self._split_huge_page(process, page_num)
+            self.latency_model.tlb.invalidate(process.pid, page_num)
+            process.page_table.set_page_in_swap(page_num, swap_frame.frame_id)
+            self._map_frame(swap_frame, process, page_num)
+            self._update_process_state(process)
+
+        self.total_swaps += 1
+
+        msg = f"Marco compartido de {owner} ({len(mappings)} referencias) movido a SWAP (Marco {swap_frame.frame_id})"
+        self._log_event(msg, "WARNING")
+
+        return cost
+
+    #Reclamo en segundo plano: desaloja hasta count páginas de RAM sin que ningún fallo espere
+    #Retorna (páginas desalojadas, costo de los desalojos)
+    def reclaim_frames(self, count):
+        reclaimed = 0
+        cost = 0.0
+
+        while reclaimed < count:
+            victim_frame = self._select_victim()
+            if not victim_frame:
+                break
+            eviction_cost = self._evict_frame(victim_frame)
+            if eviction_cost is None:
+                break
+            reclaimed += 1
+            cost += eviction_cost
+
+        if reclaimed:
+            self._log_event(f"Reclamo en segundo plano: {reclaimed} páginas desalojadas de RAM", "INFO")
+
+        return reclaimed, cost
+
+    #Carga una página en un marco libre de RAM y avisa al algoritmo de reemplazo
+    #Con grupos, si el marco deja al grupo sobre su límite duro se desaloja una página del propio grupo
+    def _load_frame(self, frame, process, page_num):
+        frame.allocate(process, page_num, self._tick())
+        self._frame_changed(frame)
+        process.page_table.set_page_in_ram(page_num, frame.frame_id)
+        self.replacement_algorithm.on_load(frame)
+
+        if self.groups is not None:
+            group = self.groups.charge(frame)
+            victim_frame = self.groups.select_over_limit(frame)
+            if victim_frame:
+                eviction_cost = self._evict_frame(victim_frame)
+                if eviction_cost is None:
+                    self._log_event(f"{group} supera su límite duro: SWAP lleno", "ERROR")
+                else:
+                    self.latency_model.charge(process, eviction_cost)
+
+    #Elige la víctima de un desalojo: primero según los límites de los grupos, si no con el algoritmo de reemplazo
+    def _select_victim(self, process=None):
+        if self.groups is not None:
+            victim_frame = self.groups.select_victim(process)
+            if victim_frame:
+                return victim_frame
+        return self.replacement_algorithm.select_victim(self.ram_frames)
+
+    #Avisa que la página de un marco de RAM se desalojó
+    def _frame_evicted(self, frame):
+        self.replacement_algorithm.on_evict(frame.frame_id)
+        if self.groups is not None:
+            self.groups.evicted(frame.frame_id)
+        self._frame_changed(frame)
+
+    #Avisa que un marco de RAM quedó libre sin desalojo
+    def _frame_released(self, frame):
+        self.replacement_algorithm.on_remove(frame.frame_id)
+        if self.groups is not None:
+            self.groups.uncharge(frame.frame_id)
+        self._frame_changed(frame)
+
+    #Asigna una página a un marco, compartiéndolo si ya está ocupado
+    def _map_frame(self, frame, process, page_num):
+        if frame.is_free:
+            frame.allocate(process, page_num, self._tick())
+            self._frame_changed(frame)
+        else:
+            frame.share(process, page_num)
+        self._refresh_cow(frame)
+
+    #Quita la referencia de una página a un marco (lo libera si era la última)
+    def _release_mapping(self, frame, process, page_num):
+        frame.unshare(process, page_num)
+        if frame.is_free and frame.location == 'RAM':
+            self._frame_released(frame)
+        else:
+            self._frame_changed(frame)
+        self._refresh_cow(frame)
+
+    #Marca como copy-on-write las páginas de un marco solo si sigue compartido
+    def _refresh_cow(self, frame):
+        shared = frame.ref_count() > 1
+        for process, page_num in frame.mappings():
+            process.page_table.entries[page_num].cow = shared
+
+    #Fusiona un marco con otro de igual contenido: sus páginas pasan a compartir el estable
+    #Libera el marco fusionado y retorna cuántas páginas se movieron
+    def _merge_frames(self, frame, stable_frame):
+        mappings = frame.mappings()
+        frame.free()
+        self._frame_released(frame)
+
+        for process, page_num in mappings:
+            self.latency_model.tlb.invalidate(process.pid, page_num)
+            process.page_table.set_page_in_ram(page_num, stable_frame.frame_id)
+            self._map_frame(stable_frame, process, page_num)
+
+        owner, owner_page = mappings[0]
+        msg = f"Deduplicación: Página {owner_page} de {owner} fusionada en Marco RAM {stable_frame.frame_id}"
+        self._log_event(msg, "INFO")
+
+        return len(mappings)
+
+    #Copia una página compartida antes de escribirla (copy-on-write)
+    #Retorna False si no se pudo conseguir un marco para la copia
+    def _break_cow(self, process, page_num):
+        page_table = process.page_table
+        frame = self._find_free_frame(self.ram_frames)
+
+        if frame is None:
+            victim_frame = self._select_victim(process)
+            if not victim_frame:
+                return False
+            eviction_cost = self._evict_frame(victim_frame)
+            if eviction_cost is None:
+                return False
+            self._access_cost += eviction_cost
+            frame = victim_frame
+
+        # Al desalojar, el propio marco compartido pudo haber bajado a SWAP
+        if page_table.is_page_in_ram(page_num):
+            old_frame = self.ram_frames[page_table.entries[page_num].frame_number]
+        else:
+            old_frame = self.swap_frames[page_table.entries[page_num].frame_number]
+            self._access_cost += self.latency_model.swap_read
+
+        self._split_huge_page(process, page_num)
+        self.latency_model.tlb.invalidate(process.pid, page_num)
+        self._release_mapping(old_frame, process, page_num)
+
+        self._load_frame(frame, process, page_num)
+        self._access_cost += self.latency_model.ram_access
+        self._update_process_state(process)
+        self.cow_copies += 1
+
+        self._log_event(f"Copy-on-write: Página {page_num} de {process} copiada a Marco RAM {frame.frame_id}", "INFO")
+        return True
+
+    #Trae a RAM una página del pool comprimido, desalojando otra si no hay marco libre
+    def _bring_in_from_pool(self, process, page_num):
+        frame = self._find_free_frame(self.ram_frames)
+        with_eviction = frame is None
+
+        if frame is None:
+            frame = self._select_victim(process)
+            if not frame:
+                return (False, "Error al hacer swap")
+            eviction_cost = self._evict_frame(frame)
+            if eviction_cost is None:
+                return (False, "Error al hacer swap")
+            self.direct_reclaims += 1
+            self._access_cost += eviction_cost
+
+        # Al desalojar, el pool pudo bajar a SWAP la misma página que se busca
+        if process.page_table.is_page_compressed(page_num):
+            self._access_cost += self.compressed_pool.load(process.pid, page_num)
+        else:
+            swap_frame_num, _ = process.page_table.get_frame(page_num)
+            self._release_mapping(self.swap_frames[swap_frame_num], process, page_num)
+            self._access_cost += self.latency_model.swap_read
+
+        self._load_frame(frame, process, page_num)
+        self._access_cost += self.latency_model.ram_access
+        self._update_process_state(process)
+
+        msg = f"Fallo de página: Página {page_num} de {process} descomprimida a RAM"
+        if with_eviction:
+            msg += " (con desalojo)"
+        self._log_event(msg, "WARNING")
+
+        return (True, msg)
+
     #Actualiza el estado del proceso según dónde estén sus páginas
     def _update_process_state(self, process):
-        pages_in_ram = process.page_table.get_pages_in_ram()
-        pages_in_swap = process.page_table.get_pages_in_swap()
-        
-        if len(pages_in_ram) > 0:
+        # Un proceso bloqueado por E/S conserva su estado hasta que el planificador lo despierte
+        if process.state == Process.BLOCKED:
+            return
+
+        if process.page_table.count_pages_in_ram() > 0:
             # Tiene al menos una página en RAM -> ACTIVO
             process.set_state(Process.ACTIVE)
-        elif len(pages_in_swap) > 0:
+        elif process.page_table.count_pages_in_swap() > 0 or process.page_table.count_pages_compressed() > 0:
             # Todas las páginas están en SWAP -> INTERCAMBIADO
             process.set_state(Process.SWAPPED)
+        elif self.demand_paging:
+            # Aún no tocó ninguna página: sigue ACTIVO y las recibirá al accederlas
+            process.set_state(Process.ACTIVE)
         else:
             # No tiene páginas asignadas -> SUSPENDIDO
             process.set_state(Process.SUSPENDED)
 
+    #Libera los marcos de RAM y SWAP de un proceso (los compartidos solo pierden esta referencia),
+    #sus páginas comprimidas y sus traducciones de la TLB
+    def _release_process_memory(self, process):
+        for entry in process.page_table.entries:
+            if entry.valid:
+                self._release_mapping(self.ram_frames[entry.frame_number], process, entry.page_number)
+            elif entry.in_swap:
+                self._release_mapping(self.swap_frames[entry.frame_number], process, entry.page_number)
+
+        self.latency_model.tlb.flush_process(process.pid)
+        if self.compressed_pool is not None:
+            self.compressed_pool.remove_process(process.pid)
+        if self.deduplicator is not None:
+            self.deduplicator.forget_process(process.pid)
+
     #Termina un proceso y libera su memoria
     def terminate_process(self, pid):
         # Buscar el proceso
@@ -278,24 +820,103 @@ class MemoryManager:
             self._log_event(error_msg, "ERROR")
             return (False, error_msg)
         
-        # Liberar marcos de RAM
-        for frame in self.ram_frames:
-            if not frame.is_free and frame.process.pid == pid:
-                frame.free()
-        
-        # Liberar marcos de SWAP
-        for frame in self.swap_frames:
-            if not frame.is_free and frame.process.pid == pid:
-                frame.free()
-        
+        self._release_process_memory(process)
+
+        if self.groups is not None:
+            self.groups.retire(process)
+
         # Eliminar proceso de la lista
         self.processes.remove(process)
+        self.processes_by_pid.pop(pid, None)
         
         msg = f"Proceso {process} terminado y memoria liberada"
         self._log_event(msg, "INFO")
         
         return (True, msg)
 
+    def fork(self, pid, name=None):
+        """
+        Crea un proceso hijo que comparte los marcos del padre con copy-on-write:
+        las páginas se copian solo cuando alguno de los dos escribe en ellas
+
+        Args:
+            pid (int): PID del proceso padre
+            name (str): Nombre del hijo (por defecto se deriva del padre)
+
+        Returns:
+            tuple: (éxito, mensaje, proceso hijo)
+        """
+        parent = self._find_process_by_pid(pid)
+
+        if not parent:
+            error_msg = f"Proceso con PID {pid} no encontrado"
+            self._log_event(error_msg, "ERROR")
+            return (False, error_msg, None)
+
+        # Las páginas comprimidas no se comparten: el hijo recibe una copia en SWAP
+        parent_table = parent.page_table
+        if parent_table.count_pages_compressed() > self._count_free_frames(self.swap_frames):
+            error_msg = f"No hay suficiente SWAP para copiar las páginas comprimidas de {parent}"
+            self._log_event(error_msg, "ERROR")
+            return (False, error_msg, None)
+
+        # Con paginación bajo demanda el hijo también reserva las páginas que el padre no tocó
+        if self.demand_paging:
+            untouched = parent_table.num_pages - parent_table.count_pages_in_ram() \
+                - parent_table.count_pages_in_swap() - parent_table.count_pages_compressed()
+            available = self._count_free_frames(self.ram_frames) + self._count_free_frames(self.swap_frames) \
+                - self._count_reserved_pages()
+            if untouched > available:
+                error_msg = f"No hay suficiente espacio para reservar las páginas del hijo de {parent}"
+                self._log_event(error_msg, "ERROR")
+                return (False, error_msg, None)
+
+        child = Process(name or f"{parent.name}-hijo", parent.size, pid=self.pid_allocator.allocate(),
+                        rng=self.random.lifetimes)
+        child.num_pages = parent.num_pages
+        child.priority = parent.priority
+        child.program = parent.program
+        if self.groups is not None:
+            # El hijo queda en el grupo del padre aunque su nombre no lo indique
+            child.memory_group = self.groups.group_of(parent).name
+        child.page_table = PageTable(child, child.num_pages, self.pages_per_huge)
+
+        shared = 0
+        for page_num, entry in enumerate(parent_table.entries):
+            if entry.valid:
+                child.page_table.set_page_in_ram(page_num, entry.frame_number)
+                self._map_frame(self.ram_frames[entry.frame_number], child, page_num)
+                shared += 1
+            elif entry.in_swap:
+                child.page_table.set_page_in_swap(page_num, entry.frame_number)
+                self._map_frame(self.swap_frames[entry.frame_number], child, page_num)
+                shared += 1
+            elif entry.compressed:
+                self.latency_model.charge(child, self._write_page_to_swap(child, page_num))
+
+        # Las páginas enormes del padre siguen contiguas en RAM, el hijo las mapea igual
+        for region in parent_table.huge_regions:
+            child.page_table.set_huge_region(region)
+
+        self._update_process_state(child)
+        self.processes.append(child)
+        self.processes_by_pid[child.pid] = child
+        self.total_forks += 1
+
+        msg = f"Proceso {child} creado por fork de {parent} ({shared} marcos compartidos)"
+        self._log_event(msg, "INFO")
+
+        return (True, msg, child)
+
+    #Busca una secuencia alineada de marcos libres en RAM para una página enorme
+    #Retorna el índice del primer marco o None si la RAM está fragmentada
+    def _find_free_huge_run(self):
+        huge = self.pages_per_huge
+        for start in range(0, len(self.ram_frames) - huge + 1, huge):
+            if all(frame.is_free for frame in self.ram_frames[start:start + huge]):
+                return start
+        return None
+
     #Encuentra un marco libre en una lista de marcos
     def _find_free_frame(self, frames):
         for frame in frames:
@@ -309,10 +930,11 @@ class MemoryManager:
 
     #Busca un proceso por su PID
     def _find_process_by_pid(self, pid):
-        for process in self.processes:
-            if process.pid == pid:
-                return process
-        return None
+        return self.processes_by_pid.get(pid)
+
+    #Reconstruye el índice por PID tras reemplazar la lista de procesos
+    def _reindex_processes(self):
+        self.processes_by_pid = {process.pid: process for process in self.processes}
 
     #Obtiene el estado actual de la RAM
     def get_ram_status(self):
@@ -336,7 +958,7 @@ class MemoryManager:
         swap_free = len(self.swap_frames) - swap_used
         swap_utilization = (swap_used / len(self.swap_frames) * 100) if len(self.swap_frames) > 0 else 0
         
-        return {
+        stats = {
             'Marcos RAM Usados': f"{ram_used}/{len(self.ram_frames)}",
             'Marcos RAM Libres': ram_free,
             'Utilización RAM': f"{ram_utilization:.2f}%",
@@ -348,6 +970,62 @@ class MemoryManager:
             'Total Intercambios (Swaps)': self.total_swaps,
             'Algoritmo de Reemplazo': self.replacement_algorithm.algorithm_type
         }
+        stats.update(self.replacement_algorithm.get_statistics())
+        direct_ratio = self.direct_reclaims / self.total_page_faults * 100 if self.total_page_faults else 0.0
+        stats['Fallos con Reclamo Directo'] = f"{self.direct_reclaims} ({direct_ratio:.1f}%)"
+        stats.update(self.latency_model.get_statistics())
+        if self.demand_paging:
+            stats['Asignaciones por Primer Acceso'] = self.first_touch_faults
+            stats['Páginas Reservadas sin Marco'] = self._count_reserved_pages()
+        stats.update(self._get_cow_statistics())
+        if self.groups is not None:
+            stats.update(self.groups.get_statistics())
+        if self.deduplicator is not None:
+            stats.update(self.deduplicator.get_statistics())
+        if self.pages_per_huge > 1:
+            stats.update(self._get_huge_page_statistics())
+        if self.compressed_pool is not None:
+            stats.update(self.compressed_pool.get_statistics())
+        if self.event_sink is not None:
+            stats.update(self.event_sink.get_statistics())
+        return stats
+
+    #Resume los marcos compartidos por fork y las copias hechas al escribir
+    def _get_cow_statistics(self):
+        shared_frames = 0
+        frames_saved = 0
+        for frame in self.ram_frames + self.swap_frames:
+            if frame.sharers:
+                shared_frames += 1
+                frames_saved += len(frame.sharers)
+
+        return {
+            'Procesos Bifurcados (fork)': self.total_forks,
+            'Marcos Compartidos': shared_frames,
+            'Marcos Ahorrados por COW': frames_saved,
+            'Copias por Escritura': self.cow_copies
+        }
+
+    #Compara entradas de tabla y alcance de la TLB contra la fragmentación interna
+    def _get_huge_page_statistics(self):
+        page_size = self.config.page_size
+        huge_pages = sum(len(p.page_table.huge_regions) for p in self.processes)
+        entries = sum(p.page_table.count_entries() for p in self.processes)
+        base_entries = sum(p.num_pages for p in self.processes)
+        fragmentation = sum(p.num_pages * page_size - p.size for p in self.processes)
+
+        # Cada entrada de la TLB cubre una página base o una enorme (claves negativas)
+        tlb_entries = self.latency_model.tlb.entries
+        huge_entries = sum(1 for _, key in tlb_entries if key < 0)
+        tlb_reach = (len(tlb_entries) - huge_entries) * page_size + huge_entries * page_size * self.pages_per_huge
+
+        return {
+            'Páginas Enormes': huge_pages,
+            'Entradas de Tabla de Páginas': f"{entries} (sin páginas enormes: {base_entries})",
+            'Alcance TLB': f"{tlb_reach} KB",
+            'Fragmentación Interna': f"{fragmentation} KB",
+            'Divisiones de Páginas Enormes': self.huge_splits
+        }
 
     #Obtiene la tabla de páginas de un proceso
     def get_page_table(self, pid):
@@ -387,13 +1065,13 @@ class MemoryManager:
 
         # Obtener el marco en SWAP
         swap_frame_num, _ = process.page_table.get_frame(page_num)
+        self.latency_model.charge(process, self.latency_model.swap_read)
 
-        # Liberar el marco en SWAP
-        self.swap_frames[swap_frame_num].free()
+        # Liberar el marco en SWAP (si es compartido, solo esta referencia)
+        self._release_mapping(self.swap_frames[swap_frame_num], process, page_num)
 
         # Asignar el marco libre en RAM
-        free_frame.allocate(process, page_num)
-        process.page_table.set_page_in_ram(page_num, free_frame.frame_id)
+        self._load_frame(free_frame, process, page_num)
 
         # Actualizar estado del proceso
         self._update_process_state(process)
@@ -0,0 +1,43 @@
+"""
+Módulo de Aleatoriedad Reproducible
+Cada simulación tiene sus propios generadores con semilla, uno por aspecto
+(llegadas, tamaños, accesos, suspensiones, tiempos de vida, acciones y compresión),
+para que la misma semilla produzca exactamente la misma secuencia de eventos
+y que varias simulaciones en un mismo intérprete no se interfieran
+"""
+import random
+
+
+class SimulationRandom:
+    """
+    Conjunto de flujos aleatorios independientes de una simulación
+    Todos los flujos se derivan de una única semilla
+    """
+
+    # Flujos disponibles, uno por aspecto de la simulación
+    STREAMS = ('arrivals', 'sizes', 'accesses', 'suspensions', 'lifetimes', 'actions', 'compression')
+
+    #Inicializa los flujos a partir de una semilla (si no hay, se elige una al azar)
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+
+        for name in self.STREAMS:
+            setattr(self, name, random.Random(f"{seed}:{name}"))
+
+    #Crea un generador nuevo derivado de un flujo, útil para estado por proceso
+    def derive(self, stream):
+        return random.Random(getattr(self, stream).getrandbits(64))
+
+    #Obtiene el estado de todos los flujos
+    def get_state(self):
+        return {name: getattr(self, name).getstate() for name in self.STREAMS}
+
+    #Restaura el estado de todos los flujos
+    def set_state(self, state):
+        for name in self.STREAMS:
+            getattr(self, name).setstate(state[name])
+
+    def __str__(self):
+        return f"Semilla {self.seed}"
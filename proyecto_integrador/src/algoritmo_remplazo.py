@@ -1,8 +1,16 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
 class ReplacementAlgorithm:
     """
     Algoritmo de reemplazo de páginas FIFO
     Selecciona la página que llegó primero a memoria
     Implementa FIFO (First-In, First-Out)
+
+    Es también la base de los demás algoritmos: el gestor de memoria avisa con
+    on_load, on_access, on_evict y on_remove cuando una página entra a un marco
+    de RAM, se accede, se desaloja o se libera sin desalojo (FIFO las ignora)
     """
 
     #Inicializa el algoritmo FIFO
@@ -21,9 +29,547 @@ class ReplacementAlgorithm:
         victim = min(occupied_frames, key=lambda f: f.load_time)
         return victim
 
+    #Una página se cargó en un marco de RAM
+    def on_load(self, frame):
+        pass
+
+    #Acceso a una página que ya estaba en RAM
+    def on_access(self, frame):
+        pass
+
+    #La página del marco se desalojó de RAM
+    def on_evict(self, frame_id):
+        pass
+
+    #El marco se liberó sin desalojo (proceso terminado, fusión, copia por escritura)
+    def on_remove(self, frame_id):
+        pass
+
+    #Estado interno para los puntos de control: (escalares, listas de marcos, listas de páginas)
+    #Las listas de marcos tienen pares (marco, (instante de carga, página)); FIFO no guarda nada
+    def get_state(self):
+        return [], [], []
+
+    #Restaura un estado obtenido con get_state
+    def set_state(self, scalars, frame_lists, page_lists):
+        pass
+
+    #Estadísticas propias del algoritmo
+    def get_statistics(self):
+        return {}
+
     #Retorna el nombre del algoritmo
     def get_algorithm_name(self):
         return self.algorithm_type
 
     def __str__(self):
-        return "Algoritmo de Reemplazo: FIFO"
\ No newline at end of file
+        return f"Algoritmo de Reemplazo: {self.algorithm_type}"
+
+
+class LRUAlgorithm(ReplacementAlgorithm):
+    """
+    LRU: desaloja la página con el acceso más antiguo
+    """
+
+    def __init__(self, num_frames=0):
+        self.algorithm_type = 'LRU'
+
+    def select_victim(self, frames):
+        occupied_frames = [f for f in frames if not f.is_free]
+        if not occupied_frames:
+            return None
+        return min(occupied_frames, key=lambda f: f.last_access)
+
+
+class _TrackedAlgorithm(ReplacementAlgorithm, ABC):
+    """
+    Base de los algoritmos con listas propias de marcos residentes
+    Cada marco se guarda con su instante de carga, así una entrada cuyo marco
+    cambió de contenido sin aviso se reconoce y se descarta al encontrarla
+    """
+
+    def __init__(self, num_frames):
+        self.capacity = max(1, num_frames)
+        self.ghost_hits = 0
+        self.fallbacks = 0
+
+    #Identifica la página de un marco
+    @staticmethod
+    def _key(frame):
+        return (frame.process.pid, frame.page_number)
+
+    #Verifica que una entrada (marco, instante de carga) siga describiendo al marco
+    @staticmethod
+    def _valid(frames, frame_id, stamp):
+        frame = frames[frame_id]
+        return not frame.is_free and frame.load_time == stamp
+
+    #Primer marco válido de una lista (la más antigua primero); descarta las entradas obsoletas
+    def _first_valid(self, entries, frames):
+        stale = []
+        victim = None
+        for frame_id, (stamp, _) in entries.items():
+            if self._valid(frames, frame_id, stamp):
+                victim = frames[frame_id]
+                break
+            stale.append(frame_id)
+        for frame_id in stale:
+            self.on_remove(frame_id)
+        return victim
+
+    #Verifica si el algoritmo conoce el contenido actual del marco
+    @abstractmethod
+    def _tracks(self, frame):
+        pass
+
+    #Elige la víctima con las listas del algoritmo (None si no encuentra)
+    @abstractmethod
+    def _choose(self, frames):
+        pass
+
+    #Registra los marcos ocupados que el algoritmo no conoce (por ejemplo tras restaurar un punto de control)
+    def _register_unknown(self, frames):
+        for frame in frames:
+            if not frame.is_free and not self._tracks(frame):
+                self.on_load(frame)
+
+    def select_victim(self, frames):
+        victim = self._choose(frames)
+        if victim is None:
+            self._register_unknown(frames)
+            victim = self._choose(frames)
+        if victim is None:
+            self.fallbacks += 1
+            victim = super().select_victim(frames)
+        return victim
+
+
+class ARCAlgorithm(_TrackedAlgorithm):
+    """
+    ARC (Adaptive Replacement Cache): T1 guarda páginas vistas una vez y T2 las vistas
+    al menos dos veces; B1 y B2 recuerdan las desalojadas de cada una (listas fantasma)
+    El objetivo p para el tamaño de T1 crece con los aciertos en B1 y baja con los de B2
+    """
+
+    def __init__(self, num_frames):
+        super().__init__(num_frames)
+        self.algorithm_type = 'ARC'
+        self.p = 0.0
+        self.t1 = OrderedDict()     # marco -> (instante de carga, página)
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()     # página -> None
+        self.b2 = OrderedDict()
+
+        # Recorrido del parámetro adaptativo
+        self.p_min = 0.0
+        self.p_max = 0.0
+        self.p_moved = 0.0
+
+    def _tracks(self, frame):
+        entry = self.t1.get(frame.frame_id) or self.t2.get(frame.frame_id)
+        return entry is not None and entry[0] == frame.load_time
+
+    #Mueve el objetivo de T1 y acumula su recorrido
+    def _set_p(self, value):
+        self.p_moved += abs(value - self.p)
+        self.p = value
+        self.p_min = min(self.p_min, value)
+        self.p_max = max(self.p_max, value)
+
+    #Mantiene el directorio de ARC dentro de c y 2c entradas
+    def _trim_ghosts(self):
+        c = self.capacity
+        while self.b1 and len(self.t1) + len(self.b1) > c:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * c:
+            self.b2.popitem(last=False)
+
+    def on_load(self, frame):
+        frame_id = frame.frame_id
+        self.on_remove(frame_id)
+        key = self._key(frame)
+        entry = (frame.load_time, key)
+
+        if key in self.b1:
+            self.ghost_hits += 1
+            self._set_p(min(self.capacity, self.p + max(len(self.b2) / len(self.b1), 1)))
+            del self.b1[key]
+            self.t2[frame_id] = entry
+        elif key in self.b2:
+            self.ghost_hits += 1
+            self._set_p(max(0.0, self.p - max(len(self.b1) / len(self.b2), 1)))
+            del self.b2[key]
+            self.t2[frame_id] = entry
+        else:
+            self.t1[frame_id] = entry
+
+        self._trim_ghosts()
+
+    def on_access(self, frame):
+        frame_id = frame.frame_id
+        if not self._tracks(frame):
+            self.on_load(frame)
+        elif frame_id in self.t1:
+            self.t2[frame_id] = self.t1.pop(frame_id)
+        else:
+            self.t2.move_to_end(frame_id)
+
+    def _choose(self, frames):
+        lists = (self.t1, self.t2) if self.t1 and len(self.t1) > self.p else (self.t2, self.t1)
+        for entries in lists:
+            victim = self._first_valid(entries, frames)
+            if victim is not None:
+                return victim
+        return None
+
+    def on_evict(self, frame_id):
+        if frame_id in self.t1:
+            _, key = self.t1.pop(frame_id)
+            self.b1[key] = None
+        elif frame_id in self.t2:
+            _, key = self.t2.pop(frame_id)
+            self.b2[key] = None
+        self._trim_ghosts()
+
+    def on_remove(self, frame_id):
+        self.t1.pop(frame_id, None)
+        self.t2.pop(frame_id, None)
+
+    def get_state(self):
+        scalars = [self.ghost_hits, self.fallbacks, self.p, self.p_min, self.p_max, self.p_moved]
+        return scalars, [list(self.t1.items()), list(self.t2.items())], [list(self.b1), list(self.b2)]
+
+    def set_state(self, scalars, frame_lists, page_lists):
+        ghost_hits, fallbacks, self.p, self.p_min, self.p_max, self.p_moved = scalars
+        self.ghost_hits, self.fallbacks = int(ghost_hits), int(fallbacks)
+        self.t1, self.t2 = (OrderedDict(entries) for entries in frame_lists)
+        self.b1, self.b2 = (OrderedDict.fromkeys(keys) for keys in page_lists)
+
+    def get_statistics(self):
+        return {
+            'ARC p (objetivo de T1)': f"{self.p:.1f} de {self.capacity}",
+            'ARC p (mín–máx)': f"{self.p_min:.1f}–{self.p_max:.1f}",
+            'ARC Recorrido de p': f"{self.p_moved:.1f}",
+            'Aciertos en Listas Fantasma': self.ghost_hits
+        }
+
+
+class TwoQueueAlgorithm(_TrackedAlgorithm):
+    """
+    2Q: las páginas nuevas entran a A1in (FIFO); al desalojarse pasan a A1out (fantasma)
+    Una página que vuelve mientras está en A1out entra a Am (LRU), la cola de las calientes
+    Un recorrido secuencial solo pasa por A1in y no desplaza a Am
+    """
+
+    def __init__(self, num_frames, kin=0.25, kout=0.5):
+        super().__init__(num_frames)
+        self.algorithm_type = '2Q'
+        self.kin = max(1, int(self.capacity * kin))
+        self.kout = max(1, int(self.capacity * kout))
+        self.a1in = OrderedDict()   # marco -> (instante de carga, página)
+        self.am = OrderedDict()
+        self.a1out = OrderedDict()  # página -> None
+
+        # 2Q no es adaptativo: se reporta cuánto varía la ocupación de A1in
+        self.promotions = 0
+        self.a1in_min = None
+        self.a1in_max = 0
+
+    def _tracks(self, frame):
+        entry = self.a1in.get(frame.frame_id) or self.am.get(frame.frame_id)
+        return entry is not None and entry[0] == frame.load_time
+
+    def on_load(self, frame):
+        frame_id = frame.frame_id
+        self.on_remove(frame_id)
+        key = self._key(frame)
+        entry = (frame.load_time, key)
+
+        if key in self.a1out:
+            self.ghost_hits += 1
+            self.promotions += 1
+            del self.a1out[key]
+            self.am[frame_id] = entry
+        else:
+            self.a1in[frame_id] = entry
+
+        size = len(self.a1in)
+        self.a1in_max = max(self.a1in_max, size)
+
+    def on_access(self, frame):
+        frame_id = frame.frame_id
+        if not self._tracks(frame):
+            self.on_load(frame)
+        elif frame_id in self.am:
+            self.am.move_to_end(frame_id)
+        # Los accesos repetidos mientras está en A1in se consideran correlacionados
+
+    def _choose(self, frames):
+        size = len(self.a1in)
+        self.a1in_min = size if self.a1in_min is None else min(self.a1in_min, size)
+        lists = (self.a1in, self.am) if size > self.kin or not self.am else (self.am, self.a1in)
+        for entries in lists:
+            victim = self._first_valid(entries, frames)
+            if victim is not None:
+                return victim
+        return None
+
+    def on_evict(self, frame_id):
+        if frame_id in self.a1in:
+            _, key = self.a1in.pop(frame_id)
+            self.a1out[key] = None
+            while len(self.a1out) > self.kout:
+                self.a1out.popitem(last=False)
+        else:
+            self.am.pop(frame_id, None)
+
+    def on_remove(self, frame_id):
+        self.a1in.pop(frame_id, None)
+        self.am.pop(frame_id, None)
+
+    def get_state(self):
+        a1in_min = -1 if self.a1in_min is None else self.a1in_min
+        scalars = [self.ghost_hits, self.fallbacks, self.promotions, a1in_min, self.a1in_max]
+        return scalars, [list(self.a1in.items()), list(self.am.items())], [list(self.a1out)]
+
+    def set_state(self, scalars, frame_lists, page_lists):
+        ghost_hits, fallbacks, promotions, a1in_min, a1in_max = (int(value) for value in scalars)
+        self.ghost_hits, self.fallbacks, self.promotions = ghost_hits, fallbacks, promotions
+        self.a1in_min = None if a1in_min < 0 else a1in_min
+        self.a1in_max = a1in_max
+        self.a1in, self.am = (OrderedDict(entries) for entries in frame_lists)
+        self.a1out = OrderedDict.fromkeys(page_lists[0])
+
+    def get_statistics(self):
+        return {
+            '2Q Kin / Kout': f"{self.kin} / {self.kout}",
+            '2Q A1in (mín–máx)': f"{self.a1in_min or 0}–{self.a1in_max}",
+            '2Q Promociones a Am': self.promotions,
+            'Aciertos en Listas Fantasma': self.ghost_hits
+        }
+
+
+class LIRSAlgorithm(_TrackedAlgorithm):
+    """
+    LIRS (Low Inter-reference Recency Set): las páginas con distancia corta entre
+    referencias (LIR) quedan protegidas; se desalojan las HIR residentes en orden FIFO
+    La pila S guarda la recencia de LIR y HIR (incluidas HIR ya desalojadas); una HIR
+    que vuelve mientras sigue en S pasa a LIR y la LIR más antigua baja a HIR
+    """
+
+    LIR = 'LIR'
+    HIR = 'HIR'
+
+    def __init__(self, num_frames, hir_fraction=0.1):
+        super().__init__(num_frames)
+        self.algorithm_type = 'LIRS'
+        self.hir_slots = max(1, int(self.capacity * hir_fraction))
+        self.lir_limit = max(1, self.capacity - self.hir_slots)
+
+        self.stack = OrderedDict()      # página -> None, la más reciente al final
+        self.status = {}                # página -> LIR o HIR
+        self.lir = OrderedDict()        # páginas LIR en el orden de la pila, la más antigua primero
+        self.ghosts = OrderedDict()     # HIR no residentes que siguen en la pila, en orden de desalojo
+        self.queue = OrderedDict()      # marco -> (instante de carga, página) de las HIR residentes
+        self.resident = {}              # marco -> (instante de carga, página)
+        self.frame_of = {}              # página -> marco
+
+        # Cambios de estado entre LIR y HIR
+        self.promotions = 0
+        self.demotions = 0
+
+    def _tracks(self, frame):
+        entry = self.resident.get(frame.frame_id)
+        return entry is not None and entry[0] == frame.load_time
+
+    #Marca una página como LIR, la más reciente del conjunto
+    def _make_lir(self, key):
+        self.status[key] = self.LIR
+        self.lir[key] = None
+        self.lir.move_to_end(key)
+
+    #Quita de la base de la pila las HIR hasta que quede una LIR
+    def _prune(self):
+        stack = self.stack
+        while stack:
+            key = next(iter(stack))
+            if self.status.get(key) == self.LIR:
+                return
+            del stack[key]
+            self.ghosts.pop(key, None)
+            if key not in self.frame_of:
+                self.status.pop(key, None)
+
+    #La LIR más antigua pasa a HIR residente
+    def _demote_bottom(self):
+        if not self.lir:
+            return
+        key, _ = self.lir.popitem(last=False)
+        self.stack.pop(key, None)
+        self.status[key] = self.HIR
+        self.demotions += 1
+        frame_id = self.frame_of.get(key)
+        if frame_id is not None:
+            self.queue[frame_id] = self.resident[frame_id]
+        self._prune()
+
+    #Acota las HIR no residentes que recuerda la pila, olvidando primero las desalojadas hace más tiempo
+    def _trim_stack(self):
+        limit = 3 * self.capacity
+        while len(self.stack) > limit and self.ghosts:
+            key, _ = self.ghosts.popitem(last=False)
+            if key in self.stack and key not in self.frame_of and self.status.get(key) == self.HIR:
+                del self.stack[key]
+                del self.status[key]
+
+    def on_load(self, frame):
+        frame_id = frame.frame_id
+        self.on_remove(frame_id)
+        key = self._key(frame)
+        entry = (frame.load_time, key)
+        self.resident[frame_id] = entry
+        self.frame_of[key] = frame_id
+        self.ghosts.pop(key, None)
+
+        if len(self.lir) < self.lir_limit and self.status.get(key) != self.HIR:
+            # Calentamiento: las primeras páginas llenan el conjunto LIR
+            self._make_lir(key)
+        elif key in self.stack:
+            # HIR no residente con distancia corta: pasa a LIR
+            self.ghost_hits += 1
+            self.promotions += 1
+            self._make_lir(key)
+            self.stack.move_to_end(key)
+            self._demote_bottom()
+            return
+        else:
+            self.status[key] = self.HIR
+            self.queue[frame_id] = entry
+
+        self.stack[key] = None
+        self.stack.move_to_end(key)
+        self._trim_stack()
+
+    def on_access(self, frame):
+        frame_id = frame.frame_id
+        if not self._tracks(frame):
+            self.on_load(frame)
+            return
+
+        key = self.resident[frame_id][1]
+        if self.status.get(key) == self.LIR:
+            at_bottom = next(iter(self.stack), None) == key
+            self.stack.move_to_end(key)
+            self.lir.move_to_end(key)
+            if at_bottom:
+                self._prune()
+        elif key in self.stack:
+            self.promotions += 1
+            self._make_lir(key)
+            self.queue.pop(frame_id, None)
+            self.stack.move_to_end(key)
+            self._demote_bottom()
+        else:
+            self.stack[key] = None
+            self.queue[frame_id] = self.resident[frame_id]
+            self.queue.move_to_end(frame_id)
+            self._trim_stack()
+
+    def _choose(self, frames):
+        victim = self._first_valid(self.queue, frames)
+        if victim is not None:
+            return victim
+
+        # Sin HIR residentes: se desaloja la LIR más antigua
+        stale = []
+        for key in self.lir:
+            frame_id = self.frame_of.get(key)
+            if frame_id is None:
+                continue
+            stamp, _ = self.resident[frame_id]
+            if self._valid(frames, frame_id, stamp):
+                victim = frames[frame_id]
+                break
+            stale.append(frame_id)
+        for frame_id in stale:
+            self.on_remove(frame_id)
+        return victim
+
+    def on_evict(self, frame_id):
+        entry = self.resident.pop(frame_id, None)
+        if entry is None:
+            return
+        key = entry[1]
+        self.frame_of.pop(key, None)
+
+        if self.queue.pop(frame_id, None) is not None:
+            # HIR desalojada: sigue en la pila como no residente si estaba en ella
+            if key in self.stack:
+                self.ghosts[key] = None
+            else:
+                self.status.pop(key, None)
+        elif self.status.get(key) == self.LIR:
+            self.status.pop(key)
+            self.lir.pop(key, None)
+            self.stack.pop(key, None)
+            self._prune()
+
+    def on_remove(self, frame_id):
+        entry = self.resident.pop(frame_id, None)
+        if entry is None:
+            return
+        key = entry[1]
+        self.frame_of.pop(key, None)
+        self.queue.pop(frame_id, None)
+        if self.status.pop(key, None) == self.LIR:
+            self.lir.pop(key, None)
+        self.stack.pop(key, None)
+        self._prune()
+
+    def get_state(self):
+        scalars = [self.ghost_hits, self.fallbacks, self.promotions, self.demotions]
+        hir = [key for key, status in self.status.items() if status == self.HIR]
+        # frame_of se guarda tal cual: tras un copy-on-write puede no coincidir con las claves de resident
+        frame_of = [(frame_id, (0.0, key)) for key, frame_id in self.frame_of.items()]
+        return (scalars, [list(self.queue.items()), list(self.resident.items()), frame_of],
+                [list(self.stack), list(self.lir), hir, list(self.ghosts)])
+
+    def set_state(self, scalars, frame_lists, page_lists):
+        self.ghost_hits, self.fallbacks, self.promotions, self.demotions = (int(value) for value in scalars)
+        self.queue = OrderedDict(frame_lists[0])
+        self.resident = dict(frame_lists[1])
+        self.frame_of = {key: frame_id for frame_id, (_, key) in frame_lists[2]}
+        stack, lir, hir, ghosts = page_lists
+        self.stack = OrderedDict.fromkeys(stack)
+        self.lir = OrderedDict.fromkeys(lir)
+        self.ghosts = OrderedDict.fromkeys(ghosts)
+        self.status = dict.fromkeys(lir, self.LIR)
+        self.status.update(dict.fromkeys(hir, self.HIR))
+
+    def get_statistics(self):
+        return {
+            'LIRS LIR / HIR': f"{self.lir_limit} / {self.hir_slots}",
+            'LIRS Promociones a LIR': self.promotions,
+            'LIRS Degradaciones a HIR': self.demotions,
+            'Aciertos en Listas Fantasma': self.ghost_hits
+        }
+
+
+# Algoritmos disponibles por nombre
+ALGORITHMS = {
+    'FIFO': ReplacementAlgorithm,
+    'LRU': LRUAlgorithm,
+    'ARC': ARCAlgorithm,
+    '2Q': TwoQueueAlgorithm,
+    'LIRS': LIRSAlgorithm,
+}
+
+
+#Crea el algoritmo de reemplazo por nombre para una RAM de num_frames marcos
+def create_replacement_algorithm(name, num_frames):
+    name = name.upper()
+    if name not in ALGORITHMS:
+        raise ValueError(f"Algoritmo de reemplazo desconocido: {name}")
+    if name == 'FIFO':
+        return ReplacementAlgorithm()
+    return ALGORITHMS[name](num_frames)
@@ -0,0 +1,502 @@
+"""
+Módulo de Asignación Física Contigua
+Motores de asignación de memoria física sobre los mismos marcos de RAM que usa
+la paginación, para estudiar fragmentación y velocidad de asignación:
+- BuddyAllocator: sistema de compañeros (buddy) con bloques de 2^k marcos,
+  división y fusión en O(log n)
+- SlabAllocator: cachés por clase de tamaño para objetos pequeños, con slabs
+  pedidos al buddy
+
+Los motores parten de los marcos libres de la lista que reciben y llevan su
+propio estado (no modifican los Frame), así se pueden comparar contra la
+paginación con la misma RAM. benchmark_allocators corre la misma carga con
+cada motor y con el camino de paginación (crear y terminar procesos)
+"""
+import copy
+import heapq
+import math
+import random
+import time
+from bisect import bisect_left
+
+# Marcos de RAM a partir de los cuales la comparación es representativa
+MIN_REPRESENTATIVE_FRAMES = 128
+
+
+#Orden del bloque buddy más chico con al menos count marcos
+def order_for(count):
+    return (count - 1).bit_length()
+
+
+#Fragmentación externa: fracción de la memoria libre que no está en el bloque contiguo más grande
+def external_fragmentation(largest_block, free_frames):
+    return 1.0 - largest_block / free_frames if free_frames else 0.0
+
+
+#Marcos libres y tramo libre contiguo más largo de una lista de marcos
+def free_runs(frames):
+    free = 0
+    largest = 0
+    run = 0
+    for frame in frames:
+        if frame.is_free:
+            free += 1
+            run += 1
+            largest = max(largest, run)
+        else:
+            run = 0
+    return free, largest
+
+
+class BuddyAllocator:
+    """
+    Sistema de compañeros: listas libres por orden (conjunto para buscar el compañero
+    en O(1) y montículo para entregar primero la dirección más baja)
+    """
+
+    def __init__(self, frames, page_size=1):
+        """
+        Inicializa el buddy con los marcos libres de la lista
+
+        Args:
+            frames (list): Marcos de RAM (por ejemplo memory_manager.ram_frames)
+            page_size (int): Tamaño de página (KB), unidad de la fragmentación interna
+                             (con 1 se mide en marcos)
+        """
+        self.frames = frames
+        self.page_size = page_size
+        self.num_frames = len(frames)
+        self.max_order = max(0, self.num_frames.bit_length() - 1)
+
+        self.free_blocks = [set() for _ in range(self.max_order + 1)]
+        self.free_heaps = [[] for _ in range(self.max_order + 1)]
+        self.allocated = {}         # inicio del bloque -> (orden, KB pedidos)
+        self.free_frames = 0
+        self.allocated_frames = 0
+        self.requested_kb = 0
+
+        # Estadísticas
+        self.allocations = 0
+        self.frees = 0
+        self.failures = 0
+        self.splits = 0
+        self.merges = 0
+
+        # Los tramos de marcos libres se cubren con los bloques alineados más grandes posibles
+        start = None
+        for index, frame in enumerate(frames):
+            if frame.is_free and start is None:
+                start = index
+            elif not frame.is_free and start is not None:
+                self._add_run(start, index)
+                start = None
+        if start is not None:
+            self._add_run(start, self.num_frames)
+
+    #Agrega como libres los marcos [start, end) en bloques alineados
+    def _add_run(self, start, end):
+        while start < end:
+            order = min(self.max_order, (start & -start).bit_length() - 1 if start else self.max_order)
+            while start + (1 << order) > end:
+                order -= 1
+            self._push(start, order)
+            self.free_frames += 1 << order
+            start += 1 << order
+
+    def _push(self, start, order):
+        self.free_blocks[order].add(start)
+        heapq.heappush(self.free_heaps[order], start)
+
+    #Saca el bloque libre de menor dirección de un orden (las entradas viejas del montículo se descartan)
+    def _pop(self, order):
+        heap = self.free_heaps[order]
+        blocks = self.free_blocks[order]
+        while heap:
+            start = heapq.heappop(heap)
+            if start in blocks:
+                blocks.remove(start)
+                return start
+        return None
+
+    #Asigna un bloque contiguo de al menos count marcos; retorna su primer marco o None
+    #kb son los KB pedidos realmente (por defecto count marcos completos)
+    def allocate(self, count, kb=None):
+        if count <= 0:
+            raise ValueError("Se debe pedir al menos un marco")
+        if kb is None:
+            kb = count * self.page_size
+
+        order = order_for(count)
+        available = next((o for o in range(order, self.max_order + 1) if self.free_blocks[o]), None)
+        if available is None:
+            self.failures += 1
+            return None
+
+        start = self._pop(available)
+        while available > order:
+            available -= 1
+            self._push(start + (1 << available), available)
+            self.splits += 1
+
+        self.allocated[start] = (order, kb)
+        self.free_frames -= 1 << order
+        self.allocated_frames += 1 << order
+        self.requested_kb += kb
+        self.allocations += 1
+        return start
+
+    #Libera un bloque y lo fusiona con su compañero mientras esté libre
+    def free(self, start):
+        if start not in self.allocated:
+            raise ValueError(f"El marco {start} no es el inicio de un bloque asignado")
+
+        order, kb = self.allocated.pop(start)
+        self.free_frames += 1 << order
+        self.allocated_frames -= 1 << order
+        self.requested_kb -= kb
+        self.frees += 1
+
+        while order < self.max_order:
+            buddy = start ^ (1 << order)
+            if buddy not in self.free_blocks[order]:
+                break
+            self.free_blocks[order].remove(buddy)
+            start = min(start, buddy)
+            order += 1
+            self.merges += 1
+
+        self._push(start, order)
+
+    #Marcos de un bloque asignado
+    def frames_of(self, start):
+        order, _ = self.allocated[start]
+        return self.frames[start:start + (1 << order)]
+
+    #Tamaño en marcos del bloque libre más grande
+    def largest_free_block(self):
+        for order in range(self.max_order, -1, -1):
+            if self.free_blocks[order]:
+                return 1 << order
+        return 0
+
+    def external_fragmentation(self):
+        return external_fragmentation(self.largest_free_block(), self.free_frames)
+
+    #Fracción de la memoria asignada (KB) que no se pidió: resto de la última página y redondeo a potencias de dos
+    def internal_fragmentation(self):
+        used = self.allocated_frames * self.page_size
+        return 1.0 - self.requested_kb / used if used else 0.0
+
+    def get_statistics(self):
+        return {
+            'Buddy Bloques Asignados': len(self.allocated),
+            'Buddy Bloque Libre Mayor': f"{self.largest_free_block()} marcos",
+            'Buddy Fragmentación Externa': f"{self.external_fragmentation() * 100:.1f}%",
+            'Buddy Fragmentación Interna': f"{self.internal_fragmentation() * 100:.1f}%",
+            'Buddy Divisiones / Fusiones': f"{self.splits} / {self.merges}",
+            'Buddy Asignaciones Fallidas': self.failures
+        }
+
+
+class SlabCache:
+    """
+    Caché de una clase de tamaño: slabs parcialmente ocupados, llenos y a lo sumo uno vacío
+    """
+
+    def __init__(self, object_kb, slab_frames, page_size):
+        self.object_kb = object_kb
+        self.slab_frames = slab_frames
+        self.objects_per_slab = slab_frames * page_size // object_kb
+
+        self.slabs = {}         # inicio del slab -> índices de objetos libres
+        self.partial = {}       # slabs con objetos libres y ocupados (mismo índice de libres)
+        self.empty = []         # slab vacío que se conserva para no volver al buddy
+        self.in_use = 0
+
+
+class SlabAllocator:
+    """
+    Asignador slab: cada objeto va a la clase de tamaño (potencia de dos) que lo contiene;
+    cada clase toma slabs del buddy y los devuelve cuando quedan vacíos
+    """
+
+    # Objetos por slab como mínimo (define cuántos marcos ocupa el slab de cada clase)
+    MIN_OBJECTS_PER_SLAB = 8
+
+    def __init__(self, buddy, page_size, min_object_kb=8, max_object_kb=None):
+        """
+        Inicializa las cachés por clase de tamaño
+
+        Args:
+            buddy (BuddyAllocator): Buddy del que se piden los slabs
+            page_size (int): Tamaño de página (KB)
+            min_object_kb (int): Clase de tamaño más chica (KB)
+            max_object_kb (int): Clase de tamaño más grande (KB, por defecto page_size)
+        """
+        self.buddy = buddy
+        self.page_size = page_size
+        max_object_kb = max_object_kb or page_size
+
+        self.sizes = []
+        size = min_object_kb
+        while size < max_object_kb:
+            self.sizes.append(size)
+            size *= 2
+        self.sizes.append(max_object_kb)
+
+        self.caches = []
+        for size in self.sizes:
+            # En una RAM chica el slab se limita al bloque más grande del buddy
+            order = min(order_for(math.ceil(self.MIN_OBJECTS_PER_SLAB * size / page_size)), buddy.max_order)
+            slab_frames = 1 << order
+            self.caches.append(SlabCache(size, slab_frames, page_size))
+
+        self.requested = {}     # (clase, slab, objeto) -> KB pedidos
+
+        # Estadísticas
+        self.allocations = 0
+        self.frees = 0
+        self.failures = 0
+        self.slabs_created = 0
+        self.slabs_released = 0
+
+    #Asigna un objeto de kb KB; retorna su identificador (clase, slab, objeto) o None
+    def allocate(self, kb):
+        index = bisect_left(self.sizes, kb)
+        if kb <= 0 or index == len(self.sizes):
+            raise ValueError(f"Tamaño de objeto fuera de las clases del slab: {kb} KB")
+
+        cache = self.caches[index]
+        if cache.partial:
+            slab = next(iter(cache.partial))
+        elif cache.empty:
+            slab = cache.empty.pop()
+            cache.partial[slab] = cache.slabs[slab]
+        else:
+            slab = self.buddy.allocate(cache.slab_frames)
+            if slab is None and self.shrink():
+                slab = self.buddy.allocate(cache.slab_frames)
+            if slab is None:
+                self.failures += 1
+                return None
+            free_objects = list(range(cache.objects_per_slab - 1, -1, -1))
+            cache.slabs[slab] = free_objects
+            cache.partial[slab] = free_objects
+            self.slabs_created += 1
+
+        free_objects = cache.partial[slab]
+        obj = free_objects.pop()
+        if not free_objects:
+            del cache.partial[slab]
+
+        handle = (index, slab, obj)
+        self.requested[handle] = kb
+        cache.in_use += 1
+        self.allocations += 1
+        return handle
+
+    #Libera un objeto; un slab que queda vacío se conserva si la clase no tiene otro vacío, si no vuelve al buddy
+    def free(self, handle):
+        if handle not in self.requested:
+            raise ValueError(f"Objeto no asignado: {handle}")
+
+        del self.requested[handle]
+        index, slab, obj = handle
+        cache = self.caches[index]
+        free_objects = cache.slabs[slab]
+        free_objects.append(obj)
+        cache.in_use -= 1
+        self.frees += 1
+
+        if len(free_objects) == 1:
+            cache.partial[slab] = free_objects
+        if len(free_objects) == cache.objects_per_slab:
+            del cache.partial[slab]
+            if cache.empty:
+                del cache.slabs[slab]
+                self.buddy.free(slab)
+                self.slabs_released += 1
+            else:
+                cache.empty.append(slab)
+
+    #Devuelve al buddy los slabs vacíos que conservan las clases; retorna cuántos liberó
+    def shrink(self):
+        released = 0
+        for cache in self.caches:
+            while cache.empty:
+                slab = cache.empty.pop()
+                del cache.slabs[slab]
+                self.buddy.free(slab)
+                released += 1
+        self.slabs_released += released
+        return released
+
+    #KB ocupados por los slabs de todas las clases
+    def slab_kb(self):
+        return sum(len(cache.slabs) * cache.slab_frames * self.page_size for cache in self.caches)
+
+    #Fracción de la memoria de los slabs que no se pidió (redondeo de clase, objetos libres y cola del slab)
+    def internal_fragmentation(self):
+        total = self.slab_kb()
+        return 1.0 - sum(self.requested.values()) / total if total else 0.0
+
+    def external_fragmentation(self):
+        return self.buddy.external_fragmentation()
+
+    def get_statistics(self):
+        return {
+            'Slab Clases de Tamaño': ", ".join(f"{size} KB" for size in self.sizes),
+            'Slab Objetos en Uso': len(self.requested),
+            'Slab Memoria en Slabs': f"{self.slab_kb()} KB",
+            'Slab Fragmentación Interna': f"{self.internal_fragmentation() * 100:.1f}%",
+            'Slab Slabs Creados / Liberados': f"{self.slabs_created} / {self.slabs_released}",
+            'Slab Asignaciones Fallidas': self.failures
+        }
+
+
+#Bloque más grande por omisión: 1/16 de la RAM, pero al menos 4 marcos (sin pasar de media RAM)
+#para que también una RAM chica tenga bloques de varios marcos que dividir y fusionar
+def default_max_block(num_frames):
+    return max(1, min(num_frames // 2, max(4, num_frames // 16)))
+
+
+#Genera una carga de asignaciones y liberaciones: ('alloc', id, KB) o ('free', id)
+#bloques: tamaños de 1 a max_block marcos; objetos: tamaños menores a una página
+#Se mantiene ocupada a lo sumo la fracción occupancy de la RAM contando una página por objeto
+def generate_workload(kind, num_frames, page_size, operations, seed=0, occupancy=0.5, max_block=None):
+    rng = random.Random(seed)
+    max_block = max_block or default_max_block(num_frames)
+    target = max(1, int(num_frames * occupancy))
+
+    ops = []
+    live = []
+    live_frames = 0
+    next_id = 0
+    for _ in range(operations):
+        if live and (live_frames >= target or rng.random() < 0.45):
+            position = rng.randrange(len(live))
+            block_id, frames = live[position]
+            live[position] = live[-1]
+            live.pop()
+            live_frames -= frames
+            ops.append(('free', block_id))
+            continue
+
+        if kind == 'bloques':
+            order = rng.randint(0, order_for(max_block))
+            frames = min(max_block, rng.randint((1 << order) // 2 + 1, 1 << order))
+            kb = rng.randint((frames - 1) * page_size + 1, frames * page_size)
+        else:
+            frames = 1
+            kb = max(1, int(rng.lognormvariate(math.log(page_size / 8), 0.8)))
+            kb = min(kb, page_size)
+
+        if live_frames + frames > target:
+            continue
+        ops.append(('alloc', next_id, kb))
+        live.append((next_id, frames))
+        live_frames += frames
+        next_id += 1
+
+    return ops
+
+
+#Corre una carga con un motor; sample(engine) mide la fragmentación cada cierto número de operaciones
+#Retorna (segundos, operaciones, fallidas, fragmentación externa media, fragmentación interna media)
+def _run(ops, allocate, free, sample, samples=50):
+    handles = {}
+    failures = 0
+    elapsed = 0.0
+    external = []
+    internal = []
+    chunk = max(1, len(ops) // samples)
+
+    for first in range(0, len(ops), chunk):
+        start = time.perf_counter()
+        for op in ops[first:first + chunk]:
+            if op[0] == 'alloc':
+                handle = allocate(op[2])
+                if handle is None:
+                    failures += 1
+                else:
+                    handles[op[1]] = handle
+            elif op[1] in handles:
+                free(handles.pop(op[1]))
+        elapsed += time.perf_counter() - start
+
+        ext, inner = sample()
+        external.append(ext)
+        internal.append(inner)
+
+    mean = lambda values: sum(values) / len(values) if values else 0.0
+    return elapsed, len(ops), failures, mean(external), mean(internal)
+
+
+#Mide los motores contra el camino de paginación (create_process / terminate_process) con la misma RAM
+#La fragmentación interna de todos los motores se mide en KB: pedidos contra asignados
+#Retorna una fila de resultados por carga y motor
+def benchmark_allocators(config, operations=20000, seed=0):
+    # Import diferido: el gestor de memoria no depende de este módulo
+    from administrador_memoria import MemoryManager
+    from aleatorio import SimulationRandom
+
+    page_size = config.page_size
+
+    # La paginación se mide sin registro en disco ni grupos para no agregar E/S ajena
+    paging_config = copy.copy(config)
+    paging_config.event_log_enabled = False
+    paging_config.groups_enabled = False
+    paging_config.demand_paging = False
+
+    rows = []
+    for kind in ('bloques', 'objetos'):
+        ops = generate_workload(kind, config.ram_frames, page_size, operations, seed)
+
+        manager = MemoryManager(paging_config, SimulationRandom(seed))
+        buddy = BuddyAllocator(manager.ram_frames, page_size)
+
+        if kind == 'bloques':
+            engine = 'buddy'
+            result = _run(ops,
+                          lambda kb: buddy.allocate(math.ceil(kb / page_size), kb),
+                          buddy.free,
+                          lambda: (buddy.external_fragmentation(), buddy.internal_fragmentation()))
+        else:
+            engine = 'slab'
+            slab = SlabAllocator(buddy, page_size)
+            result = _run(ops, slab.allocate, slab.free,
+                          lambda: (slab.external_fragmentation(), slab.internal_fragmentation()))
+        rows.append(_row(kind, engine, result))
+
+        # Camino de paginación: cada asignación es un proceso de ese tamaño
+        def allocate(kb):
+            success, _, process = manager.create_process("Bench", kb)
+            return process.pid if success else None
+
+        def free(pid):
+            manager.terminate_process(pid)
+
+        def sample():
+            free_frames, largest = free_runs(manager.ram_frames)
+            requested = sum(process.size for process in manager.processes)
+            allocated = sum(process.num_pages for process in manager.processes) * page_size
+            return (external_fragmentation(largest, free_frames),
+                    1.0 - requested / allocated if allocated else 0.0)
+
+        rows.append(_row(kind, 'paginación', _run(ops, allocate, free, sample)))
+
+    return rows
+
+
+#Fila de resultados de un motor
+def _row(kind, engine, result):
+    elapsed, operations, failures, external, internal = result
+    return {
+        'Carga': kind,
+        'Motor': engine,
+        'Operaciones': operations,
+        'Operaciones/s': round(operations / elapsed) if elapsed > 0 else 0,
+        'Fallidas': failures,
+        'Fragmentación Externa': round(external, 4),
+        'Fragmentación Interna': round(internal, 4)
+    }
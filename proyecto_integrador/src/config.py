@@ -24,9 +24,101 @@ class Config:
         self.ram_size = int(self.config.get('Memory', 'ram_size', fallback=2048))
         self.swap_size = int(self.config.get('Memory', 'swap_size', fallback=4096))
         self.page_size = int(self.config.get('Memory', 'page_size', fallback=256))
+
+        # Páginas enormes (0 = deshabilitadas) y llenado mínimo para completar la última
+        self.huge_page_size = int(self.config.get('Memory', 'huge_page_size', fallback=0))
+        self.huge_page_min_fill = float(self.config.get('Memory', 'huge_page_min_fill', fallback=0.5))
         
         # Leer parámetros del sistema
         self.replacement_algorithm = self.config.get('System', 'replacement_algorithm', fallback='FIFO')
+
+        # Paginación bajo demanda: las páginas reciben marco en su primer acceso
+        self.demand_paging = self.config.getboolean('System', 'demand_paging', fallback=False)
+
+        # Semilla de la simulación (vacía = aleatoria en cada ejecución)
+        seed = self.config.get('System', 'seed', fallback='').strip()
+        self.seed = int(seed) if seed else None
+
+        # Planificación de CPU (none = sin planificador, acciones aleatorias)
+        self.cpu_scheduler = self.config.get('CPU', 'scheduler', fallback='none').strip().upper()
+        self.cpu_quantum = float(self.config.get('CPU', 'quantum', fallback=0.1))
+        self.io_latency = float(self.config.get('CPU', 'io_latency', fallback=0.05))
+
+        # Control de carga (planificador de mediano plazo contra la hiperpaginación)
+        self.load_control_enabled = self.config.getboolean('LoadControl', 'enabled', fallback=False)
+        self.load_high_fault_rate = float(self.config.get('LoadControl', 'high_fault_rate', fallback=4.0))
+        self.load_low_fault_rate = float(self.config.get('LoadControl', 'low_fault_rate', fallback=1.5))
+        self.load_min_free_fraction = float(self.config.get('LoadControl', 'min_free_fraction', fallback=0.1))
+        self.load_reactivation_policy = self.config.get('LoadControl', 'reactivation_policy', fallback='prioridad').strip().upper()
+
+        # Reclamo en segundo plano (marcas de agua de marcos libres, como kswapd)
+        self.reclaim_enabled = self.config.getboolean('Reclaim', 'enabled', fallback=False)
+        self.reclaim_low_watermark = float(self.config.get('Reclaim', 'low_watermark', fallback=0.05))
+        self.reclaim_high_watermark = float(self.config.get('Reclaim', 'high_watermark', fallback=0.15))
+        self.reclaim_batch_size = int(self.config.get('Reclaim', 'batch_size', fallback=4))
+
+        # Grupos de procesos con límites de RAM (al estilo cgroups)
+        self.groups_enabled = self.config.getboolean('Groups', 'enabled', fallback=False)
+        self.memory_groups = self._read_groups()
+
+        # Llegadas de procesos: 'acciones' crea procesos como acción aleatoria de cada ciclo;
+        # los demás modelos generan instantes de llegada en tiempo simulado
+        self.arrival_model = self.config.get('Arrivals', 'model', fallback='acciones').strip().lower()
+        self.arrival_rate = float(self.config.get('Arrivals', 'rate', fallback=0.5))
+        self.arrival_burst_rate = float(self.config.get('Arrivals', 'burst_rate', fallback=10.0))
+        self.arrival_mean_quiet = float(self.config.get('Arrivals', 'mean_quiet', fallback=30.0))
+        self.arrival_mean_burst = float(self.config.get('Arrivals', 'mean_burst', fallback=3.0))
+        self.arrival_amplitude = float(self.config.get('Arrivals', 'amplitude', fallback=0.8))
+        self.arrival_period = float(self.config.get('Arrivals', 'period', fallback=600.0))
+        self.arrival_trace_path = self.config.get('Arrivals', 'trace_path', fallback='').strip()
+        self.size_distribution = self.config.get('Arrivals', 'size_distribution', fallback='mixta').strip().lower()
+        self.size_sigma = float(self.config.get('Arrivals', 'size_sigma', fallback=0.6))
+        self.size_alpha = float(self.config.get('Arrivals', 'size_alpha', fallback=1.5))
+
+        # Modelo de latencia de acceso (nanosegundos)
+        self.latency_ram_access = int(self.config.get('Latency', 'ram_access_ns', fallback=100))
+        self.latency_tlb_miss = int(self.config.get('Latency', 'tlb_miss_ns', fallback=80))
+        self.latency_swap_read = int(self.config.get('Latency', 'swap_read_ns', fallback=100000))
+        self.latency_swap_write = int(self.config.get('Latency', 'swap_write_ns', fallback=100000))
+        self.latency_dirty_writeback = int(self.config.get('Latency', 'dirty_writeback_ns', fallback=50000))
+        self.tlb_entries = int(self.config.get('Latency', 'tlb_entries', fallback=64))
+
+        # Pool de memoria comprimida entre RAM y SWAP (sus KB se descuentan de la RAM)
+        self.compressed_pool_enabled = self.config.getboolean('CompressedPool', 'enabled', fallback=False)
+        self.compressed_pool_kb = int(self.config.get('CompressedPool', 'capacity_kb', fallback=256))
+        self.compression_min_ratio = float(self.config.get('CompressedPool', 'min_ratio', fallback=1.5))
+        self.compression_max_ratio = float(self.config.get('CompressedPool', 'max_ratio', fallback=4.0))
+        self.incompressible_fraction = float(self.config.get('CompressedPool', 'incompressible_fraction', fallback=0.1))
+        self.compress_ns = int(self.config.get('CompressedPool', 'compress_ns', fallback=5000))
+        self.decompress_ns = int(self.config.get('CompressedPool', 'decompress_ns', fallback=2000))
+
+        # Deduplicación de páginas idénticas entre procesos (estilo KSM)
+        self.dedup_enabled = self.config.getboolean('Dedup', 'enabled', fallback=False)
+        self.dedup_pages_per_scan = int(self.config.get('Dedup', 'pages_per_scan', fallback=32))
+        self.dedup_library_pages = int(self.config.get('Dedup', 'library_pages', fallback=2))
+        self.dedup_code_fraction = float(self.config.get('Dedup', 'code_fraction', fallback=0.3))
+        self.dedup_scan_ns = int(self.config.get('Dedup', 'scan_ns', fallback=200))
+        self.dedup_merge_ns = int(self.config.get('Dedup', 'merge_ns', fallback=2000))
+
+        # Parámetros de instrumentación de rutas críticas
+        self.instrumentation_enabled = self.config.getboolean('Instrumentation', 'enabled', fallback=False)
+        self.instrumentation_path = self.config.get('Instrumentation', 'export_path', fallback='').strip()
+        self.instrumentation_format = self.config.get('Instrumentation', 'export_format', fallback='prometheus')
+        self.instrumentation_interval = float(self.config.get('Instrumentation', 'export_interval', fallback=10.0))
+
+        # Grabación de la ejecución para reproducirla después
+        self.recording_enabled = self.config.getboolean('Recording', 'enabled', fallback=False)
+        self.recording_keyframe_interval = int(self.config.get('Recording', 'keyframe_interval', fallback=100))
+        self.recording_max_cycles = int(self.config.get('Recording', 'max_cycles', fallback=10000))
+        self.recording_path = self.config.get('Recording', 'path', fallback='').strip()
+
+        # Registro de eventos en disco (escrito por un hilo de fondo)
+        self.event_log_enabled = self.config.getboolean('EventLog', 'enabled', fallback=False)
+        self.event_log_path = self.config.get('EventLog', 'path', fallback='eventos.log').strip()
+        self.event_log_format = self.config.get('EventLog', 'format', fallback='json').strip().lower()
+        self.event_log_max_kb = int(self.config.get('EventLog', 'max_kb', fallback=10240))
+        self.event_log_max_files = int(self.config.get('EventLog', 'max_files', fallback=5))
+        self.event_log_compress = self.config.getboolean('EventLog', 'compress', fallback=False)
         
         # Calcular número de marcos disponibles
         self.ram_frames = self.ram_size // self.page_size
@@ -45,11 +137,109 @@ class Config:
         default_config['Memory'] = {
             'ram_size': '2048',      # KB
             'swap_size': '4096',     # KB
-            'page_size': '256'       # KB
+            'page_size': '256',      # KB
+            'huge_page_size': '0',   # KB, 0 = sin páginas enormes
+            'huge_page_min_fill': '0.5'
         }
         
         default_config['System'] = {
-            'replacement_algorithm': 'FIFO'  # FIFO o LRU
+            'replacement_algorithm': 'FIFO',  # FIFO, LRU, ARC, 2Q o LIRS
+            'seed': '',                       # Vacío = aleatoria
+            'demand_paging': 'false'          # true = asignar marcos en el primer acceso
+        }
+
+        default_config['CPU'] = {
+            'scheduler': 'none',              # none, RR, PRIORIDAD o MLFQ
+            'quantum': '0.1',                 # Segundos
+            'io_latency': '0.05'              # Segundos bloqueado por fallo desde SWAP
+        }
+
+        default_config['Arrivals'] = {
+            'model': 'acciones',              # acciones, uniforme, poisson, rafagas, diurna o traza
+            'rate': '0.5',                    # Llegadas por segundo
+            'burst_rate': '10.0',
+            'mean_quiet': '30.0',
+            'mean_burst': '3.0',
+            'amplitude': '0.8',
+            'period': '600.0',
+            'trace_path': '',
+            'size_distribution': 'mixta',     # mixta, uniforme, lognormal o pareto
+            'size_sigma': '0.6',
+            'size_alpha': '1.5'
+        }
+
+        default_config['LoadControl'] = {
+            'enabled': 'false',
+            'high_fault_rate': '4.0',         # Fallos/s que indican hiperpaginación
+            'low_fault_rate': '1.5',          # Fallos/s para reactivar procesos
+            'min_free_fraction': '0.1',       # Fracción de RAM libre bajo la cual hay presión
+            'reactivation_policy': 'prioridad' # prioridad, fifo o menor
+        }
+
+        default_config['Reclaim'] = {
+            'enabled': 'false',
+            'low_watermark': '0.05',          # Fracción de RAM libre que despierta al reclamador
+            'high_watermark': '0.15',         # Fracción de RAM libre a la que vuelve a dormir
+            'batch_size': '4'                 # Páginas desalojadas por ciclo como máximo
+        }
+
+        default_config['Groups'] = {
+            'enabled': 'false',
+            'bases_datos.members': 'base_datos',   # Nombres o tipos de programa
+            'bases_datos.soft_kb': '1024',
+            'multimedia.members': 'multimedia, juego',
+            'multimedia.hard_kb': '512'
+        }
+
+        default_config['Latency'] = {
+            'ram_access_ns': '100',
+            'tlb_miss_ns': '80',
+            'swap_read_ns': '100000',
+            'swap_write_ns': '100000',
+            'dirty_writeback_ns': '50000',
+            'tlb_entries': '64'
+        }
+
+        default_config['CompressedPool'] = {
+            'enabled': 'false',
+            'capacity_kb': '256',             # KB tomados de la RAM
+            'min_ratio': '1.5',
+            'max_ratio': '4.0',
+            'incompressible_fraction': '0.1', # Páginas que van directo a SWAP
+            'compress_ns': '5000',
+            'decompress_ns': '2000'
+        }
+
+        default_config['Dedup'] = {
+            'enabled': 'false',
+            'pages_per_scan': '32',           # Páginas revisadas por ciclo
+            'library_pages': '2',             # Páginas de bibliotecas comunes
+            'code_fraction': '0.3',           # Fracción de código del programa
+            'scan_ns': '200',
+            'merge_ns': '2000'
+        }
+
+        default_config['Instrumentation'] = {
+            'enabled': 'false',
+            'export_path': '',                # Vacío = sin exportación
+            'export_format': 'prometheus',    # prometheus o json
+            'export_interval': '10'           # Segundos
+        }
+
+        default_config['Recording'] = {
+            'enabled': 'false',
+            'keyframe_interval': '100',       # Ciclos entre cuadros clave
+            'max_cycles': '10000',            # Ciclos que se conservan (0 = sin límite)
+            'path': ''                        # Archivo donde se guarda al detener (vacío = no se guarda)
+        }
+
+        default_config['EventLog'] = {
+            'enabled': 'false',
+            'path': 'eventos.log',
+            'format': 'json',                 # json o binario
+            'max_kb': '10240',                # Tamaño a partir del cual se rota el archivo
+            'max_files': '5',
+            'compress': 'false'               # Comprimir con gzip los archivos rotados
         }
         
         with open(config_file, 'w', encoding='utf-8') as f:
@@ -68,8 +258,119 @@ class Config:
         
         if self.page_size > self.ram_size:
             raise ValueError("El tamaño de página no puede ser mayor que la RAM")
+
+        if self.huge_page_size:
+            if self.huge_page_size <= self.page_size or self.huge_page_size % self.page_size:
+                raise ValueError("La página enorme debe ser un múltiplo mayor del tamaño de página")
+
+            if self.huge_page_size > self.ram_size:
+                raise ValueError("La página enorme no puede ser mayor que la RAM")
+
+            if not 0 < self.huge_page_min_fill <= 1:
+                raise ValueError("El llenado mínimo de página enorme debe estar entre 0 y 1")
+        
+        if self.compressed_pool_enabled:
+            if self.compressed_pool_kb <= 0 or self.compressed_pool_kb >= self.ram_size:
+                raise ValueError("El pool comprimido debe ser positivo y menor que la RAM")
+
+            if not 1.0 <= self.compression_min_ratio <= self.compression_max_ratio:
+                raise ValueError("Las razones de compresión deben cumplir 1 <= mínima <= máxima")
         
-        self.replacement_algorithm = 'FIFO'
+        if self.arrival_model not in ('acciones', 'uniforme', 'poisson', 'rafagas', 'diurna', 'traza'):
+            raise ValueError(f"Modelo de llegadas desconocido: {self.arrival_model}")
+
+        if self.size_distribution not in ('mixta', 'uniforme', 'lognormal', 'pareto'):
+            raise ValueError(f"Distribución de tamaños desconocida: {self.size_distribution}")
+
+        if self.arrival_rate <= 0 or self.arrival_burst_rate <= 0:
+            raise ValueError("Las tasas de llegadas deben ser positivas")
+
+        if not 0 <= self.arrival_amplitude <= 1:
+            raise ValueError("La amplitud del ciclo diurno debe estar entre 0 y 1")
+
+        if self.arrival_model == 'traza' and not self.arrival_trace_path:
+            raise ValueError("El modelo de llegadas 'traza' necesita trace_path")
+        
+        if self.load_control_enabled and self.load_low_fault_rate >= self.load_high_fault_rate:
+            raise ValueError("El umbral bajo de fallos debe ser menor que el alto")
+
+        if self.recording_keyframe_interval <= 0:
+            raise ValueError("El intervalo entre cuadros clave debe ser positivo")
+
+        if self.recording_max_cycles < 0:
+            raise ValueError("La cantidad máxima de ciclos grabados no puede ser negativa")
+
+        if self.event_log_enabled and self.event_log_format not in ('json', 'binario'):
+            raise ValueError(f"Formato de registro de eventos desconocido: {self.event_log_format}")
+
+        if self.event_log_enabled and (not self.event_log_path or self.event_log_max_kb <= 0):
+            raise ValueError("El registro de eventos necesita una ruta y un tamaño máximo positivo")
+
+        if self.reclaim_enabled and not 0 <= self.reclaim_low_watermark < self.reclaim_high_watermark <= 1:
+            raise ValueError("Las marcas de agua del reclamo deben cumplir 0 <= baja < alta <= 1")
+
+        if self.reclaim_enabled and self.reclaim_batch_size <= 0:
+            raise ValueError("El reclamo en segundo plano debe desalojar al menos una página por ciclo")
+
+        if self.groups_enabled:
+            seen = set()
+            for group in self.memory_groups:
+                if not group['members']:
+                    raise ValueError(f"El grupo {group['name']} no tiene miembros")
+                if group['hard_kb'] < 0 or group['soft_kb'] < 0:
+                    raise ValueError(f"Los límites del grupo {group['name']} no pueden ser negativos")
+                if group['hard_kb'] and group['soft_kb'] > group['hard_kb']:
+                    raise ValueError(f"El límite blando del grupo {group['name']} supera su límite duro")
+                repeated = seen.intersection(group['members'])
+                if repeated:
+                    raise ValueError(f"{', '.join(sorted(repeated))} pertenece a más de un grupo")
+                seen.update(group['members'])
+
+        if self.dedup_enabled and self.dedup_pages_per_scan <= 0:
+            raise ValueError("La deduplicación debe revisar al menos una página por ciclo")
+
+        self.replacement_algorithm = self.replacement_algorithm.upper()
+        if self.replacement_algorithm not in ('FIFO', 'LRU', 'ARC', '2Q', 'LIRS'):
+            raise ValueError(f"Algoritmo de reemplazo desconocido: {self.replacement_algorithm}")
+
+    #Lee los grupos de [Groups]: cada <nombre>.members con sus <nombre>.hard_kb y <nombre>.soft_kb opcionales
+    def _read_groups(self):
+        if not self.config.has_section('Groups'):
+            return []
+        section = self.config['Groups']
+        groups = []
+        for key in section:
+            if not key.endswith('.members'):
+                continue
+            name = key[:-len('.members')]
+            groups.append({
+                'name': name,
+                'members': [member.strip() for member in section[key].split(',') if member.strip()],
+                'hard_kb': int(section.get(f"{name}.hard_kb", 0)),
+                'soft_kb': int(section.get(f"{name}.soft_kb", 0))
+            })
+        return groups
+
+    #Especificación del proceso de llegadas para el generador (None si las llegadas son acciones)
+    def get_arrival_spec(self, min_interval, max_interval):
+        model = self.arrival_model
+        if model == 'acciones':
+            return None
+        if model == 'uniforme':
+            return {'tipo': model, 'min_interval': min_interval, 'max_interval': max_interval}
+        if model == 'poisson':
+            return {'tipo': model, 'rate': self.arrival_rate}
+        if model == 'rafagas':
+            return {'tipo': model, 'rate': self.arrival_rate, 'burst_rate': self.arrival_burst_rate,
+                    'mean_quiet': self.arrival_mean_quiet, 'mean_burst': self.arrival_mean_burst}
+        if model == 'diurna':
+            return {'tipo': model, 'rate': self.arrival_rate, 'amplitude': self.arrival_amplitude,
+                    'period': self.arrival_period}
+        return {'tipo': model, 'path': self.arrival_trace_path}
+
+    #Especificación de la distribución de tamaños de proceso
+    def get_size_spec(self):
+        return {'tipo': self.size_distribution, 'sigma': self.size_sigma, 'alpha': self.size_alpha}
 
     #Retorna un resumen de la configuración actual
     def get_summary(self):
@@ -77,7 +378,11 @@ class Config:
             'RAM Total': f"{self.ram_size} KB",
             'SWAP Total': f"{self.swap_size} KB",
             'Tamaño de Página': f"{self.page_size} KB",
+            'Página Enorme': f"{self.huge_page_size} KB" if self.huge_page_size else 'Deshabilitada',
             'Marcos en RAM': self.ram_frames,
             'Marcos en SWAP': self.swap_frames,
-            'Algoritmo de Reemplazo': self.replacement_algorithm
+            'Algoritmo de Reemplazo': self.replacement_algorithm,
+            'Paginación bajo Demanda': 'Sí' if self.demand_paging else 'No',
+            'Llegadas de Procesos': self.arrival_model,
+            'Semilla': self.seed if self.seed is not None else 'Aleatoria'
         }
@@ -0,0 +1,156 @@
+"""
+Módulo de Control de Carga
+Planificador de mediano plazo contra la hiperpaginación (thrashing): vigila la
+tasa global de fallos de página y los marcos libres; cuando la memoria está
+sobrecomprometida deja de admitir procesos y saca de memoria procesos completos
+de baja prioridad hasta que la tasa de fallos baja. Los procesos retenidos se
+reactivan después según una política configurable
+"""
+import math
+
+from proceso import Process
+
+
+class LoadController:
+    """
+    Control de carga con histéresis entre un umbral alto y uno bajo de fallos por segundo
+    """
+
+    # Políticas de reactivación: clave de orden sobre (proceso, instante en que se retuvo)
+    REACTIVATION_POLICIES = {
+        'PRIORIDAD': lambda process, held_at: (process.priority, held_at),
+        'FIFO': lambda process, held_at: (held_at, process.priority),
+        'MENOR': lambda process, held_at: (process.num_pages, held_at),
+    }
+
+    def __init__(self, memory_manager, high_fault_rate=20.0, low_fault_rate=5.0, min_free_fraction=0.1,
+                 reactivation_policy='PRIORIDAD', smoothing=0.3):
+        """
+        Inicializa el control de carga
+
+        Args:
+            memory_manager (MemoryManager): Gestor de memoria a vigilar
+            high_fault_rate (float): Fallos por segundo a partir de los cuales hay hiperpaginación
+            low_fault_rate (float): Fallos por segundo por debajo de los cuales se reactiva
+            min_free_fraction (float): Fracción de marcos de RAM libres por debajo de la cual hay presión
+            reactivation_policy (str): PRIORIDAD, FIFO o MENOR
+            smoothing (float): Peso de la última medición en la media móvil de la tasa de fallos
+        """
+        if reactivation_policy not in self.REACTIVATION_POLICIES:
+            raise ValueError(f"Política de reactivación desconocida: {reactivation_policy}")
+
+        self.memory_manager = memory_manager
+        self.high_fault_rate = high_fault_rate
+        self.low_fault_rate = low_fault_rate
+        self.min_free_fraction = min_free_fraction
+        self.reactivation_policy = reactivation_policy
+        self.smoothing = smoothing
+
+        self.fault_rate = 0.0
+        self.thrashing = False
+        self.held = {}          # pid -> (proceso, instante en que se retuvo)
+
+        self._now = 0.0
+        self._last_faults = memory_manager.total_page_faults
+
+        # Estadísticas
+        self.rejected_admissions = 0
+        self.swapped_out_processes = 0
+        self.reactivated_processes = 0
+        self.thrashing_time = 0.0
+
+    #Fracción de marcos de RAM libres
+    def _free_fraction(self):
+        frames = self.memory_manager.ram_frames
+        return self.memory_manager._count_free_frames(frames) / len(frames) if frames else 0.0
+
+    #Verifica si se pueden admitir procesos nuevos
+    def admission_allowed(self):
+        if self.thrashing:
+            self.rejected_admissions += 1
+            return False
+        return True
+
+    #Actualiza la tasa de fallos y actúa: retiene un proceso o reactiva uno por ciclo
+    def update(self, delta):
+        if delta <= 0:
+            return
+
+        self._now += delta
+        faults = self.memory_manager.total_page_faults
+        rate = (faults - self._last_faults) / delta
+        self._last_faults = faults
+        self.fault_rate += self.smoothing * (rate - self.fault_rate)
+
+        self._sync_held()
+
+        pressure = self._free_fraction() < self.min_free_fraction
+        if self.fault_rate > self.high_fault_rate and pressure:
+            self.thrashing = True
+        elif self.fault_rate < self.low_fault_rate:
+            self.thrashing = False
+
+        if self.thrashing:
+            self.thrashing_time += delta
+            self._swap_out_one()
+        elif self.held and self.fault_rate < self.low_fault_rate:
+            self._reactivate_one()
+
+    #Descarta los procesos retenidos que ya terminaron y mantiene suspendidos a los demás
+    #Adopta los suspendidos sin plazo (por ejemplo tras restaurar un punto de control)
+    def _sync_held(self):
+        memory_manager = self.memory_manager
+        for process in memory_manager.processes:
+            if process.pid not in self.held and process.state == Process.SUSPENDED \
+                    and math.isinf(process.suspended_time):
+                self.held[process.pid] = (process, self._now)
+
+        for pid, (process, _) in list(self.held.items()):
+            if memory_manager._find_process_by_pid(pid) is not process:
+                del self.held[pid]
+            elif process.state != Process.SUSPENDED:
+                # Otro subsistema cambió su estado (por ejemplo al desalojar una página compartida)
+                process.suspend(math.inf)
+
+    #Saca de memoria el proceso de menor prioridad y lo deja suspendido
+    def _swap_out_one(self):
+        candidates = [p for p in self.memory_manager.processes
+                      if p.pid not in self.held and p.state in (Process.ACTIVE, Process.SWAPPED)]
+
+        # Siempre queda al menos un proceso ejecutándose
+        if len(candidates) <= 1:
+            return
+
+        victim = max(candidates, key=lambda p: (p.priority, p.page_table.count_pages_in_ram(), p.pid))
+        success, _, _ = self.memory_manager.swap_out_process(victim.pid)
+        if not success:
+            return
+
+        victim.suspend(math.inf)
+        self.held[victim.pid] = (victim, self._now)
+        self.swapped_out_processes += 1
+        self.memory_manager._log_event(
+            f"Control de carga: {victim} retenido fuera de memoria (fallos {self.fault_rate:.1f}/s)", "WARNING"
+        )
+
+    #Reactiva un proceso retenido según la política; la suspensión termina en el siguiente ciclo
+    def _reactivate_one(self):
+        key = self.REACTIVATION_POLICIES[self.reactivation_policy]
+        pid = min(self.held, key=lambda pid: key(*self.held[pid]))
+        process, _ = self.held.pop(pid)
+
+        process.suspended_time = process.time_suspended
+        self.reactivated_processes += 1
+        self.memory_manager._log_event(f"Control de carga: {process} reactivado ({self.reactivation_policy})", "INFO")
+
+    #Obtiene las estadísticas del control de carga
+    def get_statistics(self):
+        return {
+            'Control de Carga': 'Hiperpaginación' if self.thrashing else 'Normal',
+            'Tasa de Fallos (suavizada)': f"{self.fault_rate:.2f}/s",
+            'Procesos Retenidos': len(self.held),
+            'Procesos Sacados de Memoria': self.swapped_out_processes,
+            'Procesos Reactivados': self.reactivated_processes,
+            'Admisiones Rechazadas': self.rejected_admissions,
+            'Tiempo en Hiperpaginación': f"{self.thrashing_time:.1f}s"
+        }
@@ -4,8 +4,12 @@ Gestiona la creación, suspensión y terminación automática de procesos
 """
 import threading
 import time
-import random
 from generador_proceso import ProcessGenerator
+from grabacion import RunRecorder
+from control_carga import LoadController
+from reclamo import BackgroundReclaimer
+from instrumentacion import MetricsExporter
+from planificador_cpu import CPUScheduler
 from proceso import Process
 
 class SimulationController:
@@ -20,11 +24,22 @@ class SimulationController:
         """
         self.memory_manager = memory_manager
         self.callback = callback
+
+        # Flujos aleatorios de la simulación (compartidos con el gestor de memoria)
+        self.random = memory_manager.random
+
+        # Con un modelo de llegadas, los procesos llegan en instantes de tiempo simulado
+        config = memory_manager.config
+        self.arrival_driven = config.arrival_model != 'acciones'
+
         self.generator = ProcessGenerator(
             min_size=200,
             max_size=800,
             min_interval=1.5,
-            max_interval=4.0
+            max_interval=4.0,
+            rng=self.random,
+            arrivals=config.get_arrival_spec(1.5, 4.0) if self.arrival_driven else None,
+            sizes=config.get_size_spec()
         )
 
         self.running = False
@@ -42,6 +57,15 @@ class SimulationController:
         self.prob_suspend_process = 0.10    # 10% suspender proceso
         self.prob_bring_from_swap = 0.15    # 15% traer de SWAP a RAM
 
+        # Fracción de creaciones que son fork de un proceso existente (copy-on-write)
+        self.prob_fork = 0.0
+
+        # Referencias a página por cada acción de acceso
+        self.accesses_per_action = 1
+
+        # Fracción de accesos que son escrituras (marcan la página como modificada)
+        self.write_ratio = 0.3
+
         # Configuración de suspensión
         self.min_suspend_time = 3.0   # Segundos mínimos suspendido
         self.max_suspend_time = 8.0   # Segundos máximos suspendido
@@ -52,6 +76,59 @@ class SimulationController:
         # Tiempo de la última actualización
         self.last_update_time = 0
 
+        # Tiempo simulado transcurrido (usado para las métricas)
+        self.sim_time = 0.0
+
+        # Procesos que terminaron su ejecución (para el throughput)
+        self.completed_processes = 0
+
+        # Planificador de CPU acoplado a la paginación, si está configurado
+        self.cpu_scheduler = None
+        if getattr(config, 'cpu_scheduler', 'NONE') != 'NONE':
+            self.cpu_scheduler = CPUScheduler(
+                memory_manager,
+                policy=config.cpu_scheduler,
+                quantum=config.cpu_quantum,
+                io_latency=config.io_latency
+            )
+            self.cpu_scheduler.write_ratio = self.write_ratio
+
+        # Control de carga contra la hiperpaginación, si está configurado
+        self.load_controller = None
+        if getattr(config, 'load_control_enabled', False):
+            self.load_controller = LoadController(
+                memory_manager,
+                high_fault_rate=config.load_high_fault_rate,
+                low_fault_rate=config.load_low_fault_rate,
+                min_free_fraction=config.load_min_free_fraction,
+                reactivation_policy=config.load_reactivation_policy
+            )
+
+        # Reclamo en segundo plano con marcas de agua de marcos libres, si está configurado
+        self.reclaimer = None
+        if getattr(config, 'reclaim_enabled', False):
+            self.reclaimer = BackgroundReclaimer(
+                memory_manager,
+                low_watermark=config.reclaim_low_watermark,
+                high_watermark=config.reclaim_high_watermark,
+                batch_size=config.reclaim_batch_size
+            )
+
+        # Grabación de la ejecución, si está configurada
+        self.recorder = None
+        if getattr(config, 'recording_enabled', False):
+            self.enable_recording(config.recording_keyframe_interval, getattr(config, 'recording_max_cycles', 0))
+
+        # Exportación periódica de la instrumentación, si está configurada
+        self.exporter = None
+        if memory_manager.instrumentation.enabled and getattr(config, 'instrumentation_path', ''):
+            self.exporter = MetricsExporter(
+                memory_manager.instrumentation,
+                config.instrumentation_path,
+                config.instrumentation_format,
+                config.instrumentation_interval
+            )
+
     def start(self):
         """
         Inicia la simulación
@@ -60,6 +137,8 @@ class SimulationController:
             self.running = True
             self.paused = False
             self.last_update_time = time.time()
+            if self.memory_manager.event_sink:
+                self.memory_manager.event_sink.open()
             self.thread = threading.Thread(target=self._simulation_loop, daemon=True)
             self.thread.start()
 
@@ -85,6 +164,36 @@ class SimulationController:
             self.thread.join(timeout=2.0)
         self.generator.reset()
 
+        if self.exporter:
+            self.exporter.export()
+
+        # Guardar la grabación si hay un archivo configurado
+        recording_path = getattr(self.memory_manager.config, 'recording_path', '')
+        if self.recorder is not None and recording_path:
+            self.recorder.save(recording_path)
+
+        # Escribir en disco los eventos pendientes y cerrar el registro
+        if self.memory_manager.event_sink:
+            self.memory_manager.event_sink.close()
+
+    def enable_recording(self, keyframe_interval=100, max_cycles=0):
+        """
+        Empieza a grabar la ejecución desde el ciclo actual
+
+        Args:
+            keyframe_interval (int): Ciclos entre cuadros clave
+            max_cycles (int): Ciclos que se conservan (0 = sin límite)
+        """
+        if self.recorder is None:
+            self.recorder = RunRecorder(self.memory_manager, keyframe_interval, max_cycles)
+
+    def disable_recording(self):
+        """
+        Deja de grabar y descarta la grabación en curso
+        """
+        self.recorder = None
+        self.memory_manager.untrack_frame_changes()
+
     def set_speed(self, speed):
         """
         Ajusta la velocidad de la simulación
@@ -104,21 +213,7 @@ class SimulationController:
                 delta = (current_time - self.last_update_time) * self.speed
                 self.last_update_time = current_time
 
-                # 1. Actualizar tiempos de todos los procesos
-                self._update_all_process_times(delta)
-
-                # 2. Verificar procesos suspendidos que deben despertar
-                self._wake_up_suspended_processes()
-
-                # 3. Terminar procesos que completaron su ejecución
-                self._terminate_finished_processes()
-
-                # 4. Ejecutar acción aleatoria
-                self._execute_random_action()
-
-                # 5. Intentar traer páginas de SWAP a RAM si hay espacio
-                if self.memory_manager.has_free_ram():
-                    self._try_bring_pages_from_swap()
+                self.step(delta)
 
                 # Notificar cambios a la GUI
                 if self.callback:
@@ -130,6 +225,64 @@ class SimulationController:
             else:
                 time.sleep(0.1)
 
+    def step(self, delta):
+        """
+        Ejecuta un ciclo de simulación avanzando el tiempo simulado
+        Con la misma semilla y los mismos deltas produce la misma secuencia de eventos
+
+        Args:
+            delta (float): Tiempo simulado transcurrido en segundos
+        """
+        # 1. Actualizar tiempos de todos los procesos
+        self._update_all_process_times(delta)
+
+        # 2. Verificar procesos suspendidos que deben despertar
+        self._wake_up_suspended_processes()
+
+        # 3. Terminar procesos que completaron su ejecución
+        self._terminate_finished_processes()
+
+        # 4. Ejecutar acción aleatoria
+        self._execute_random_action()
+
+        # 4'. Crear los procesos que llegaron durante este ciclo
+        if self.arrival_driven:
+            for _ in range(self.generator.arrivals_until(self.sim_time + delta)):
+                self._admit_process()
+
+        # 4a. Control de carga: retener o reactivar procesos según la tasa de fallos
+        if self.load_controller:
+            self.load_controller.update(delta)
+
+        # 4b. Repartir la CPU entre los procesos listos (los accesos los hace el planificador)
+        if self.cpu_scheduler:
+            self.cpu_scheduler.run(delta)
+
+        # 5. Intentar traer páginas de SWAP a RAM si hay espacio
+        if self._has_room_for_swap_in():
+            self._try_bring_pages_from_swap()
+
+        # 5a. Reclamo en segundo plano: reponer marcos libres hasta la marca de agua alta
+        if self.reclaimer:
+            self.reclaimer.update()
+
+        # 5b. Avanzar la pasada de deduplicación en un bloque acotado
+        if self.memory_manager.deduplicator:
+            self.memory_manager.deduplicator.scan()
+
+        # 6. Registrar métricas
+        self.sim_time += delta
+        self.memory_manager.metrics.sample(self.sim_time)
+
+        # 6b. Grabar los cambios del ciclo (la interfaz puede desactivar la grabación entre ciclos)
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.capture(self.sim_time)
+
+        # 7. Exportar instrumentación si corresponde
+        if self.exporter:
+            self.exporter.maybe_export()
+
     def _update_all_process_times(self, delta):
         """
         Actualiza el tiempo en sistema de todos los procesos
@@ -171,6 +324,8 @@ class SimulationController:
                 processes_to_terminate.append(process)
 
         for process in processes_to_terminate:
+            self.completed_processes += 1
+
             # Liberar el nombre
             self.generator.release_name(process.name)
 
@@ -181,15 +336,17 @@ class SimulationController:
         """
         Ejecuta una acción aleatoria según las probabilidades configuradas
         """
-        rand = random.random()
+        rand = self.random.actions.random()
 
         if rand < self.prob_create_process:
-            # Crear nuevo proceso
-            self._create_random_process()
+            # Crear nuevo proceso (con un modelo de llegadas los procesos llegan por su cuenta)
+            if not self.arrival_driven:
+                self._admit_process()
 
         elif rand < self.prob_create_process + self.prob_access_page:
-            # Acceder a página de proceso existente
-            self._simulate_page_access()
+            # Acceder a página de proceso existente (con planificador de CPU los accesos ocurren al ejecutar)
+            if not self.cpu_scheduler:
+                self._simulate_page_access()
 
         elif rand < self.prob_create_process + self.prob_access_page + self.prob_suspend_process:
             # Suspender un proceso aleatorio
@@ -199,6 +356,17 @@ class SimulationController:
             # Traer página de SWAP a RAM
             self._try_bring_pages_from_swap()
 
+    def _admit_process(self):
+        """
+        Crea un proceso (o bifurca uno existente), salvo que el control de carga lo impida
+        """
+        if self.load_controller and not self.load_controller.admission_allowed():
+            return
+        if self.prob_fork and self.memory_manager.processes and self.random.actions.random() < self.prob_fork:
+            self._fork_random_process()
+        else:
+            self._create_random_process()
+
     def _create_random_process(self):
         """
         Crea un proceso con nombre, tamaño y tiempo de ejecución aleatorio
@@ -210,15 +378,36 @@ class SimulationController:
 
         if success:
             # Asignar tiempo de ejecución aleatorio
-            process.execution_time = random.uniform(
+            process.execution_time = self.random.lifetimes.uniform(
                 self.min_exec_time / self.speed,
                 self.max_exec_time / self.speed
             )
             process.time_in_system = 0.0
+            process.priority = self.random.lifetimes.randint(0, 4)
+            process.access_pattern = self.generator.create_access_pattern(name)
         else:
             # Si no se pudo crear, liberar el nombre
             self.generator.release_name(name)
 
+    def _fork_random_process(self):
+        """
+        Bifurca un proceso existente; el hijo comparte sus marcos hasta que escriba
+        """
+        parent = self.random.actions.choice(self.memory_manager.processes)
+        name = self.generator.generate_process_name()
+
+        success, message, child = self.memory_manager.fork(parent.pid, name)
+
+        if success:
+            child.execution_time = self.random.lifetimes.uniform(
+                self.min_exec_time / self.speed,
+                self.max_exec_time / self.speed
+            )
+            child.time_in_system = 0.0
+            child.access_pattern = self.generator.create_access_pattern(parent.name)
+        else:
+            self.generator.release_name(name)
+
     def _simulate_page_access(self):
         """
         Simula el acceso a una página de un proceso existente
@@ -231,15 +420,16 @@ class SimulationController:
         if not active_processes:
             return
 
-        process = random.choice(active_processes)
+        process = self.random.accesses.choice(active_processes)
 
         if process.num_pages == 0:
             return
 
-        page_num = random.randint(0, process.num_pages - 1)
-
-        # Simular acceso
-        self.memory_manager.simulate_page_access(process.pid, page_num)
+        # Simular accesos según el patrón de acceso del proceso
+        for _ in range(self.accesses_per_action):
+            page_num = process.next_page()
+            write = self.random.accesses.random() < self.write_ratio
+            self.memory_manager.simulate_page_access(process.pid, page_num, write)
 
     def _suspend_random_process(self):
         """
@@ -252,10 +442,10 @@ class SimulationController:
         if not active_processes:
             return
 
-        process = random.choice(active_processes)
+        process = self.random.suspensions.choice(active_processes)
 
         # Calcular tiempo de suspensión aleatorio
-        suspend_duration = random.uniform(
+        suspend_duration = self.random.suspensions.uniform(
             self.min_suspend_time / self.speed,
             self.max_suspend_time / self.speed
         )
@@ -267,13 +457,19 @@ class SimulationController:
             f"{process} SUSPENDIDO por {suspend_duration:.1f}s", "WARNING"
         )
 
+    #Verifica si hay marcos libres para traer páginas de SWAP sin consumir los que repone el reclamador
+    def _has_room_for_swap_in(self):
+        if self.reclaimer:
+            return self.reclaimer.free_frames() > self.reclaimer.high_watermark
+        return self.memory_manager.has_free_ram()
+
     def _try_bring_pages_from_swap(self):
         """
         Intenta traer páginas de SWAP a RAM para procesos que las necesiten
         Esto genera FALLO DE PÁGINA pero NO SWAP
         """
         # Verificar si hay espacio libre en RAM
-        if not self.memory_manager.has_free_ram():
+        if not self._has_room_for_swap_in():
             return
 
         # Buscar procesos con páginas en SWAP (priorizar INTERCAMBIADOS)
@@ -289,7 +485,7 @@ class SimulationController:
             return
 
         # Seleccionar un proceso aleatorio
-        process = random.choice(swapped_processes)
+        process = self.random.actions.choice(swapped_processes)
 
         # Obtener páginas en SWAP
         pages_in_swap = process.page_table.get_pages_in_swap()
@@ -298,7 +494,7 @@ class SimulationController:
             return
 
         # Traer una página aleatoria
-        page_num = random.choice(pages_in_swap)
+        page_num = self.random.actions.choice(pages_in_swap)
 
         success, msg = self.memory_manager.bring_page_from_swap_to_ram(process, page_num)
 
@@ -310,11 +506,29 @@ class SimulationController:
                     f"{process} cambió de INTERCAMBIADO a ACTIVO", "INFO"
                 )
 
+    #Procesos completados por segundo simulado
+    def get_throughput(self):
+        return self.completed_processes / self.sim_time if self.sim_time > 0 else 0.0
+
+    #Obtiene las estadísticas de memoria junto con las del planificador y el control de carga
+    def get_statistics(self):
+        stats = self.memory_manager.get_statistics()
+        stats['Procesos Completados'] = self.completed_processes
+        stats['Throughput'] = f"{self.get_throughput():.3f} procesos/s"
+        if self.cpu_scheduler:
+            stats.update({f"CPU {key}": value for key, value in self.cpu_scheduler.get_statistics().items()})
+        if self.load_controller:
+            stats.update(self.load_controller.get_statistics())
+        if self.reclaimer:
+            stats.update(self.reclaimer.get_statistics())
+        return stats
+
     #Obtiene el estado actual de la simulación
     def get_status(self):
         active = len([p for p in self.memory_manager.processes if p.state == Process.ACTIVE])
         suspended = len([p for p in self.memory_manager.processes if p.state == Process.SUSPENDED])
         swapped = len([p for p in self.memory_manager.processes if p.state == Process.SWAPPED])
+        blocked = len([p for p in self.memory_manager.processes if p.state == Process.BLOCKED])
 
         return {
             'running': self.running,
@@ -323,5 +537,6 @@ class SimulationController:
             'total_processes': len(self.memory_manager.processes),
             'active': active,
             'suspended': suspended,
-            'swapped': swapped
+            'swapped': swapped,
+            'blocked': blocked
         }
\ No newline at end of file
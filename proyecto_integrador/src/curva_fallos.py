@@ -0,0 +1,473 @@
+"""
+Módulo de Curva de Fallos
+Calcula en una sola pasada la curva de fallos de página contra número de marcos
+a partir de las distancias de pila LRU (algoritmo de Mattson) de un flujo de
+referencias, ya sea en vivo desde el gestor de memoria o leído de una traza
+
+Con LRU un acceso es acierto en una memoria de c marcos si y solo si su distancia
+de pila es a lo sumo c, así que un histograma de distancias da los fallos para
+todos los tamaños a la vez. Las distancias se cuentan con un árbol de Fenwick
+sobre los instantes del último acceso de cada página: O(log n) por referencia
+
+FIFO no es un algoritmo de pila, por lo que se simula por separado para cada
+tamaño (hasta un máximo de marcos, cada tamaño cuesta una pasada por el flujo)
+y se reportan los puntos donde presenta la anomalía de Belady
+
+Para trazas enormes existe un modo muestreado al estilo SHARDS: solo se analizan
+las páginas cuyo hash espacial queda bajo un umbral, con un número máximo de
+páginas en la muestra, y las distancias y conteos se escalan por la tasa de muestreo
+"""
+import csv
+import heapq
+import math
+from array import array
+from collections import deque
+
+
+class FenwickTree:
+    """
+    Árbol de Fenwick (árbol binario indexado) de sumas de prefijos sobre enteros
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = array('i', [0] * (size + 1))
+
+    #Suma delta en la posición index (base 0)
+    def add(self, index, delta):
+        tree = self.tree
+        index += 1
+        while index <= self.size:
+            tree[index] += delta
+            index += index & -index
+
+    #Suma de las posiciones [0, index)
+    def prefix_sum(self, index):
+        tree = self.tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+
+class StackDistanceAnalyzer:
+    """
+    Analizador de distancias de pila LRU con curva de fallos y verificación de FIFO
+    Cada referencia es un par (pid, página); se puede registrar como oyente de accesos
+    del MemoryManager o alimentar con una traza
+    """
+
+    # Columnas de las trazas de accesos
+    TRACE_FIELDS = ('pid', 'pagina')
+
+    def __init__(self, keep_stream=True, max_stream=1_000_000, initial_capacity=1024, fifo_max_frames=64):
+        """
+        Inicializa el analizador
+
+        Args:
+            keep_stream (bool): Guardar las referencias para simular FIFO y exportar la traza
+            max_stream (int): Máximo de referencias guardadas (las siguientes solo entran a la curva LRU)
+            initial_capacity (int): Capacidad inicial del árbol de Fenwick
+            fifo_max_frames (int): Mayor número de marcos para el que se simula FIFO en el CSV
+                                   y el resumen (0 = no simular FIFO)
+        """
+        self.keep_stream = keep_stream
+        self.max_stream = max_stream
+        self.fifo_max_frames = fifo_max_frames
+
+        # Identificador compacto de cada página distinta y su último instante en el árbol
+        self.ids = {}
+        self.keys = []
+        self.last_time = {}
+
+        self.tree = FenwickTree(initial_capacity)
+        self.time = 0
+
+        # Histograma de distancias (índice d: referencias con distancia d) y fallos obligatorios
+        self.distances = array('q', [0])
+        self.cold_misses = 0
+        self.references = 0
+
+        # Flujo de referencias como identificadores compactos
+        self.stream = array('i')
+        self.stream_truncated = False
+
+        # Fallos FIFO ya simulados (índice c - 1) y longitud del flujo con la que se calcularon
+        self._fifo = []
+        self._fifo_stream_length = 0
+
+    #Oyente de accesos del MemoryManager
+    def __call__(self, pid, page_num, write=False):
+        self.record(pid, page_num)
+
+    #Identificador compacto de una página
+    def _id_of(self, pid, page_num):
+        key = (pid, page_num)
+        page_id = self.ids.get(key)
+        if page_id is None:
+            page_id = len(self.keys)
+            self.ids[key] = page_id
+            self.keys.append(key)
+        return page_id
+
+    #Renumera los instantes vivos cuando el árbol se llena (cada página ocupa una sola posición)
+    def _compact(self):
+        live = sorted(self.last_time, key=self.last_time.get)
+        self.tree = FenwickTree(max(2 * len(live), self.tree.size))
+        for time, page_id in enumerate(live):
+            self.last_time[page_id] = time
+            self.tree.add(time, 1)
+        self.time = len(live)
+
+    #Registra una referencia y retorna su distancia de pila (None si es el primer acceso)
+    def record(self, pid, page_num):
+        page_id = self._id_of(pid, page_num)
+        self.references += 1
+
+        if self.keep_stream:
+            if len(self.stream) < self.max_stream:
+                self.stream.append(page_id)
+            else:
+                self.stream_truncated = True
+
+        if self.time >= self.tree.size:
+            self._compact()
+
+        tree = self.tree
+        previous = self.last_time.get(page_id)
+
+        if previous is None:
+            self.cold_misses += 1
+            distance = None
+        else:
+            # Páginas distintas accedidas después del último acceso, más la propia
+            distance = tree.prefix_sum(self.time) - tree.prefix_sum(previous + 1) + 1
+            tree.add(previous, -1)
+            if distance >= len(self.distances):
+                self.distances.extend([0] * (distance + 1 - len(self.distances)))
+            self.distances[distance] += 1
+
+        tree.add(self.time, 1)
+        self.last_time[page_id] = self.time
+        self.time += 1
+        return distance
+
+    #Registra una secuencia de referencias (pid, página)
+    def record_all(self, references):
+        for pid, page_num in references:
+            self.record(pid, page_num)
+
+    #Páginas distintas vistas
+    def distinct_pages(self):
+        return len(self.keys)
+
+    #Fallos LRU para cada número de marcos de 1 a max_frames (por defecto hasta que ya no bajan)
+    def lru_curve(self, max_frames=None):
+        if max_frames is None:
+            max_frames = max(1, len(self.distances) - 1)
+
+        curve = []
+        misses = self.references - self.cold_misses
+        for frames in range(1, max_frames + 1):
+            # Con c marcos aciertan las referencias con distancia <= c
+            if frames < len(self.distances):
+                misses -= self.distances[frames]
+            curve.append(self.cold_misses + misses)
+        return curve
+
+    #Tasa de fallos LRU para cada número de marcos
+    def miss_ratio_curve(self, max_frames=None):
+        if not self.references:
+            return []
+        return [faults / self.references for faults in self.lru_curve(max_frames)]
+
+    #Fallos de FIFO con un número de marcos sobre el flujo guardado
+    def fifo_faults(self, frames):
+        resident = set()
+        queue = deque()
+        faults = 0
+
+        for page_id in self.stream:
+            if page_id in resident:
+                continue
+            faults += 1
+            if len(queue) >= frames:
+                resident.discard(queue.popleft())
+            queue.append(page_id)
+            resident.add(page_id)
+        return faults
+
+    #Fallos de FIFO para cada número de marcos de 1 a max_frames
+    #Los tamaños ya simulados se reutilizan mientras el flujo guardado no cambie
+    def fifo_curve(self, max_frames):
+        if self._fifo_stream_length != len(self.stream):
+            self._fifo = []
+            self._fifo_stream_length = len(self.stream)
+        for frames in range(len(self._fifo) + 1, max_frames + 1):
+            self._fifo.append(self.fifo_faults(frames))
+        return self._fifo[:max_frames]
+
+    #Mayor número de marcos para el que se simula FIFO por omisión
+    def _fifo_limit(self, max_frames=None):
+        return min(max_frames or self.distinct_pages(), self.fifo_max_frames)
+
+    #Números de marcos c donde FIFO falla más con c marcos que con c - 1 (anomalía de Belady)
+    def belady_anomalies(self, max_frames=None, fifo_curve=None):
+        if fifo_curve is None:
+            fifo_curve = self.fifo_curve(max_frames or self._fifo_limit())
+        return [frames + 1 for frames in range(1, len(fifo_curve))
+                if fifo_curve[frames] > fifo_curve[frames - 1]]
+
+    #Escribe la curva en CSV: marcos, fallos LRU, tasa LRU y fallos FIFO si hay flujo guardado
+    #FIFO se simula solo hasta fifo_max_frames marcos; las filas siguientes quedan sin ese valor
+    def export_csv(self, path, max_frames=None):
+        lru = self.lru_curve(max_frames)
+        fifo = self.fifo_curve(self._fifo_limit(len(lru))) if self.stream and self.fifo_max_frames else None
+
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            header = ['marcos', 'fallos_lru', 'tasa_lru']
+            if fifo is not None:
+                header.append('fallos_fifo')
+            writer.writerow(header)
+            for frames, faults in enumerate(lru, start=1):
+                row = [frames, faults, f"{faults / self.references:.6f}"]
+                if fifo is not None:
+                    row.append(fifo[frames - 1] if frames <= len(fifo) else '')
+                writer.writerow(row)
+
+    #Guarda el flujo de referencias como traza CSV (pid, pagina)
+    def save_trace(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.TRACE_FIELDS)
+            keys = self.keys
+            for page_id in self.stream:
+                writer.writerow(keys[page_id])
+
+    #Crea un analizador a partir de una traza CSV con columnas pid y pagina
+    @classmethod
+    def from_trace(cls, path, **kwargs):
+        analyzer = cls(**kwargs)
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                analyzer.record(int(row['pid']), int(row['pagina']))
+        return analyzer
+
+    #Obtiene el resumen del análisis
+    def get_statistics(self, max_frames=None):
+        stats = {
+            'Referencias Analizadas': self.references,
+            'Páginas Distintas': self.distinct_pages(),
+            'Fallos Obligatorios': self.cold_misses
+        }
+
+        if self.stream and not self.stream_truncated and self.fifo_max_frames:
+            limit = self._fifo_limit(max_frames)
+            anomalies = self.belady_anomalies(fifo_curve=self.fifo_curve(limit))
+            found = ', '.join(map(str, anomalies)) + ' marcos' if anomalies else 'No'
+            stats['Anomalía de Belady (FIFO)'] = f"{found} (hasta {limit} marcos)"
+        return stats
+
+
+#Hash espacial de una página (splitmix64), uniforme en [0, 2^64)
+def spatial_hash(pid, page_num):
+    x = ((pid << 32) ^ page_num) & 0xFFFFFFFFFFFFFFFF
+    x = (x + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+
+class SampledStackAnalyzer:
+    """
+    Curva de fallos LRU aproximada por muestreo espacial de tamaño fijo (SHARDS)
+
+    Una página entra a la muestra si hash mod P < umbral; la tasa de muestreo es umbral / P.
+    Si la muestra supera max_pages se baja el umbral al mayor hash presente y se descartan
+    las páginas que ya no lo cumplen, así la memoria es constante sin importar la traza.
+    Los tamaños menores a 1 / tasa marcos quedan por debajo de la resolución de la muestra
+    """
+
+    # Módulo del hash espacial
+    MODULUS = 1 << 24
+
+    # Columnas de las trazas de accesos
+    TRACE_FIELDS = StackDistanceAnalyzer.TRACE_FIELDS
+
+    def __init__(self, max_pages=8192, rate=1.0, confidence_z=1.96):
+        """
+        Inicializa el analizador muestreado
+
+        Args:
+            max_pages (int): Máximo de páginas distintas en la muestra
+            rate (float): Tasa de muestreo inicial (baja sola al llenarse la muestra)
+            confidence_z (float): Valor z de los intervalos de error (1.96 = 95%)
+        """
+        self.max_pages = max_pages
+        self.threshold = max(1, int(rate * self.MODULUS))
+        self.confidence_z = confidence_z
+
+        # Página -> último instante en el árbol, y montículo (-hash, página) para bajar el umbral
+        self.last_time = {}
+        self.hashes = []
+
+        self.tree = FenwickTree(2 * max_pages + 2)
+        self.time = 0
+
+        # Histograma escalado: distancia estimada -> referencias estimadas
+        self.distances = {}
+        self.cold_misses = 0.0
+
+        self.references = 0
+        self.sampled_references = 0
+        self.sampled_pages = 0
+        self.sampled_weight = 0.0
+
+    #Tasa de muestreo actual
+    def rate(self):
+        return self.threshold / self.MODULUS
+
+    #Oyente de accesos del MemoryManager
+    def __call__(self, pid, page_num, write=False):
+        self.record(pid, page_num)
+
+    #Baja el umbral hasta que la muestra cabe en max_pages
+    def _shrink(self):
+        while len(self.last_time) > self.max_pages:
+            self.threshold = -self.hashes[0][0]
+            while self.hashes and -self.hashes[0][0] >= self.threshold:
+                _, key = heapq.heappop(self.hashes)
+                self.tree.add(self.last_time.pop(key), -1)
+
+    #Renumera los instantes vivos cuando el árbol se llena
+    def _compact(self):
+        live = sorted(self.last_time, key=self.last_time.get)
+        self.tree = FenwickTree(self.tree.size)
+        for time, key in enumerate(live):
+            self.last_time[key] = time
+            self.tree.add(time, 1)
+        self.time = len(live)
+
+    #Registra una referencia; retorna la distancia estimada, o None si no se muestreó o es el primer acceso
+    def record(self, pid, page_num):
+        self.references += 1
+
+        sample = spatial_hash(pid, page_num) % self.MODULUS
+        if sample >= self.threshold:
+            return None
+
+        key = (pid, page_num)
+        weight = 1.0 / self.rate()
+        self.sampled_references += 1
+        self.sampled_weight += weight
+
+        if self.time >= self.tree.size:
+            self._compact()
+
+        tree = self.tree
+        previous = self.last_time.get(key)
+
+        if previous is None:
+            self.cold_misses += weight
+            self.sampled_pages += 1
+            distance = None
+            heapq.heappush(self.hashes, (-sample, key))
+        else:
+            sampled_distance = tree.prefix_sum(self.time) - tree.prefix_sum(previous + 1) + 1
+            tree.add(previous, -1)
+            distance = max(1, round(sampled_distance * weight))
+            self.distances[distance] = self.distances.get(distance, 0.0) + weight
+
+        tree.add(self.time, 1)
+        self.last_time[key] = self.time
+        self.time += 1
+
+        if previous is None and len(self.last_time) > self.max_pages:
+            self._shrink()
+        return distance
+
+    #Registra una secuencia de referencias (pid, página)
+    def record_all(self, references):
+        for pid, page_num in references:
+            self.record(pid, page_num)
+
+    #Páginas distintas estimadas
+    def distinct_pages(self):
+        return round(self.cold_misses)
+
+    #Fallos LRU estimados para cada número de marcos de 1 a max_frames
+    #La diferencia entre las referencias reales y las estimadas se asigna a la distancia 1 (SHARDS-adj)
+    def lru_curve(self, max_frames=None):
+        if max_frames is None:
+            max_frames = max(self.distances, default=1)
+
+        correction = self.references - self.sampled_weight if self.sampled_references else 0.0
+        hits = [0.0] * (max_frames + 1)
+        for distance, weight in self.distances.items():
+            if distance <= max_frames:
+                hits[distance] += weight
+        hits[1] += correction
+
+        curve = []
+        misses = self.references - self.cold_misses
+        for frames in range(1, max_frames + 1):
+            misses -= hits[frames]
+            curve.append(max(0.0, self.cold_misses + misses))
+        return curve
+
+    #Tasa de fallos LRU estimada para cada número de marcos
+    def miss_ratio_curve(self, max_frames=None):
+        if not self.references:
+            return []
+        return [min(1.0, faults / self.references) for faults in self.lru_curve(max_frames)]
+
+    #Semiancho del intervalo de confianza de cada tasa
+    #Aproximación binomial: la unidad de muestreo es la página, no la referencia
+    def error_bounds(self, max_frames=None):
+        if not self.sampled_pages:
+            return []
+        ratios = self.miss_ratio_curve(max_frames)
+        if self.threshold >= self.MODULUS:
+            # Sin muestreo la curva es exacta
+            return [0.0] * len(ratios)
+        n = self.sampled_pages
+        return [self.confidence_z * math.sqrt(ratio * (1 - ratio) / n) for ratio in ratios]
+
+    #Escribe la curva estimada en CSV con el error de cada punto
+    def export_csv(self, path, max_frames=None):
+        curve = self.lru_curve(max_frames)
+        ratios = self.miss_ratio_curve(max_frames)
+        errors = self.error_bounds(max_frames)
+
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['marcos', 'fallos_lru', 'tasa_lru', 'error_tasa'])
+            for frames, faults in enumerate(curve, start=1):
+                writer.writerow([frames, round(faults), f"{ratios[frames - 1]:.6f}", f"{errors[frames - 1]:.6f}"])
+
+    #Crea un analizador a partir de una traza CSV con columnas pid y pagina, leída en streaming
+    @classmethod
+    def from_trace(cls, path, **kwargs):
+        analyzer = cls(**kwargs)
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            pid_col, page_col = header.index('pid'), header.index('pagina')
+            record = analyzer.record
+            for row in reader:
+                record(int(row[pid_col]), int(row[page_col]))
+        return analyzer
+
+    #Obtiene el resumen del análisis
+    def get_statistics(self, max_frames=None):
+        errors = self.error_bounds(max_frames)
+        return {
+            'Referencias Analizadas': self.references,
+            'Referencias Muestreadas': self.sampled_references,
+            'Tasa de Muestreo': f"{self.rate() * 100:.3f}%",
+            'Páginas Distintas (estimadas)': self.distinct_pages(),
+            'Resolución de la Curva': f"{math.ceil(1 / self.rate())} marcos",
+            'Error Máximo de la Tasa': f"±{max(errors, default=0.0) * 100:.2f}%"
+        }
@@ -0,0 +1,169 @@
+"""
+Módulo de Deduplicación de Páginas
+Pasada al estilo de KSM: recorre las páginas residentes en bloques acotados por
+ciclo, calcula una huella del contenido de cada página y fusiona las páginas
+idénticas de distintos procesos en un único marco compartido con copy-on-write
+
+El contenido se modela así: las primeras páginas de todo proceso son bibliotecas
+comunes, le siguen las de código del programa (iguales entre instancias del mismo
+programa) y el resto son datos privados. Una página escrita deja de ser fusionable
+"""
+import math
+
+
+class PageDeduplicator:
+    """
+    Escáner incremental de páginas idénticas con un árbol estable de huella -> marco
+    """
+
+    def __init__(self, memory_manager, pages_per_scan=32, library_pages=2, code_fraction=0.3,
+                 scan_ns=200, merge_ns=2000):
+        """
+        Inicializa el deduplicador
+
+        Args:
+            memory_manager (MemoryManager): Gestor cuyos marcos se fusionan
+            pages_per_scan (int): Páginas revisadas por cada llamada a scan()
+            library_pages (int): Páginas iniciales de bibliotecas comunes a todo proceso
+            code_fraction (float): Fracción de páginas de código del programa
+            scan_ns (int): Costo de calcular la huella de una página
+            merge_ns (int): Costo de comparar y fusionar una página
+        """
+        self.memory_manager = memory_manager
+        self.pages_per_scan = pages_per_scan
+        self.library_pages = library_pages
+        self.code_fraction = code_fraction
+        self.scan_ns = scan_ns
+        self.merge_ns = merge_ns
+
+        # Huella -> marco de RAM que guarda ese contenido
+        self.stable = {}
+
+        # Páginas escritas (pid, página): su contenido ya es privado
+        self.written = set()
+
+        # Posición del recorrido incremental
+        self.cursor_process = 0
+        self.cursor_page = 0
+
+        # Estadísticas
+        self.pages_scanned = 0
+        self.pages_merged = 0
+        self.full_scans = 0
+        self.cost_ns = 0
+
+    #Huella del contenido de una página como (tipo, programa, página), o None si su contenido es privado
+    def fingerprint(self, process, page_num):
+        if (process.pid, page_num) in self.written:
+            return None
+        if page_num < self.library_pages:
+            return ("lib", "", page_num)
+        if page_num < self.library_pages + math.ceil(process.num_pages * self.code_fraction):
+            return ("code", process.program, page_num)
+        return None
+
+    #Registra una escritura: la página deja de ser candidata a fusión
+    def note_write(self, pid, page_num):
+        self.written.add((pid, page_num))
+
+    #Olvida las páginas escritas de un proceso terminado
+    def forget_process(self, pid):
+        self.written = {key for key in self.written if key[0] != pid}
+
+    #Verifica que el marco estable siga guardando el contenido de la huella
+    def _holds(self, frame, fingerprint):
+        if frame.is_free:
+            return False
+        process, page_num = frame.process, frame.page_number
+        entry = process.page_table.entries[page_num]
+        return entry.valid and entry.frame_number == frame.frame_id and self.fingerprint(process, page_num) == fingerprint
+
+    #Revisa una página y la fusiona con el marco estable si tienen el mismo contenido
+    def _scan_page(self, process, page_num):
+        self.pages_scanned += 1
+        self.cost_ns += self.scan_ns
+
+        page_table = process.page_table
+        entry = page_table.entries[page_num]
+
+        # Solo páginas base residentes (las enormes no se fusionan sin dividirlas)
+        if not entry.valid or page_table.is_page_huge(page_num):
+            return
+
+        fingerprint = self.fingerprint(process, page_num)
+        if fingerprint is None:
+            return
+
+        frame = self.memory_manager.ram_frames[entry.frame_number]
+        stable = self.stable.get(fingerprint)
+
+        if stable is frame:
+            return
+
+        if stable is None or not self._holds(stable, fingerprint):
+            self.stable[fingerprint] = frame
+            return
+
+        self.cost_ns += self.merge_ns
+        self.pages_merged += self.memory_manager._merge_frames(frame, stable)
+
+    #Revisa hasta pages_per_scan páginas continuando donde quedó la pasada anterior
+    def scan(self):
+        processes = self.memory_manager.processes
+
+        for _ in range(self.pages_per_scan):
+            if not processes:
+                return
+
+            if self.cursor_process >= len(processes):
+                self._finish_pass()
+
+            process = processes[self.cursor_process]
+            if self.cursor_page >= process.num_pages:
+                self.cursor_process += 1
+                self.cursor_page = 0
+                continue
+
+            self._scan_page(process, self.cursor_page)
+            self.cursor_page += 1
+
+    #Cierra una pasada completa y descarta las huellas cuyo marco cambió de contenido
+    def _finish_pass(self):
+        self.cursor_process = 0
+        self.cursor_page = 0
+        self.full_scans += 1
+        self.stable = {fingerprint: frame for fingerprint, frame in self.stable.items()
+                       if self._holds(frame, fingerprint)}
+
+    #Obtiene el estado del escáner: (escalares, árbol estable como filas (huella, marco))
+    #Las páginas escritas las empaqueta el punto de control por separado
+    def get_state(self):
+        scalars = [self.cursor_process, self.cursor_page, self.pages_scanned, self.pages_merged,
+                   self.full_scans, self.cost_ns]
+        return scalars, [(fingerprint, frame.frame_id) for fingerprint, frame in self.stable.items()]
+
+    #Restaura un estado obtenido con get_state
+    def set_state(self, scalars, stable):
+        (self.cursor_process, self.cursor_page, self.pages_scanned, self.pages_merged,
+         self.full_scans, self.cost_ns) = (int(value) for value in scalars)
+        ram_frames = self.memory_manager.ram_frames
+        self.stable = {fingerprint: ram_frames[frame_id] for fingerprint, frame_id in stable}
+
+    #Marcos que se ahorran ahora gracias a las fusiones
+    def frames_saved(self):
+        return sum(len(frame.sharers) for fingerprint, frame in self.stable.items()
+                   if self._holds(frame, fingerprint))
+
+    #Obtiene las estadísticas de deduplicación
+    def get_statistics(self):
+        saved = self.frames_saved()
+        cost_per_frame = (self.cost_ns / saved / 1000) if saved else 0
+
+        return {
+            'Páginas Revisadas (dedup)': self.pages_scanned,
+            'Páginas Fusionadas': self.pages_merged,
+            'Marcos Ahorrados por Deduplicación': saved,
+            'Pasadas Completas (dedup)': self.full_scans,
+            'Costo de Deduplicación': f"{self.cost_ns / 1e6:.2f} ms",
+            'Costo por Marco Ahorrado': f"{cost_per_frame:.1f} µs"
+        }
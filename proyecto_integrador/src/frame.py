@@ -7,22 +7,30 @@ class Frame:
     Representa un marco de memoria física (RAM) o área de intercambio (SWAP).
     Inicializa un marco de memoria, Id unico del marco y ubicación.
     """
+
+    # Estado de un marco libre como valores de la clase: un marco recién creado no
+    # guarda atributos propios hasta que se ocupa, así crear millones de marcos es barato
+    is_free = True
+    process = None      # Proceso que ocupa este marco
+    page_number = None  # Número de página lógica
+    load_time = 0       # Timestamp de cuando se cargó (para FIFO)
+    last_access = 0     # Timestamp de último acceso (para LRU)
+    sharers = ()        # Otros (proceso, página) que comparten el marco (copy-on-write)
+
     def __init__(self, frame_id, location='RAM'):
         self.frame_id = frame_id
         self.location = location
-        self.is_free = True
-        self.process = None      # Proceso que ocupa este marco
-        self.page_number = None  # Número de página lógica
-        self.load_time = 0       # Timestamp de cuando se cargó (para FIFO)
-        self.last_access = 0     # Timestamp de último acceso (para LRU)
 
     #Asigna el marco a un proceso específico, proceso que ocupará el marco y el número de páginas
-    def allocate(self, process, page_number):
+    #El timestamp puede venir de un reloj lógico para que la simulación sea reproducible
+    def allocate(self, process, page_number, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
         self.is_free = False
         self.process = process
         self.page_number = page_number
-        self.load_time = time.time()
-        self.last_access = time.time()
+        self.load_time = timestamp
+        self.last_access = timestamp
 
     #Libera el marco, dejándolo disponible.
     def free(self):
@@ -34,17 +42,48 @@ class Frame:
         self.page_number = None
         self.load_time = 0
         self.last_access = 0
+        self.sharers = []
+
+    #Agrega otra página que referencia el mismo contenido (fork con copy-on-write)
+    def share(self, process, page_number):
+        if not self.sharers:
+            self.sharers = []
+        self.sharers.append((process, page_number))
+
+    #Quita una referencia al marco; si era la del dueño, el primer compartidor pasa a serlo
+    #Libera el marco al quitar la última referencia y retorna las referencias restantes
+    def unshare(self, process, page_number):
+        if self.process is process and self.page_number == page_number:
+            if self.sharers:
+                self.process, self.page_number = self.sharers.pop(0)
+            else:
+                self.free()
+                return 0
+        else:
+            self.sharers.remove((process, page_number))
+        return self.ref_count()
+
+    #Número de páginas que referencian el marco
+    def ref_count(self):
+        return 0 if self.is_free else 1 + len(self.sharers)
+
+    #Páginas que referencian el marco como (proceso, página), empezando por el dueño
+    def mappings(self):
+        if self.is_free:
+            return []
+        return [(self.process, self.page_number), *self.sharers]
 
     #Registra un accesso al marco.
-    def access(self):
-        self.last_access = time.time()
+    def access(self, timestamp=None):
+        self.last_access = time.time() if timestamp is None else timestamp
 
     #Obtiene información del marco, devuelve la descripcion del contenido del marco.
     def get_info(self):
         if self.is_free:
             return f"[Marco {self.frame_id}: Libre]"
         else:
-            return f"[Marco {self.frame_id}: {self.process}, Pág {self.page_number}]"
+            shared = f" +{len(self.sharers)} COW" if self.sharers else ""
+            return f"[Marco {self.frame_id}: {self.process}, Pág {self.page_number}{shared}]"
     
     def __str__(self):
         return self.get_info()
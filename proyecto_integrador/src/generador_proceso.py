@@ -1,4 +1,6 @@
 import random
+from llegadas import SizeDistribution, create_arrivals
+from patron_acceso import create_pattern
 
 class ProcessGenerator:
     """
@@ -24,48 +26,149 @@ class ProcessGenerator:
         "MediaPlayer", "Acrobat", "WinRAR"
     ]
 
+    # Tipo de programa de cada nombre, determina su patrón de acceso
+    PROCESS_TYPES = {
+        "Chrome": "navegador", "Firefox": "navegador", "Edge": "navegador", "Safari": "navegador",
+        "VSCode": "editor", "PyCharm": "editor", "Sublime": "editor", "Atom": "editor",
+        "Word": "ofimatica", "Excel": "ofimatica", "PowerPoint": "ofimatica", "Outlook": "ofimatica",
+        "Photoshop": "multimedia", "Illustrator": "multimedia", "Premiere": "multimedia",
+        "Spotify": "multimedia", "Discord": "comunicacion", "Slack": "comunicacion", "Zoom": "comunicacion",
+        "Steam": "juego", "Epic Games": "juego", "Minecraft": "juego",
+        "Terminal": "terminal", "CMD": "terminal", "PowerShell": "terminal",
+        "Explorer": "explorador", "Finder": "explorador", "Nautilus": "explorador",
+        "Docker": "virtualizacion", "VirtualBox": "virtualizacion", "VMware": "virtualizacion",
+        "MySQL": "base_datos", "PostgreSQL": "base_datos", "MongoDB": "base_datos",
+        "Apache": "servidor", "Nginx": "servidor", "Node.js": "servidor",
+        "Python": "lenguaje", "Java": "lenguaje", "GCC": "lenguaje",
+        "Calculator": "utilidad", "Notepad": "utilidad", "Paint": "utilidad",
+        "MediaPlayer": "multimedia", "Acrobat": "ofimatica", "WinRAR": "utilidad"
+    }
+
+    # Patrón de acceso por defecto de cada tipo de programa
+    DEFAULT_ACCESS_PATTERNS = {
+        "navegador": {"tipo": "zipf", "s": 1.1},
+        "editor": {"tipo": "conjunto_trabajo", "working_set_fraction": 0.3, "phase_length": 300},
+        "ofimatica": {"tipo": "conjunto_trabajo", "working_set_fraction": 0.4, "phase_length": 200},
+        "multimedia": {"tipo": "secuencial"},
+        "comunicacion": {"tipo": "zipf", "s": 1.3},
+        "juego": {"tipo": "bucle", "loop_fraction": 0.6},
+        "terminal": {"tipo": "zipf", "s": 1.5},
+        "explorador": {"tipo": "zipf", "s": 1.2},
+        "virtualizacion": {"tipo": "conjunto_trabajo", "working_set_fraction": 0.5, "phase_length": 500, "drift": 2},
+        "base_datos": {"tipo": "zipf", "s": 0.9},
+        "servidor": {"tipo": "bucle", "loop_fraction": 0.4},
+        "lenguaje": {"tipo": "conjunto_trabajo", "working_set_fraction": 0.25, "phase_length": 150},
+        "utilidad": {"tipo": "uniforme"},
+        "generico": {"tipo": "uniforme"}
+    }
+
     #Inicializa el generador
-    def __init__(self, min_size=200, max_size=1000, min_interval=1.0, max_interval=3.0):
+    #arrivals y sizes son especificaciones {'tipo': ..., parámetros} de llegadas y tamaños
+    def __init__(self, min_size=200, max_size=1000, min_interval=1.0, max_interval=3.0, access_patterns=None, rng=None,
+                 arrivals=None, sizes=None):
         self.min_size = min_size
         self.max_size = max_size
         self.min_interval = min_interval
         self.max_interval = max_interval
-        self.used_names = []
         self.process_counter = 0
 
+        # Nombres en uso (conjunto) y nombres libres (lista con índice) para asignar en O(1)
+        self.used_names = set()
+        self.free_names = list(self.PROCESS_NAMES)
+        self._free_index = {name: i for i, name in enumerate(self.free_names)}
+
+        # Flujos aleatorios de la simulación (SimulationRandom); sin ellos se usa el módulo random
+        self.rng = rng
+        self.arrival_rng = rng.arrivals if rng is not None else random
+        self.size_rng = rng.sizes if rng is not None else random
+
+        # Patrones de acceso por tipo de programa (los recibidos reemplazan a los de por defecto)
+        self.access_patterns = dict(self.DEFAULT_ACCESS_PATTERNS)
+        if access_patterns:
+            self.access_patterns.update(access_patterns)
+
+        # Proceso de llegadas y distribución de tamaños
+        self.arrival_spec = dict(arrivals or {'tipo': 'uniforme', 'min_interval': min_interval, 'max_interval': max_interval})
+        self.arrivals = create_arrivals(self.arrival_spec, self.arrival_rng)
+        self.sizes = SizeDistribution(self.size_rng, min_size, max_size, **(sizes or {}))
+
+        # Instante (tiempo simulado) de la próxima llegada
+        self.next_arrival_time = None
+
     #Genera un nombre de proceso único
     def generate_process_name(self):
-        # Intentar usar nombres disponibles
-        available_names = [name for name in self.PROCESS_NAMES if name not in self.used_names]
-        
-        if available_names:
-            name = random.choice(available_names)
+        free_names = self.free_names
+
+        if free_names:
+            # Elegir un nombre libre y quitarlo intercambiándolo con el último
+            index = self.arrival_rng.randrange(len(free_names))
+            name = free_names[index]
+            last = free_names.pop()
+            if last != name:
+                free_names[index] = last
+                self._free_index[last] = index
+            del self._free_index[name]
         else:
             # Si se acabaron los nombres, crear uno genérico
             self.process_counter += 1
             name = f"Process_{self.process_counter}"
-        
-        self.used_names.append(name)
+
+        self.used_names.add(name)
         return name
 
-    #Genera un tamaño aleatorio para el proceso
+    #Genera un tamaño aleatorio para el proceso (las trazas pueden imponerlo)
     def generate_process_size(self):
-        # La mayoría de procesos son pequeños, algunos son grandes
-        if random.random() < 0.7:  # 70% procesos pequeños
-            return random.randint(self.min_size, self.min_size + 300)
-        else:  # 30% procesos medianos/grandes
-            return random.randint(self.min_size + 300, self.max_size)
+        size = self.arrivals.next_size()
+        if size is not None:
+            return size
+        return self.sizes.sample()
 
     #Calcula el intervalo hasta el próximo proceso
     def get_next_interval(self):
-        return random.uniform(self.min_interval, self.max_interval)
+        return self.arrivals.next_interval()
+
+    #Cuenta las llegadas hasta el instante now (tiempo simulado), avanzando el reloj de llegadas
+    def arrivals_until(self, now):
+        if self.next_arrival_time is None:
+            self.next_arrival_time = self.get_next_interval()
+
+        count = 0
+        while self.next_arrival_time <= now:
+            count += 1
+            self.next_arrival_time += self.get_next_interval()
+        return count
+
+    #Obtiene el tipo de programa de un nombre de proceso
+    def get_process_type(self, name):
+        return self.PROCESS_TYPES.get(name, "generico")
+
+    #Crea el patrón de acceso correspondiente al tipo de programa del proceso
+    def create_access_pattern(self, name, rng=None):
+        if rng is None and self.rng is not None:
+            rng = self.rng.derive('accesses')
+        spec = self.access_patterns.get(self.get_process_type(name), self.access_patterns["generico"])
+        return create_pattern(spec, rng)
 
     #Libera un nombre para que pueda ser reutilizado
     def release_name(self, name):
-        if name in self.used_names:
-            self.used_names.remove(name)
+        if name not in self.used_names:
+            return
+        self.used_names.discard(name)
+
+        # Los nombres genéricos no se reutilizan, el contador sigue avanzando
+        if name in self.PROCESS_TYPES:
+            self._free_index[name] = len(self.free_names)
+            self.free_names.append(name)
+
+    #Restaura el conjunto de nombres en uso y el orden de la lista de libres
+    def set_names(self, used_names, free_names):
+        self.used_names = set(used_names)
+        self.free_names = list(free_names)
+        self._free_index = {name: i for i, name in enumerate(self.free_names)}
 
     #Reinicia el generador
     def reset(self):
-        self.used_names = []
-        self.process_counter = 0
\ No newline at end of file
+        self.set_names([], self.PROCESS_NAMES)
+        self.process_counter = 0
+        self.arrivals = create_arrivals(self.arrival_spec, self.arrival_rng)
+        self.next_arrival_time = None
\ No newline at end of file
@@ -0,0 +1,393 @@
+"""
+Módulo de Grabación de Ejecuciones
+Graba cada ciclo de una ejecución como un flujo compacto de cambios (marcos que
+cambian de dueño y procesos que cambian de estado) con cuadros clave periódicos
+y un índice, para reconstruir el estado de cualquier instante sin volver a simular:
+se parte del cuadro clave anterior más cercano y se aplican los cambios
+
+Solo se revisan los marcos que el gestor anotó como cambiados desde el ciclo
+anterior, y con un máximo de ciclos se descartan los más antiguos de a un
+cuadro clave, así la grabación ocupa memoria acotada
+
+Las grabaciones se guardan con el mismo formato de arreglos empaquetados que los
+puntos de control
+"""
+import io
+from array import array
+from bisect import bisect_right
+
+from punto_control import STATE_CODES, _pack_strings, _read_array, _unpack_strings, _write_array
+
+# Ubicaciones de los marcos en el flujo de cambios
+RAM = 0
+SWAP = 1
+
+# Código de estado de un proceso que terminó
+TERMINATED = -1
+
+
+#Índices de marcos ordenados, o None si hay que revisar todos
+def _sorted_or_none(indices):
+    return None if indices is None else sorted(indices)
+
+
+class ReplayProcess:
+    """
+    Proceso reconstruido de una grabación (solo lo necesario para mostrarlo)
+    """
+
+    def __init__(self, pid, name, state):
+        self.pid = pid
+        self.name = name
+        self.state = state
+
+    def __str__(self):
+        return f"P{self.pid}({self.name})"
+
+
+class ReplayFrame:
+    """
+    Marco reconstruido de una grabación, con la misma interfaz de lectura que Frame
+    """
+
+    def __init__(self, frame_id, location, process=None, page_number=None):
+        self.frame_id = frame_id
+        self.location = location
+        self.process = process
+        self.page_number = page_number
+        self.is_free = process is None
+        self.sharers = []
+
+
+class ReplayState:
+    """
+    Estado de la memoria en un ciclo de una grabación
+    """
+
+    def __init__(self, step, time, ram_frames, swap_frames, processes, page_faults, swaps):
+        self.step = step
+        self.time = time
+        self.ram_frames = ram_frames
+        self.swap_frames = swap_frames
+        self.processes = processes
+        self.page_faults = page_faults
+        self.swaps = swaps
+
+    #Lista de procesos con las mismas claves que MemoryManager.get_process_list
+    def get_process_list(self):
+        pages = {}
+        for frame in self.ram_frames + self.swap_frames:
+            if not frame.is_free:
+                pages[frame.process.pid] = pages.get(frame.process.pid, 0) + 1
+        return [{'PID': p.pid, 'Nombre': p.name, 'Páginas': pages.get(p.pid, 0), 'Estado': p.state}
+                for p in self.processes]
+
+    #Estadísticas con las mismas claves que MemoryManager.get_statistics
+    def get_statistics(self):
+        def utilization(frames):
+            used = sum(1 for frame in frames if not frame.is_free)
+            return f"{used / len(frames) * 100:.2f}%" if frames else "0.00%"
+
+        return {
+            'Utilización RAM': utilization(self.ram_frames),
+            'Utilización SWAP': utilization(self.swap_frames),
+            'Procesos Activos': len(self.processes),
+            'Total Fallos de Página': self.page_faults,
+            'Total Intercambios (Swaps)': self.swaps,
+            'Algoritmo de Reemplazo': f"Grabación (t = {self.time:.1f}s)"
+        }
+
+
+class RunRecorder:
+    """
+    Grabación de una ejecución: cambios por ciclo, cuadros clave e índice de cuadros clave
+    """
+
+    MAGIC = b"SIMREC\x00\x00"
+    VERSION = 1
+
+    def __init__(self, memory_manager=None, keyframe_interval=100, max_cycles=0):
+        """
+        Inicializa una grabación vacía
+
+        Args:
+            memory_manager (MemoryManager): Gestor a grabar (None al cargar una grabación)
+            keyframe_interval (int): Ciclos entre cuadros clave
+            max_cycles (int): Ciclos que se conservan; al superarlos se descartan
+                              los más antiguos hasta el segundo cuadro clave (0 = sin límite)
+        """
+        self.memory_manager = memory_manager
+        self.keyframe_interval = keyframe_interval
+        self.max_cycles = max_cycles
+
+        # Ciclos descartados del principio de la grabación
+        self.dropped = 0
+
+        self.ram_size = len(memory_manager.ram_frames) if memory_manager else 0
+        self.swap_size = len(memory_manager.swap_frames) if memory_manager else 0
+
+        # Por ciclo: instante simulado, contadores y posición de sus cambios en los arreglos planos
+        self.times = array('d')
+        self.page_faults = array('q')
+        self.swaps = array('q')
+        self.frame_offsets = array('q', [0])
+        self.frame_deltas = array('i')          # ubicación, marco, pid (0 = libre), página
+        self.process_offsets = array('q', [0])
+        self.process_deltas = array('i')        # pid, código de estado (-1 = terminó)
+
+        # Nombres de los procesos vistos
+        self.names = {}
+
+        # Índice de cuadros clave: ciclo -> (dueños de RAM, dueños de SWAP, estados de procesos)
+        self.keyframe_steps = []
+        self.keyframes = []
+
+        # Estado al final del último ciclo grabado (pid y página intercalados por marco)
+        self._owners = [array('i', [0, -1] * self.ram_size), array('i', [0, -1] * self.swap_size)]
+        self._states = {}
+
+        # El gestor anota desde ahora los marcos que cambian; el primer ciclo los revisa todos
+        if memory_manager is not None:
+            memory_manager.track_frame_changes()
+
+    #Cantidad de ciclos grabados
+    def __len__(self):
+        return len(self.times)
+
+    #Graba los cambios de marcos de una ubicación en los índices indicados (None = todos)
+    def _capture_frames(self, location, frames, indices):
+        owners = self._owners[location]
+        deltas = self.frame_deltas
+        if indices is None:
+            indices = range(len(frames))
+        for index in indices:
+            frame = frames[index]
+            if frame.is_free:
+                pid, page = 0, -1
+            else:
+                pid, page = frame.process.pid, frame.page_number
+            if owners[2 * index] != pid or owners[2 * index + 1] != page:
+                owners[2 * index] = pid
+                owners[2 * index + 1] = page
+                deltas.extend((location, index, pid, page))
+
+    #Graba un ciclo: marcos que cambiaron de dueño y procesos que cambiaron de estado
+    def capture(self, sim_time):
+        memory_manager = self.memory_manager
+
+        # Marcos anotados desde el ciclo anterior (sin seguimiento se revisan todos)
+        changes = memory_manager.frame_changes or {'RAM': None, 'SWAP': None}
+        memory_manager.frame_changes = {'RAM': set(), 'SWAP': set()}
+        self._capture_frames(RAM, memory_manager.ram_frames, _sorted_or_none(changes['RAM']))
+        self._capture_frames(SWAP, memory_manager.swap_frames, _sorted_or_none(changes['SWAP']))
+        self.frame_offsets.append(len(self.frame_deltas))
+
+        seen = set()
+        for process in memory_manager.processes:
+            pid = process.pid
+            seen.add(pid)
+            code = STATE_CODES.index(process.state)
+            if self._states.get(pid) != code:
+                self._states[pid] = code
+                self.names.setdefault(pid, process.name)
+                self.process_deltas.extend((pid, code))
+        for pid in [pid for pid in self._states if pid not in seen]:
+            del self._states[pid]
+            self.process_deltas.extend((pid, TERMINATED))
+        self.process_offsets.append(len(self.process_deltas))
+
+        self.times.append(sim_time)
+        self.page_faults.append(memory_manager.total_page_faults)
+        self.swaps.append(memory_manager.total_swaps)
+
+        step = len(self.times) - 1
+        if step % self.keyframe_interval == 0:
+            self._add_keyframe(step)
+
+        if self.max_cycles and len(self.times) > self.max_cycles and len(self.keyframe_steps) > 1:
+            self._drop_oldest()
+
+    #Descarta los ciclos anteriores al segundo cuadro clave, que pasa a ser el primer ciclo
+    def _drop_oldest(self):
+        cut = self.keyframe_steps[1]
+        frame_base = self.frame_offsets[cut]
+        process_base = self.process_offsets[cut]
+
+        del self.times[:cut]
+        del self.page_faults[:cut]
+        del self.swaps[:cut]
+        del self.frame_deltas[:frame_base]
+        del self.process_deltas[:process_base]
+        self.frame_offsets = array('q', [offset - frame_base for offset in self.frame_offsets[cut:]])
+        self.process_offsets = array('q', [offset - process_base for offset in self.process_offsets[cut:]])
+
+        del self.keyframes[0]
+        del self.keyframe_steps[0]
+        self.keyframe_steps = [step - cut for step in self.keyframe_steps]
+        self.dropped += cut
+
+    #Guarda un cuadro clave con el estado actual
+    def _add_keyframe(self, step):
+        states = array('i')
+        for pid, code in self._states.items():
+            states.extend((pid, code))
+        self.keyframe_steps.append(step)
+        self.keyframes.append((array('i', self._owners[RAM]), array('i', self._owners[SWAP]), states))
+
+    #Guarda la grabación en un archivo
+    def save(self, path):
+        out = io.BytesIO()
+        out.write(self.MAGIC)
+        pids = sorted(self.names)
+        _write_array(out, array('i', [self.VERSION, self.keyframe_interval, self.ram_size, self.swap_size,
+                                      len(self.keyframes), len(pids)]))
+        for values in (self.times, self.page_faults, self.swaps, self.frame_offsets, self.frame_deltas,
+                       self.process_offsets, self.process_deltas):
+            _write_array(out, values)
+        _write_array(out, array('i', pids))
+        _write_array(out, _pack_strings([self.names[pid] for pid in pids]))
+        _write_array(out, array('q', self.keyframe_steps))
+        for keyframe in self.keyframes:
+            for values in keyframe:
+                _write_array(out, values)
+
+        with open(path, 'wb') as f:
+            f.write(out.getvalue())
+
+    #Carga una grabación guardada con save
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError("El archivo no es una grabación del simulador")
+
+        offset = len(cls.MAGIC)
+        header, offset = _read_array(data, offset)
+        version, keyframe_interval, ram_size, swap_size, keyframe_count, name_count = header
+        if version != cls.VERSION:
+            raise ValueError(f"Versión de grabación no soportada: {version}")
+
+        recording = cls(keyframe_interval=keyframe_interval)
+        recording.ram_size = ram_size
+        recording.swap_size = swap_size
+
+        fields = ('times', 'page_faults', 'swaps', 'frame_offsets', 'frame_deltas',
+                  'process_offsets', 'process_deltas')
+        for field in fields:
+            values, offset = _read_array(data, offset)
+            setattr(recording, field, values)
+
+        pids, offset = _read_array(data, offset)
+        names_blob, offset = _read_array(data, offset)
+        recording.names = dict(zip(pids, _unpack_strings(names_blob, name_count)))
+
+        steps, offset = _read_array(data, offset)
+        recording.keyframe_steps = list(steps)
+        for _ in range(keyframe_count):
+            keyframe = []
+            for _ in range(3):
+                values, offset = _read_array(data, offset)
+                keyframe.append(values)
+            recording.keyframes.append(tuple(keyframe))
+
+        return recording
+
+
+class Replayer:
+    """
+    Reproduce una grabación: reconstruye el estado de cualquier ciclo
+    Avanzar pocos ciclos aplica solo sus cambios; saltar lejos parte del cuadro clave más cercano
+    """
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.step = None
+        self._dropped = recording.dropped
+        self._owners = None
+        self._states = None
+
+    #Cantidad de ciclos de la grabación
+    def __len__(self):
+        return len(self.recording)
+
+    #Aplica los cambios de los ciclos first a last (inclusive)
+    def _apply(self, first, last):
+        recording = self.recording
+        deltas = recording.frame_deltas
+        for i in range(recording.frame_offsets[first], recording.frame_offsets[last + 1], 4):
+            location, index, pid, page = deltas[i:i + 4]
+            owners = self._owners[location]
+            owners[2 * index] = pid
+            owners[2 * index + 1] = page
+
+        deltas = recording.process_deltas
+        for i in range(recording.process_offsets[first], recording.process_offsets[last + 1], 2):
+            pid, code = deltas[i], deltas[i + 1]
+            if code == TERMINATED:
+                self._states.pop(pid, None)
+            else:
+                self._states[pid] = code
+
+    #Lleva el estado interno al ciclo step
+    def _seek(self, step):
+        recording = self.recording
+        position = bisect_right(recording.keyframe_steps, step) - 1
+        keyframe_step = recording.keyframe_steps[position]
+
+        # Si la grabación descartó ciclos, los índices del estado actual ya no valen
+        if self._dropped != recording.dropped:
+            self._dropped = recording.dropped
+            self.step = None
+
+        # Seguir desde el estado actual si está entre el cuadro clave y el destino
+        if self.step is not None and keyframe_step <= self.step <= step:
+            if self.step < step:
+                self._apply(self.step + 1, step)
+        else:
+            ram, swap, states = recording.keyframes[position]
+            self._owners = [array('i', ram), array('i', swap)]
+            self._states = {states[i]: states[i + 1] for i in range(0, len(states), 2)}
+            if keyframe_step < step:
+                self._apply(keyframe_step + 1, step)
+        self.step = step
+
+    #Reconstruye el estado del ciclo step
+    def state_at(self, step):
+        recording = self.recording
+        step = max(0, min(step, len(recording) - 1))
+        self._seek(step)
+
+        names = recording.names
+        processes = {pid: ReplayProcess(pid, names.get(pid, "?"), STATE_CODES[code])
+                     for pid, code in sorted(self._states.items())}
+        ghosts = {}
+
+        def build(location, owners, label):
+            frames = []
+            for index in range(len(owners) // 2):
+                pid = owners[2 * index]
+                if pid == 0:
+                    frames.append(ReplayFrame(index, label))
+                    continue
+                process = processes.get(pid)
+                if process is None:
+                    # Marco de un proceso ya terminado en este ciclo (se libera al siguiente)
+                    process = ghosts.setdefault(pid, ReplayProcess(pid, names.get(pid, "?"), "Terminado"))
+                frames.append(ReplayFrame(index, label, process, owners[2 * index + 1]))
+            return frames
+
+        return ReplayState(
+            step,
+            recording.times[step],
+            build(RAM, self._owners[RAM], 'RAM'),
+            build(SWAP, self._owners[SWAP], 'SWAP'),
+            list(processes.values()),
+            recording.page_faults[step],
+            recording.swaps[step]
+        )
+
+    #Ciclo cuyo instante simulado es el último menor o igual a sim_time
+    def step_at_time(self, sim_time):
+        return max(0, bisect_right(self.recording.times, sim_time) - 1)
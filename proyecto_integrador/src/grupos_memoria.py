@@ -0,0 +1,243 @@
+"""
+Módulo de Grupos de Memoria
+Grupos de procesos al estilo de los cgroups de Linux: cada grupo reúne procesos
+por nombre o por tipo de programa y tiene un límite duro y uno blando de marcos
+de RAM. Cada marco de RAM se cobra al grupo del proceso que lo cargó y entra en
+la lista de reclamo del grupo (orden LRU):
+- Un grupo que llega a su límite duro solo puede desalojar sus propias páginas
+- Con la RAM llena se desaloja primero del grupo que más excede su límite blando
+"""
+from collections import OrderedDict
+
+from generador_proceso import ProcessGenerator
+
+
+class MemoryGroup:
+    """
+    Grupo de procesos con límites de RAM, lista de reclamo y contabilidad propia
+    """
+
+    def __init__(self, name, members=(), hard_limit=0, soft_limit=0):
+        """
+        Inicializa un grupo
+
+        Args:
+            name (str): Nombre del grupo
+            members (iterable): Nombres o tipos de programa de sus procesos
+            hard_limit (int): Marcos de RAM que el grupo no puede superar (0 = sin límite)
+            soft_limit (int): Marcos a partir de los cuales se reclama primero de este grupo (0 = sin límite)
+        """
+        self.name = name
+        self.members = set(members)
+        self.hard_limit = hard_limit
+        self.soft_limit = soft_limit
+
+        # Marcos de RAM cobrados al grupo: marco -> instante de carga, en orden LRU
+        self.reclaim_list = OrderedDict()
+
+        # Contabilidad
+        self.evictions = 0
+        self.limit_evictions = 0
+        self.retired_faults = 0
+        self.peak_resident = 0
+
+    #Marcos de RAM cobrados al grupo
+    def resident(self):
+        return len(self.reclaim_list)
+
+    #Marcos por encima del límite blando (0 si no lo excede o no tiene)
+    def soft_excess(self):
+        return max(0, self.resident() - self.soft_limit) if self.soft_limit else 0
+
+    #Verifica si el grupo llegó a su límite duro
+    def at_hard_limit(self):
+        return bool(self.hard_limit) and self.resident() >= self.hard_limit
+
+    def __str__(self):
+        return f"Grupo {self.name}"
+
+
+class GroupController:
+    """
+    Controlador de grupos: resuelve el grupo de cada proceso, cobra los marcos
+    y elige víctimas según los límites
+    """
+
+    DEFAULT_GROUP = 'general'
+
+    def __init__(self, memory_manager, groups):
+        """
+        Inicializa el controlador
+
+        Args:
+            memory_manager (MemoryManager): Gestor de memoria dueño de los marcos
+            groups (list): MemoryGroup configurados; los procesos que no pertenecen
+                           a ninguno quedan en un grupo general sin límites
+        """
+        self.memory_manager = memory_manager
+        self.groups = list(groups)
+        self.default_group = MemoryGroup(self.DEFAULT_GROUP)
+        self.groups.append(self.default_group)
+
+        # Grupo de cada nombre o tipo de programa, y grupo al que se cobró cada marco
+        self.by_name = {group.name: group for group in self.groups}
+        self.by_member = {member: group for group in self.groups for member in group.members}
+        self.frame_group = {}
+        self._name_cache = {}
+
+    #Grupo de un proceso: el heredado del padre si es un hijo de fork, si no por su nombre
+    #o por su tipo de programa
+    def group_of(self, process):
+        if process.memory_group is not None:
+            group = self.by_name.get(process.memory_group)
+            if group is not None:
+                return group
+        name = process.name
+        group = self._name_cache.get(name)
+        if group is None:
+            group = self.by_member.get(name)
+            if group is None:
+                group = self.by_member.get(ProcessGenerator.PROCESS_TYPES.get(name), self.default_group)
+            self._name_cache[name] = group
+        return group
+
+    #Cobra un marco recién cargado al grupo de su proceso
+    def charge(self, frame):
+        self.uncharge(frame.frame_id)
+        group = self.group_of(frame.process)
+        group.reclaim_list[frame.frame_id] = frame.load_time
+        # Un marco que pasa el límite duro se compensa enseguida desalojando otro del grupo
+        if not group.hard_limit or group.resident() <= group.hard_limit:
+            group.peak_resident = max(group.peak_resident, group.resident())
+        self.frame_group[frame.frame_id] = group
+        return group
+
+    #Vuelve a cobrar todos los marcos ocupados de RAM (por ejemplo tras restaurar un punto de control)
+    def recharge(self):
+        for group in self.groups:
+            group.reclaim_list.clear()
+        self.frame_group.clear()
+        occupied = [frame for frame in self.memory_manager.ram_frames if not frame.is_free]
+        for frame in sorted(occupied, key=lambda f: f.last_access):
+            self.charge(frame)
+
+    #Obtiene el estado de los grupos: (contadores de cada grupo, lista de reclamo de cada grupo
+    #como filas (marco, instante de carga, 0)), en el orden de self.groups
+    def get_state(self):
+        scalars = []
+        queues = []
+        for group in self.groups:
+            scalars.extend([group.evictions, group.limit_evictions, group.retired_faults, group.peak_resident])
+            queues.append([(frame_id, stamp, 0) for frame_id, stamp in group.reclaim_list.items()])
+        return scalars, queues
+
+    #Restaura un estado obtenido con get_state; con otros grupos configurados solo se recobran los marcos
+    def set_state(self, scalars, queues):
+        if len(queues) != len(self.groups):
+            self.recharge()
+            return
+        self.frame_group.clear()
+        for i, (group, queue) in enumerate(zip(self.groups, queues)):
+            group.evictions, group.limit_evictions, group.retired_faults, group.peak_resident = (
+                int(value) for value in scalars[4 * i:4 * i + 4])
+            group.reclaim_list = OrderedDict((frame_id, stamp) for frame_id, stamp, _ in queue)
+            for frame_id in group.reclaim_list:
+                self.frame_group[frame_id] = group
+
+    #Un acceso a un marco lo pasa al final de la lista de reclamo de su grupo
+    def touch(self, frame):
+        group = self.frame_group.get(frame.frame_id)
+        if group is None or group.reclaim_list.get(frame.frame_id) != frame.load_time:
+            self.charge(frame)
+        else:
+            group.reclaim_list.move_to_end(frame.frame_id)
+
+    #Verifica si el grupo de un proceso puede recibir count marcos más sin pasar su límite duro
+    def has_room(self, process, count):
+        group = self.group_of(process)
+        return not group.hard_limit or group.resident() + count <= group.hard_limit
+
+    #Descuenta un marco desalojado de RAM
+    def evicted(self, frame_id):
+        group = self.uncharge(frame_id)
+        if group is not None:
+            group.evictions += 1
+
+    #Descuenta un marco liberado; retorna el grupo al que estaba cobrado
+    def uncharge(self, frame_id):
+        group = self.frame_group.pop(frame_id, None)
+        if group is not None:
+            group.reclaim_list.pop(frame_id, None)
+        return group
+
+    #Conserva los fallos de un proceso que termina en la contabilidad de su grupo
+    def retire(self, process):
+        self.group_of(process).retired_faults += process.page_faults
+
+    #Marco más antiguo (LRU) de la lista de reclamo de un grupo, sin contar exclude
+    def _oldest_frame(self, group, exclude=None):
+        frames = self.memory_manager.ram_frames
+        stale = []
+        victim = None
+        for frame_id, stamp in group.reclaim_list.items():
+            frame = frames[frame_id]
+            if frame.is_free or frame.load_time != stamp:
+                stale.append(frame_id)
+            elif frame is not exclude:
+                victim = frame
+                break
+        for frame_id in stale:
+            self.uncharge(frame_id)
+        return victim
+
+    #Víctima según los grupos (None si ninguno está sobre sus límites):
+    #primero el propio grupo de process si llegó a su límite duro, luego el que más excede su límite blando
+    def select_victim(self, process=None):
+        if process is not None:
+            group = self.group_of(process)
+            if group.at_hard_limit():
+                victim = self._oldest_frame(group)
+                if victim is not None:
+                    group.limit_evictions += 1
+                    return victim
+
+        over_soft = [group for group in self.groups if group.soft_excess() > 0]
+        for group in sorted(over_soft, key=lambda g: g.soft_excess(), reverse=True):
+            victim = self._oldest_frame(group)
+            if victim is not None:
+                group.limit_evictions += 1
+                return victim
+        return None
+
+    #Víctima del propio grupo cuando un marco recién cargado lo dejó sobre su límite duro
+    def select_over_limit(self, frame):
+        group = self.frame_group.get(frame.frame_id)
+        if group is None or not group.hard_limit or group.resident() <= group.hard_limit:
+            return None
+        victim = self._oldest_frame(group, exclude=frame)
+        if victim is not None:
+            group.limit_evictions += 1
+        return victim
+
+    #Páginas en SWAP y fallos de página de los procesos vivos de cada grupo
+    def _usage(self):
+        usage = {group.name: [0, group.retired_faults] for group in self.groups}
+        for process in self.memory_manager.processes:
+            counts = usage[self.group_of(process).name]
+            if process.page_table:
+                counts[0] += process.page_table.count_pages_in_swap()
+            counts[1] += process.page_faults
+        return usage
+
+    #Obtiene las estadísticas de cada grupo
+    def get_statistics(self):
+        usage = self._usage()
+        stats = {}
+        for group in self.groups:
+            swapped, faults = usage[group.name]
+            limits = f"{group.hard_limit or '∞'}/{group.soft_limit or '∞'}"
+            stats[f"Grupo {group.name}"] = (
+                f"RAM {group.resident()} (pico {group.peak_resident}, límites {limits}), SWAP {swapped}, "
+                f"fallos {faults}, desalojos {group.evictions} ({group.limit_evictions} por límite)"
+            )
+        return stats
@@ -0,0 +1,179 @@
+"""
+Módulo de Instrumentación
+Temporizadores en nanosegundos (perf_counter_ns) y contadores de llamadas
+sobre las rutas críticas del gestor de memoria, con exportación periódica
+en formato de texto de Prometheus o JSON lines
+
+Cuando está deshabilitada no hay envoltorios instalados, por lo que el costo es nulo
+"""
+import json
+import os
+import time
+from functools import wraps
+
+from metricas import LogHistogram
+
+
+class TimerStat:
+    """
+    Estadísticas acumuladas de una ruta instrumentada
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = LogHistogram()
+
+    #Registra una llamada con su duración en nanosegundos
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram.add(elapsed_ns)
+
+    #Obtiene un resumen de la ruta
+    def get_info(self):
+        return {
+            'calls': self.calls,
+            'total_ns': self.total_ns,
+            'mean_ns': self.total_ns / self.calls if self.calls else 0.0,
+            'p99_ns': self.histogram.percentile(99),
+            'max_ns': self.max_ns
+        }
+
+
+class Instrumentation:
+    """
+    Instrumenta las rutas críticas de un MemoryManager
+    Los envoltorios se instalan como atributos de la instancia al habilitar
+    y se retiran al deshabilitar
+    """
+
+    #Inicializa la instrumentación (deshabilitada) para un gestor de memoria
+    def __init__(self, memory_manager):
+        self.memory_manager = memory_manager
+        self.enabled = False
+        self.stats = {}
+        self._wrapped = []
+
+    #Rutas instrumentadas: (nombre, objeto dueño del método)
+    def _hot_paths(self):
+        manager = self.memory_manager
+        return [
+            ('simulate_page_access', manager),
+            ('_allocate_process', manager),
+            ('try_bring_swapped_pages_to_ram', manager),
+            ('reclaim_frames', manager),
+            ('select_victim', manager.replacement_algorithm),
+        ]
+
+    #Crea el envoltorio temporizado de un método
+    def _timed(self, name, method):
+        stat = self.stats.setdefault(name, TimerStat())
+        clock = time.perf_counter_ns
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stat.record(clock() - start)
+
+        return wrapper
+
+    #Habilita la instrumentación instalando los envoltorios
+    def enable(self):
+        if self.enabled:
+            return
+        for name, owner in self._hot_paths():
+            setattr(owner, name, self._timed(name, getattr(owner, name)))
+            self._wrapped.append((name, owner))
+        self.enabled = True
+
+    #Deshabilita la instrumentación retirando los envoltorios
+    def disable(self):
+        for name, owner in self._wrapped:
+            if name in vars(owner):
+                delattr(owner, name)
+        self._wrapped = []
+        self.enabled = False
+
+    #Reinicia los contadores
+    def reset(self):
+        for name in self.stats:
+            self.stats[name] = TimerStat()
+        if self.enabled:
+            self.disable()
+            self.enable()
+
+    #Obtiene el resumen de todas las rutas
+    def get_stats(self):
+        return {name: stat.get_info() for name, stat in self.stats.items()}
+
+    #Exporta los contadores en formato de texto de Prometheus
+    def to_prometheus(self):
+        lines = [
+            "# HELP simulador_calls_total Llamadas a rutas criticas del gestor de memoria",
+            "# TYPE simulador_calls_total counter",
+        ]
+        for name, stat in self.stats.items():
+            lines.append(f'simulador_calls_total{{path="{name}"}} {stat.calls}')
+
+        lines.append("# HELP simulador_duration_ns_total Tiempo acumulado en nanosegundos")
+        lines.append("# TYPE simulador_duration_ns_total counter")
+        for name, stat in self.stats.items():
+            lines.append(f'simulador_duration_ns_total{{path="{name}"}} {stat.total_ns}')
+
+        lines.append("# HELP simulador_duration_ns_max Llamada mas lenta en nanosegundos")
+        lines.append("# TYPE simulador_duration_ns_max gauge")
+        for name, stat in self.stats.items():
+            lines.append(f'simulador_duration_ns_max{{path="{name}"}} {stat.max_ns}')
+
+        return "\n".join(lines) + "\n"
+
+    #Exporta los contadores como una línea JSON
+    def to_json_line(self):
+        return json.dumps({'time': time.time(), 'paths': self.get_stats()}, sort_keys=True)
+
+
+class MetricsExporter:
+    """
+    Exporta periódicamente la instrumentación a un archivo local
+    En formato prometheus el archivo se reemplaza completo (estilo textfile collector);
+    en formato json se agrega una línea por exportación
+    """
+
+    FORMATS = ('prometheus', 'json')
+
+    def __init__(self, instrumentation, path, fmt='prometheus', interval=10.0):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Formato de exportación desconocido: {fmt}")
+        self.instrumentation = instrumentation
+        self.path = path
+        self.format = fmt
+        self.interval = interval
+        self.last_export = None
+
+    #Exporta si ya pasó el intervalo desde la última exportación
+    def maybe_export(self, now=None):
+        if now is None:
+            now = time.monotonic()
+        if self.last_export is not None and now - self.last_export < self.interval:
+            return False
+        self.export()
+        self.last_export = now
+        return True
+
+    #Escribe la exportación en el archivo
+    def export(self):
+        if self.format == 'prometheus':
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.instrumentation.to_prometheus())
+            os.replace(tmp_path, self.path)
+        else:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(self.instrumentation.to_json_line() + "\n")
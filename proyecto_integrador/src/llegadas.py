@@ -0,0 +1,312 @@
+"""
+Módulo de Llegadas
+Procesos de llegada (uniforme, Poisson, ráfagas, ciclo diurno o traza leída de
+un archivo) y distribuciones de tamaño de los procesos. Los intervalos entre
+llegadas se generan en lotes; si NumPy está disponible se vectoriza el lote
+
+Cada lote se siembra desde el flujo de llegadas de la simulación, así que el
+estado completo de un proceso de llegada son sus campos de estado más el resto
+de su lote actual
+"""
+import csv
+import math
+
+from patron_acceso import _numpy
+
+
+class ArrivalProcess:
+    """
+    Llegadas base: intervalos uniformes entre min_interval y max_interval
+    Mantiene un lote de intervalos que se rellena cuando se agota
+    """
+
+    name = 'uniforme'
+
+    # Número de intervalos generados en cada lote
+    BATCH_SIZE = 1024
+
+    # Atributos que, junto con el lote pendiente, forman el estado del proceso de llegadas
+    STATE_FIELDS = ()
+
+    def __init__(self, rng, min_interval=1.0, max_interval=3.0):
+        self.rng = rng
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._batch = []
+        self._batch_pos = 0
+
+    #Generador de NumPy nuevo para cada lote, sembrado desde el flujo de llegadas
+    def _numpy_rng(self):
+        return _numpy().random.default_rng(self.rng.getrandbits(64))
+
+    #Genera un lote de intervalos de una sola vez
+    def generate_batch(self, count):
+        np = _numpy()
+        if np is not None:
+            return self._numpy_rng().uniform(self.min_interval, self.max_interval, count).tolist()
+        uniform = self.rng.uniform
+        return [uniform(self.min_interval, self.max_interval) for _ in range(count)]
+
+    #Tamaño impuesto por la llegada (solo las trazas lo traen)
+    def next_size(self):
+        return None
+
+    #Retorna el intervalo hasta la siguiente llegada, rellenando el lote si se agotó
+    def next_interval(self):
+        if self._batch_pos >= len(self._batch):
+            self._batch = self.generate_batch(self.BATCH_SIZE)
+            self._batch_pos = 0
+        interval = self._batch[self._batch_pos]
+        self._batch_pos += 1
+        return interval
+
+    #Campos de estado seguidos de los intervalos pendientes del lote (para puntos de control)
+    def get_state(self):
+        return [float(getattr(self, field)) for field in self.STATE_FIELDS] + self._batch[self._batch_pos:]
+
+    #Restaura el estado guardado con get_state
+    def set_state(self, state):
+        state = list(state)
+        for field, value in zip(self.STATE_FIELDS, state):
+            setattr(self, field, type(getattr(self, field))(value))
+        self._batch = state[len(self.STATE_FIELDS):]
+        self._batch_pos = 0
+
+    def __str__(self):
+        return f"Llegadas {self.name}"
+
+
+class PoissonArrivals(ArrivalProcess):
+    """
+    Proceso de Poisson: intervalos exponenciales con media 1 / rate
+    """
+
+    name = 'poisson'
+
+    def __init__(self, rng, rate=1.0):
+        super().__init__(rng)
+        if rate <= 0:
+            raise ValueError("La tasa de llegadas debe ser positiva")
+        self.rate = rate
+
+    def generate_batch(self, count):
+        np = _numpy()
+        if np is not None:
+            return self._numpy_rng().exponential(1.0 / self.rate, count).tolist()
+        expovariate = self.rng.expovariate
+        return [expovariate(self.rate) for _ in range(count)]
+
+
+class BurstyArrivals(ArrivalProcess):
+    """
+    Ráfagas: alterna períodos tranquilos (tasa rate) y ráfagas (tasa burst_rate)
+    de duración exponencial (proceso de Poisson modulado por una cadena de dos estados)
+    """
+
+    name = 'rafagas'
+
+    STATE_FIELDS = ('in_burst', 'phase_left')
+
+    def __init__(self, rng, rate=0.5, burst_rate=20.0, mean_quiet=30.0, mean_burst=3.0):
+        super().__init__(rng)
+        if rate <= 0 or burst_rate <= 0:
+            raise ValueError("Las tasas de llegadas deben ser positivas")
+        self.rate = rate
+        self.burst_rate = burst_rate
+        self.mean_quiet = mean_quiet
+        self.mean_burst = mean_burst
+        self.in_burst = False
+        self.phase_left = rng.expovariate(1.0) * mean_quiet
+
+    def generate_batch(self, count):
+        np = _numpy()
+        if np is not None:
+            generator = self._numpy_rng()
+            gaps = generator.exponential(1.0, count).tolist()
+            phases = generator.exponential(1.0, count).tolist()
+        else:
+            gaps = [self.rng.expovariate(1.0) for _ in range(count)]
+            phases = [self.rng.expovariate(1.0) for _ in range(count)]
+
+        # Recorrer el lote: el intervalo se alarga con las fases que atraviesa
+        batch = []
+        phase_index = 0
+        for gap in gaps:
+            interval = 0.0
+            while True:
+                rate = self.burst_rate if self.in_burst else self.rate
+                wait = gap / rate
+                if wait <= self.phase_left:
+                    self.phase_left -= wait
+                    interval += wait
+                    break
+                # La fase termina antes de la llegada: se consume lo que queda y se cambia de estado
+                interval += self.phase_left
+                gap -= self.phase_left * rate
+                self.in_burst = not self.in_burst
+                mean = self.mean_burst if self.in_burst else self.mean_quiet
+                self.phase_left = phases[phase_index % count] * mean
+                phase_index += 1
+            batch.append(interval)
+        return batch
+
+
+class DiurnalArrivals(ArrivalProcess):
+    """
+    Ciclo diurno: Poisson no homogéneo con tasa rate * (1 + amplitude * sin(2πt / period)),
+    generado por adelgazamiento (thinning) sobre la tasa máxima
+    """
+
+    name = 'diurna'
+
+    STATE_FIELDS = ('time', 'last_arrival')
+
+    def __init__(self, rng, rate=1.0, amplitude=0.8, period=600.0):
+        super().__init__(rng)
+        if rate <= 0 or not 0 <= amplitude <= 1:
+            raise ValueError("La tasa debe ser positiva y la amplitud estar entre 0 y 1")
+        self.rate = rate
+        self.amplitude = amplitude
+        self.period = period
+        self.time = 0.0
+        self.last_arrival = 0.0
+
+    def generate_batch(self, count):
+        max_rate = self.rate * (1 + self.amplitude)
+        batch = []
+
+        while len(batch) < count:
+            np = _numpy()
+            if np is not None:
+                generator = self._numpy_rng()
+                gaps = generator.exponential(1.0 / max_rate, count)
+                times = self.time + np.cumsum(gaps)
+                accept = generator.random(count) * max_rate < \
+                    self.rate * (1 + self.amplitude * np.sin(2 * math.pi * times / self.period))
+                accepted = times[accept].tolist()
+                self.time = float(times[-1])
+            else:
+                accepted = []
+                for _ in range(count):
+                    self.time += self.rng.expovariate(max_rate)
+                    rate = self.rate * (1 + self.amplitude * math.sin(2 * math.pi * self.time / self.period))
+                    if self.rng.random() * max_rate < rate:
+                        accepted.append(self.time)
+
+            for arrival in accepted:
+                batch.append(arrival - self.last_arrival)
+                self.last_arrival = arrival
+
+        return batch
+
+
+class TraceArrivals(ArrivalProcess):
+    """
+    Traza: llegadas leídas de un CSV con columnas tiempo (segundos absolutos)
+    y, opcionalmente, tamaño (KB). Al agotarse la traza no hay más llegadas
+    """
+
+    name = 'traza'
+
+    STATE_FIELDS = ('_position',)
+
+    def __init__(self, rng, path, loop=False):
+        super().__init__(rng)
+        self.path = path
+        self.loop = loop
+        self.times = []
+        self.sizes = []
+        self._position = 0
+        self._size = None
+
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                self.times.append(float(row['tiempo']))
+                size = row.get('tamaño') or row.get('tamano')
+                self.sizes.append(int(size) if size else None)
+
+        if not self.times:
+            raise ValueError(f"La traza de llegadas está vacía: {path}")
+
+    #Las trazas no se generan por lotes: se recorren en orden
+    def next_interval(self):
+        if self._position >= len(self.times):
+            if not self.loop:
+                self._size = None
+                return math.inf
+            self._position = 0
+
+        previous = self.times[self._position - 1] if self._position > 0 else 0.0
+        interval = max(0.0, self.times[self._position] - previous)
+        self._size = self.sizes[self._position]
+        self._position += 1
+        return interval
+
+    def next_size(self):
+        return self._size
+
+
+# Procesos de llegada disponibles por nombre
+ARRIVALS = {
+    ArrivalProcess.name: ArrivalProcess,
+    PoissonArrivals.name: PoissonArrivals,
+    BurstyArrivals.name: BurstyArrivals,
+    DiurnalArrivals.name: DiurnalArrivals,
+    TraceArrivals.name: TraceArrivals,
+}
+
+
+#Crea un proceso de llegadas a partir de una especificación {'tipo': ..., parámetros}
+def create_arrivals(spec, rng):
+    params = dict(spec)
+    arrival_type = params.pop('tipo', ArrivalProcess.name)
+
+    if arrival_type not in ARRIVALS:
+        raise ValueError(f"Proceso de llegadas desconocido: {arrival_type}")
+
+    return ARRIVALS[arrival_type](rng, **params)
+
+
+class SizeDistribution:
+    """
+    Distribución de tamaños de proceso en KB, acotada a [min_size, max_size]
+
+    mixta: 70% pequeños (min_size a min_size + 300) y 30% medianos/grandes
+    uniforme: uniforme en todo el rango
+    lognormal: mediana median y dispersión sigma
+    pareto: cola pesada con exponente alpha a partir de min_size
+    """
+
+    TYPES = ('mixta', 'uniforme', 'lognormal', 'pareto')
+
+    def __init__(self, rng, min_size=200, max_size=1000, tipo='mixta', median=None, sigma=0.6, alpha=1.5):
+        if tipo not in self.TYPES:
+            raise ValueError(f"Distribución de tamaños desconocida: {tipo}")
+
+        self.rng = rng
+        self.min_size = min_size
+        self.max_size = max_size
+        self.type = tipo
+        self.median = median if median is not None else (min_size + max_size) / 2
+        self.sigma = sigma
+        self.alpha = alpha
+
+    #Genera el tamaño de un proceso
+    def sample(self):
+        rng = self.rng
+
+        if self.type == 'mixta':
+            # La mayoría de procesos son pequeños, algunos son grandes
+            if rng.random() < 0.7:
+                return rng.randint(self.min_size, self.min_size + 300)
+            return rng.randint(self.min_size + 300, self.max_size)
+
+        if self.type == 'uniforme':
+            return rng.randint(self.min_size, self.max_size)
+
+        if self.type == 'lognormal':
+            size = rng.lognormvariate(math.log(self.median), self.sigma)
+        else:
+            size = self.min_size * rng.paretovariate(self.alpha)
+
+        return int(min(max(size, self.min_size), self.max_size))
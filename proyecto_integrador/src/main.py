@@ -1,8 +1,10 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, scrolledtext, filedialog, messagebox
 from config import Config
 from administrador_memoria import MemoryManager
 from controlador_simulador import SimulationController
+from mapa_calor import MemoryHeatmap
+from grabacion import Replayer, RunRecorder
 
 class MemorySimulatorGUI:
     """
@@ -17,6 +19,9 @@ class MemorySimulatorGUI:
         "#F8B739", "#52B788", "#E76F51", "#2A9D8F",
         "#E9C46A", "#F4A261", "#E76F51", "#264653"
     ]
+
+    # A partir de esta cantidad de marcos se dibuja por defecto el mapa de bits
+    HEATMAP_THRESHOLD = 256
     #Inicializa la interfaz gráfica
 
     def __init__(self, root):
@@ -29,6 +34,12 @@ class MemorySimulatorGUI:
         self.config = Config()
         self.memory_manager = MemoryManager(self.config)
         self.simulation = SimulationController(self.memory_manager, self.update_display)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # La grabación para la línea de tiempo es opcional ([Recording] enabled o la casilla Grabar)
+        self.replay = None
+        self.replay_state = None
+        self.playing = False
         
         # Mapeo de procesos a colores
         self.process_colors = {}
@@ -142,7 +153,66 @@ class MemorySimulatorGUI:
         
         self.speed_label = tk.Label(speed_frame, text="1.0x", bg="white", font=("Arial", 9, "bold"))
         self.speed_label.pack(side=tk.LEFT, padx=5)
+
+        # Mapa de bits (un píxel por marco, rueda del mouse para acercar) para memorias grandes
+        num_frames = max(len(self.memory_manager.ram_frames), len(self.memory_manager.swap_frames))
+        self.heatmap_var = tk.BooleanVar(value=num_frames > self.HEATMAP_THRESHOLD)
+        tk.Checkbutton(
+            speed_frame,
+            text="Mapa de bits",
+            variable=self.heatmap_var,
+            command=self.update_display,
+            bg="white",
+            font=("Arial", 9)
+        ).pack(side=tk.LEFT, padx=15)
         
+        # - LÍNEA DE TIEMPO -
+        timeline_frame = tk.LabelFrame(
+            main_frame,
+            text=" Línea de Tiempo ",
+            font=("Arial", 10, "bold"),
+            bg="white",
+            relief=tk.RIDGE,
+            borderwidth=2
+        )
+        timeline_frame.pack(fill=tk.X, pady=(0, 10))
+
+        self.recording_var = tk.BooleanVar(value=self.simulation.recorder is not None)
+        tk.Checkbutton(timeline_frame, text="Grabar", variable=self.recording_var, command=self.toggle_recording,
+                       bg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=5, pady=5)
+        tk.Button(timeline_frame, text="⏮ Revisar Ejecución", command=self.review_run,
+                  font=("Arial", 9), cursor="hand2").pack(side=tk.LEFT, padx=5, pady=5)
+        tk.Button(timeline_frame, text="Abrir Grabación", command=self.open_recording,
+                  font=("Arial", 9), cursor="hand2").pack(side=tk.LEFT, padx=5, pady=5)
+
+        self.btn_play = tk.Button(timeline_frame, text="▶", command=self.toggle_playback, width=3,
+                                  font=("Arial", 9, "bold"), cursor="hand2", state=tk.DISABLED)
+        self.btn_play.pack(side=tk.LEFT, padx=5, pady=5)
+
+        self.btn_live = tk.Button(timeline_frame, text="En Vivo", command=self.exit_replay,
+                                  font=("Arial", 9), cursor="hand2", state=tk.DISABLED)
+        self.btn_live.pack(side=tk.LEFT, padx=5, pady=5)
+
+        self.timeline_scale = tk.Scale(
+            timeline_frame,
+            from_=0,
+            to=0,
+            orient=tk.HORIZONTAL,
+            command=self.seek_replay,
+            showvalue=False,
+            bg="white",
+            state=tk.DISABLED
+        )
+        self.timeline_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        self.timeline_label = tk.Label(timeline_frame, text="En vivo", bg="white", font=("Arial", 9, "bold"), width=16)
+        self.timeline_label.pack(side=tk.LEFT, padx=5)
+
+        tk.Label(timeline_frame, text="Ciclos/cuadro:", bg="white", font=("Arial", 9)).pack(side=tk.LEFT)
+        self.replay_speed_var = tk.IntVar(value=1)
+        tk.Spinbox(timeline_frame, from_=1, to=500, width=4, textvariable=self.replay_speed_var).pack(
+            side=tk.LEFT, padx=(0, 10))
+
         # - CONTENIDO PRINCIPAL -
         content_frame = tk.Frame(main_frame, bg="#f0f0f0")
         content_frame.pack(fill=tk.BOTH, expand=True)
@@ -178,6 +248,9 @@ class MemorySimulatorGUI:
         
         self.swap_canvas = tk.Canvas(self.swap_frame, bg="white", highlightthickness=0)
         self.swap_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        self.ram_heatmap = MemoryHeatmap(self.ram_canvas, self.get_process_color)
+        self.swap_heatmap = MemoryHeatmap(self.swap_canvas, self.get_process_color)
         
         # Frame derecho (Procesos y Log)
         right_frame = tk.Frame(content_frame, bg="#f0f0f0", width=350)
@@ -331,14 +404,19 @@ class MemorySimulatorGUI:
         self.updating = True
         
         try:
-            # Actualizar visualización de RAM
-            self.draw_memory(self.ram_canvas, self.memory_manager.ram_frames, "RAM")
-            
-            # Actualizar visualización de SWAP
-            self.draw_memory(self.swap_canvas, self.memory_manager.swap_frames, "SWAP")
+            # Fuente del estado: la simulación en vivo o el ciclo elegido de la grabación
+            source = self.replay_state if self.replay_state is not None else self.memory_manager
+
+            # Actualizar visualización de RAM y SWAP (mapa de bits o un rectángulo por marco)
+            if self.heatmap_var.get():
+                self.ram_heatmap.render(source.ram_frames)
+                self.swap_heatmap.render(source.swap_frames)
+            else:
+                self.draw_memory(self.ram_canvas, source.ram_frames, "RAM")
+                self.draw_memory(self.swap_canvas, source.swap_frames, "SWAP")
             
             # Actualizar estadísticas
-            stats = self.memory_manager.get_statistics()
+            stats = source.get_statistics()
             self.stats_text.config(state=tk.NORMAL)
             self.stats_text.delete(1.0, tk.END)
             
@@ -355,7 +433,7 @@ class MemorySimulatorGUI:
             
             # Actualizar lista de procesos
             self.process_tree.delete(*self.process_tree.get_children())
-            for proc_info in self.memory_manager.get_process_list():
+            for proc_info in source.get_process_list():
                 self.process_tree.insert(
                     "",
                     tk.END,
@@ -367,8 +445,8 @@ class MemorySimulatorGUI:
                     )
                 )
             
-            # Actualizar log (solo los últimos 5 eventos)
-            events = self.memory_manager.get_event_log(last_n=5)
+            # Actualizar log (solo los últimos 5 eventos, no durante la reproducción)
+            events = self.memory_manager.get_event_log(last_n=5) if self.replay is None else []
             for event in events[-5:]:
                 event_text = f"[{event['timestamp']}] {event['message']}\n"
                 self.log_text.insert(tk.END, event_text, event['type'])
@@ -413,6 +491,106 @@ class MemorySimulatorGUI:
         self.color_index = 0
         self.update_display()
 
+    #Detiene la simulación (escribiendo los eventos pendientes) y cierra la ventana
+    def on_close(self):
+        self.simulation.stop()
+        self.root.destroy()
+
+    #Activa o desactiva la grabación de la ejecución en vivo
+    def toggle_recording(self):
+        if self.recording_var.get():
+            self.simulation.enable_recording(self.config.recording_keyframe_interval,
+                                             self.config.recording_max_cycles)
+            return
+        if self.replay is not None and self.replay.recording is self.simulation.recorder:
+            self.exit_replay()
+        self.simulation.disable_recording()
+
+    #Revisa la ejecución actual con la línea de tiempo
+    def review_run(self):
+        recorder = self.simulation.recorder
+        if recorder is None:
+            messagebox.showinfo("Línea de Tiempo", "La grabación está desactivada: marque Grabar para revisar la ejecución")
+            return
+        if len(recorder) == 0:
+            messagebox.showinfo("Línea de Tiempo", "Todavía no hay ciclos grabados")
+            return
+        self.enter_replay(recorder)
+
+    #Abre una grabación guardada para reproducirla
+    def open_recording(self):
+        path = filedialog.askopenfilename(title="Abrir grabación")
+        if not path:
+            return
+        try:
+            recording = RunRecorder.load(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Línea de Tiempo", f"No se pudo abrir la grabación: {e}")
+            return
+        if len(recording) == 0:
+            messagebox.showinfo("Línea de Tiempo", "La grabación está vacía")
+            return
+        self.enter_replay(recording)
+
+    #Pasa al modo de reproducción de una grabación (la simulación en vivo se pausa)
+    def enter_replay(self, recording):
+        if self.simulation.running and not self.simulation.paused:
+            self.pause_simulation()
+
+        self.replay = Replayer(recording)
+        self.timeline_scale.config(state=tk.NORMAL, to=len(self.replay) - 1)
+        self.btn_play.config(state=tk.NORMAL)
+        self.btn_live.config(state=tk.NORMAL)
+        self.timeline_scale.set(len(self.replay) - 1)
+        self.seek_replay(len(self.replay) - 1)
+
+    #Muestra el ciclo elegido en la línea de tiempo
+    def seek_replay(self, value):
+        if self.replay is None:
+            return
+        self.replay_state = self.replay.state_at(int(float(value)))
+        self.timeline_label.config(
+            text=f"Ciclo {self.replay.recording.dropped + self.replay_state.step} · {self.replay_state.time:.1f}s"
+        )
+        self.update_display()
+
+    #Inicia o detiene la reproducción automática
+    def toggle_playback(self):
+        self.playing = not self.playing
+        self.btn_play.config(text="⏸" if self.playing else "▶")
+        if self.playing:
+            if self.replay_state.step >= len(self.replay) - 1:
+                self.timeline_scale.set(0)
+                self.seek_replay(0)
+            self.play_tick()
+
+    #Avanza la reproducción; cada cuadro salta los ciclos elegidos
+    def play_tick(self):
+        if not self.playing or self.replay is None:
+            return
+        try:
+            speed = max(1, self.replay_speed_var.get())
+        except tk.TclError:
+            speed = 1
+        step = min(self.replay_state.step + speed, len(self.replay) - 1)
+        self.timeline_scale.set(step)
+        self.seek_replay(step)
+        if step >= len(self.replay) - 1:
+            self.toggle_playback()
+            return
+        self.root.after(100, self.play_tick)
+
+    #Vuelve a mostrar la simulación en vivo
+    def exit_replay(self):
+        self.playing = False
+        self.btn_play.config(text="▶", state=tk.DISABLED)
+        self.btn_live.config(state=tk.DISABLED)
+        self.timeline_scale.config(state=tk.DISABLED)
+        self.timeline_label.config(text="En vivo")
+        self.replay = None
+        self.replay_state = None
+        self.update_display()
+
     #Cambia la velocidad de la simulación
     def change_speed(self, value):
         speed = float(value)
@@ -0,0 +1,183 @@
+"""
+Módulo de Mapa de Calor
+Dibuja el mapa marco -> proceso de la RAM o del SWAP en una sola imagen
+(tk.PhotoImage) con un píxel por marco, en lugar de un rectángulo y un texto
+por marco, para que memorias de cientos de miles de marcos se redibujen rápido
+
+La imagen base tiene un píxel por marco; solo se vuelven a escribir las filas
+que cambiaron desde el último dibujo (una escritura por fila) y el acercamiento
+se hace con la copia ampliada de Tk, sin recorrer los píxeles en Python
+"""
+import tkinter as tk
+
+
+#Fila de la imagen en el formato de PhotoImage.put a partir de sus colores
+def encode_row(colors):
+    return "{" + " ".join(colors) + "}"
+
+
+class MemoryHeatmap:
+    """
+    Mapa de bits de marcos sobre un Canvas, con acercamiento y descripción al pasar el mouse
+    """
+
+    FREE_COLOR = "#E8E8E8"
+
+    # Rango del acercamiento: píxeles por marco
+    MIN_ZOOM = 1
+    MAX_ZOOM = 32
+
+    def __init__(self, canvas, color_of, zoom=4):
+        """
+        Inicializa el mapa de calor de un canvas
+
+        Args:
+            canvas (tk.Canvas): Canvas donde se dibuja la imagen
+            color_of (callable): Color de un proceso (por ejemplo get_process_color)
+            zoom (int): Píxeles por marco en cada dimensión
+        """
+        self.canvas = canvas
+        self.color_of = color_of
+        self.zoom = zoom
+
+        self.frames = []
+        self.cols = 0
+        self.rows = 0
+
+        # Dueño de cada marco en el último dibujo (pid, o 0 si está libre)
+        self.owners = []
+
+        # Imagen de un píxel por marco, imagen ampliada que se muestra y elementos del canvas
+        self.base = None
+        self.display = None
+        self.image_item = None
+        self.tooltip = None
+        self.tooltip_bg = None
+
+        canvas.bind("<Motion>", self._on_motion)
+        canvas.bind("<Leave>", lambda event: self._hide_tooltip())
+        canvas.bind("<MouseWheel>", self._on_wheel)
+        canvas.bind("<Button-4>", lambda event: self.set_zoom(self.zoom + 1))
+        canvas.bind("<Button-5>", lambda event: self.set_zoom(self.zoom - 1))
+
+    #Cambia el acercamiento y redibuja todo
+    def set_zoom(self, zoom):
+        zoom = max(self.MIN_ZOOM, min(self.MAX_ZOOM, zoom))
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self.cols = 0
+            self.render(self.frames)
+
+    def _on_wheel(self, event):
+        self.set_zoom(self.zoom + (1 if event.delta > 0 else -1))
+
+    #Crea las imágenes cuando cambia la cantidad de columnas o filas
+    def _layout(self, num_frames):
+        width = self.canvas.winfo_width()
+        cols = max(1, (width - 20) // self.zoom)
+        rows = max(1, (num_frames + cols - 1) // cols)
+
+        if cols == self.cols and rows == self.rows and self.base is not None:
+            return False
+
+        self.cols = cols
+        self.rows = rows
+        self.base = tk.PhotoImage(master=self.canvas, width=cols, height=rows)
+        self.display = tk.PhotoImage(master=self.canvas, width=cols * self.zoom, height=rows * self.zoom)
+        self.owners = []
+        return True
+
+    #Dibuja los marcos; solo se reescriben las filas con algún marco que cambió de dueño
+    def render(self, frames):
+        self.frames = frames
+        canvas = self.canvas
+        if canvas.winfo_width() <= 1 or not frames:
+            return
+
+        relayout = self._layout(len(frames))
+
+        # El canvas pudo borrarse (por ejemplo al volver al dibujo por rectángulos)
+        if relayout or not self.is_shown():
+            canvas.delete("all")
+            self.image_item = canvas.create_image(10, 10, image=self.display, anchor=tk.NW)
+            self.tooltip = None
+            self.owners = []
+
+        owners = [0 if frame.is_free else frame.process.pid for frame in frames]
+        previous = self.owners
+        colors = {0: self.FREE_COLOR}
+        cols = self.cols
+        changed = False
+
+        for row in range(self.rows):
+            start = row * cols
+            row_owners = owners[start:start + cols]
+            if previous and row_owners == previous[start:start + cols]:
+                continue
+
+            for offset, pid in enumerate(row_owners):
+                if pid not in colors:
+                    colors[pid] = self.color_of(frames[start + offset].process)
+
+            row_colors = [colors[pid] for pid in row_owners]
+            # La última fila puede quedar incompleta: se rellena con el fondo
+            row_colors.extend(["#FFFFFF"] * (cols - len(row_colors)))
+            self.base.put(encode_row(row_colors), to=(0, row))
+            changed = True
+
+        self.owners = owners
+        if changed:
+            if self.zoom == 1:
+                self.display.tk.call(self.display, 'copy', self.base)
+            else:
+                self.display.tk.call(self.display, 'copy', self.base, '-zoom', self.zoom, self.zoom)
+
+    #Índice del marco bajo una posición del canvas, o None
+    def frame_at(self, x, y):
+        if not self.cols:
+            return None
+        col = (x - 10) // self.zoom
+        row = (y - 10) // self.zoom
+        if x < 10 or y < 10 or col >= self.cols or row >= self.rows:
+            return None
+        index = row * self.cols + col
+        return index if index < len(self.frames) else None
+
+    #Descripción de un marco para la ventana emergente
+    def describe(self, index):
+        frame = self.frames[index]
+        if frame.is_free:
+            return f"Marco {frame.frame_id}: Libre"
+        text = f"Marco {frame.frame_id}: {frame.process} Pág {frame.page_number}"
+        if frame.sharers:
+            text += f" (+{len(frame.sharers)} COW)"
+        return text
+
+    #Verifica que la imagen esté en el canvas (no lo está en el modo de rectángulos)
+    def is_shown(self):
+        return self.image_item is not None and bool(self.canvas.type(self.image_item))
+
+    def _on_motion(self, event):
+        index = self.frame_at(event.x, event.y) if self.is_shown() else None
+        if index is None:
+            self._hide_tooltip()
+            return
+
+        canvas = self.canvas
+        text = self.describe(index)
+        if self.tooltip is None or not canvas.type(self.tooltip):
+            self.tooltip = canvas.create_text(0, 0, anchor=tk.NW, font=("Arial", 8, "bold"),
+                                              fill="#333333")
+            self.tooltip_bg = canvas.create_rectangle(0, 0, 0, 0, fill="#FFFFE0", outline="#333333")
+            canvas.tag_raise(self.tooltip)
+
+        canvas.itemconfigure(self.tooltip, text=text, state=tk.NORMAL)
+        canvas.coords(self.tooltip, event.x + 12, event.y + 12)
+        x1, y1, x2, y2 = canvas.bbox(self.tooltip)
+        canvas.coords(self.tooltip_bg, x1 - 3, y1 - 2, x2 + 3, y2 + 2)
+        canvas.itemconfigure(self.tooltip_bg, state=tk.NORMAL)
+
+    def _hide_tooltip(self):
+        if self.tooltip is not None and self.canvas.type(self.tooltip):
+            self.canvas.itemconfigure(self.tooltip, state=tk.HIDDEN)
+            self.canvas.itemconfigure(self.tooltip_bg, state=tk.HIDDEN)
@@ -0,0 +1,131 @@
+"""
+Módulo de Memoria Comprimida
+Pool de RAM comprimida entre la RAM y el SWAP, al estilo de zswap/zram:
+las páginas desalojadas de RAM se comprimen en el pool y solo bajan al SWAP
+real cuando el pool se llena (desalojo LRU dentro del pool)
+"""
+import math
+from collections import OrderedDict
+
+
+class CompressedPool:
+    """
+    Pool de páginas comprimidas con capacidad fija en KB y orden LRU
+    El tamaño comprimido de cada página sale de una distribución de razones de compresión
+    """
+
+    def __init__(self, capacity_kb, page_size, rng, min_ratio=1.5, max_ratio=4.0,
+                 incompressible_fraction=0.1, compress_ns=5000, decompress_ns=2000):
+        """
+        Inicializa el pool
+
+        Args:
+            capacity_kb (int): Capacidad del pool en KB (se descuenta de la RAM)
+            page_size (int): Tamaño de página en KB
+            rng (random.Random): Generador para las razones de compresión
+            min_ratio (float): Razón de compresión mínima
+            max_ratio (float): Razón de compresión máxima
+            incompressible_fraction (float): Fracción de páginas que no comprimen y van directo a SWAP
+            compress_ns (int): Latencia de compresión
+            decompress_ns (int): Latencia de descompresión
+        """
+        self.capacity_kb = capacity_kb
+        self.page_size = page_size
+        self.rng = rng
+        self.min_ratio = min_ratio
+        self.max_ratio = max_ratio
+        self.incompressible_fraction = incompressible_fraction
+        self.compress_ns = compress_ns
+        self.decompress_ns = decompress_ns
+
+        # (pid, página) -> (proceso, página, KB comprimidos), del menos al más reciente
+        self.entries = OrderedDict()
+        self.used_kb = 0.0
+
+        # Estadísticas
+        self.stores = 0
+        self.rejected = 0
+        self.hits = 0
+        self.demotions = 0
+        self.overflows = 0
+
+    #Marcos de RAM que ocupa el pool
+    def frames_reserved(self):
+        return math.ceil(self.capacity_kb / self.page_size)
+
+    #Tamaño en KB que ocupará comprimida la próxima página, o None si no comprime
+    def compressed_size(self):
+        if self.rng.random() < self.incompressible_fraction:
+            self.rejected += 1
+            return None
+        return self.page_size / self.rng.uniform(self.min_ratio, self.max_ratio)
+
+    #Verifica si caben compressed_kb más sin exceder la capacidad
+    def fits(self, compressed_kb):
+        return self.used_kb + compressed_kb <= self.capacity_kb
+
+    #Guarda una página comprimida a compressed_kb (obtenido con compressed_size); retorna el costo
+    def store(self, process, page_num, compressed_kb):
+        self.entries[(process.pid, page_num)] = (process, page_num, compressed_kb)
+        self.used_kb += compressed_kb
+        self.stores += 1
+        return self.compress_ns
+
+    #Descomprime una página y la retira del pool; retorna el costo
+    def load(self, pid, page_num):
+        self.remove(pid, page_num)
+        self.hits += 1
+        return self.decompress_ns
+
+    #Retira una página del pool sin contarla como acierto
+    def remove(self, pid, page_num):
+        entry = self.entries.pop((pid, page_num), None)
+        if entry:
+            self.used_kb -= entry[2]
+        return entry
+
+    #Retira todas las páginas de un proceso
+    def remove_process(self, pid):
+        for key in [key for key in self.entries if key[0] == pid]:
+            self.remove(*key)
+
+    #Página menos recientemente comprimida: (proceso, página)
+    def oldest(self):
+        process, page_num, _ = next(iter(self.entries.values()))
+        return process, page_num
+
+    #Retira la página más antigua para bajarla a SWAP
+    def demote_oldest(self):
+        process, page_num = self.oldest()
+        self.remove(process.pid, page_num)
+        self.demotions += 1
+        return process, page_num
+
+    #Obtiene los contadores del pool (las páginas guardadas las empaqueta el punto de control)
+    def get_state(self):
+        return [self.stores, self.rejected, self.hits, self.demotions, self.overflows]
+
+    #Restaura los contadores obtenidos con get_state
+    def set_state(self, counters):
+        self.stores, self.rejected, self.hits, self.demotions, self.overflows = (int(value) for value in counters)
+
+    #Marcos efectivos que aporta el pool: páginas guardadas menos marcos reservados
+    def effective_frames_added(self):
+        return len(self.entries) - self.frames_reserved()
+
+    #Obtiene las estadísticas del pool
+    def get_statistics(self):
+        lookups = self.hits + self.demotions
+        hit_rate = (self.hits / lookups * 100) if lookups else 0
+        mean_ratio = (len(self.entries) * self.page_size / self.used_kb) if self.used_kb > 0 else 0
+
+        return {
+            'Pool Comprimido Usado': f"{self.used_kb:.0f}/{self.capacity_kb} KB",
+            'Páginas Comprimidas': len(self.entries),
+            'Razón de Compresión Media': f"{mean_ratio:.2f}",
+            'Aciertos Pool': f"{hit_rate:.2f}%",
+            'Degradaciones a SWAP': self.demotions,
+            'Páginas Incompresibles': self.rejected,
+            'Páginas a SWAP con el Pool Lleno': self.overflows,
+            'Marcos Efectivos Añadidos': self.effective_frames_added()
+        }
@@ -0,0 +1,258 @@
+"""
+Módulo de Métricas
+Series de tiempo por proceso y globales (tasa de fallos, páginas residentes,
+páginas en SWAP y tiempo en cada estado) guardadas en búferes circulares
+e histogramas logarítmicos, para que la memoria usada sea constante
+sin importar cuánto dure la simulación
+"""
+import csv
+import math
+from array import array
+
+from proceso import Process
+
+
+class RingBuffer:
+    """
+    Búfer circular de tamaño fijo respaldado por un array empaquetado
+    Al llenarse sobrescribe las muestras más antiguas
+    """
+
+    def __init__(self, capacity, typecode='d'):
+        self.capacity = capacity
+        self.values = array(typecode, [0] * capacity)
+        self.start = 0
+        self.count = 0
+
+    #Agrega una muestra
+    def append(self, value):
+        index = (self.start + self.count) % self.capacity
+        self.values[index] = value
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    #Retorna las muestras en orden cronológico
+    def to_list(self):
+        end = self.start + self.count
+        if end <= self.capacity:
+            return self.values[self.start:end].tolist()
+        return self.values[self.start:].tolist() + self.values[:end - self.capacity].tolist()
+
+    #Retorna la última muestra registrada
+    def last(self):
+        if self.count == 0:
+            return None
+        return self.values[(self.start + self.count - 1) % self.capacity]
+
+    def __len__(self):
+        return self.count
+
+
+class LogHistogram:
+    """
+    Histograma con cubetas logarítmicas de base 2
+    La cubeta 0 guarda los valores menores a 1, la cubeta k los valores en [2^(k-1), 2^k)
+    """
+
+    def __init__(self, num_buckets=64):
+        self.counts = array('q', [0] * num_buckets)
+        self.total = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    #Calcula la cubeta de un valor
+    def _bucket(self, value):
+        if value < 1:
+            return 0
+        return min(int(math.log2(value)) + 1, len(self.counts) - 1)
+
+    #Registra un valor
+    def add(self, value):
+        self.counts[self._bucket(value)] += 1
+        self.total += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    #Valor medio registrado
+    def mean(self):
+        return self.sum / self.total if self.total else 0.0
+
+    #Percentil aproximado (límite superior de la cubeta que lo contiene)
+    def percentile(self, p):
+        if self.total == 0:
+            return 0.0
+        target = self.total * p / 100.0
+        acc = 0
+        for bucket, count in enumerate(self.counts):
+            acc += count
+            if acc >= target:
+                upper = 1.0 if bucket == 0 else float(2 ** bucket)
+                return min(upper, self.max)
+        return self.max
+
+    #Retorna las cubetas no vacías como (límite inferior, límite superior, cuenta)
+    def buckets(self):
+        result = []
+        for bucket, count in enumerate(self.counts):
+            if count:
+                lower = 0.0 if bucket == 0 else float(2 ** (bucket - 1))
+                result.append((lower, float(2 ** bucket), count))
+        return result
+
+
+class SeriesSet:
+    """
+    Conjunto de series de tiempo (tasa de fallos, residentes y SWAP) con sus histogramas
+    """
+
+    FIELDS = ('fault_rate', 'resident', 'swapped')
+
+    def __init__(self, capacity):
+        self.times = RingBuffer(capacity)
+        self.series = {field: RingBuffer(capacity) for field in self.FIELDS}
+        self.histograms = {field: LogHistogram() for field in self.FIELDS}
+
+    #Agrega una muestra para todas las series
+    def append(self, now, **values):
+        self.times.append(now)
+        for field in self.FIELDS:
+            self.series[field].append(values[field])
+            self.histograms[field].add(values[field])
+
+    #Retorna las series como listas paralelas listas para graficar
+    def to_dict(self):
+        data = {'time': self.times.to_list()}
+        for field in self.FIELDS:
+            data[field] = self.series[field].to_list()
+        return data
+
+
+class MetricsRecorder:
+    """
+    Registra series de tiempo por proceso y globales del gestor de memoria
+    Las métricas de un proceso se descartan cuando termina; solo se agregan al global
+    """
+
+    STATES = (Process.ACTIVE, Process.SUSPENDED, Process.SWAPPED, Process.BLOCKED)
+
+    #Inicializa el registrador con la capacidad de cada búfer circular
+    def __init__(self, memory_manager, capacity=512, sample_interval=1.0):
+        self.memory_manager = memory_manager
+        self.capacity = capacity
+        self.sample_interval = sample_interval
+
+        self.global_series = SeriesSet(capacity)
+        self.process_series = {}
+
+        # Tiempo total (proceso-segundos) pasado en cada estado
+        self.state_times = {state: 0.0 for state in self.STATES}
+
+        self._last_sample_time = None
+        self._last_total_faults = 0
+        self._last_process_faults = {}
+        self._last_state_times = {}
+
+    #Toma una muestra si pasó el intervalo de muestreo desde la anterior
+    def sample(self, now):
+        if self._last_sample_time is not None and now - self._last_sample_time < self.sample_interval:
+            return False
+
+        elapsed = now - self._last_sample_time if self._last_sample_time is not None else 0.0
+        processes = self.memory_manager.processes
+        live_pids = set()
+
+        for process in processes:
+            live_pids.add(process.pid)
+            series = self.process_series.get(process.pid)
+            if series is None:
+                series = self.process_series[process.pid] = SeriesSet(self.capacity)
+
+            previous_faults = self._last_process_faults.get(process.pid, 0)
+            fault_rate = (process.page_faults - previous_faults) / elapsed if elapsed > 0 else 0.0
+            self._last_process_faults[process.pid] = process.page_faults
+
+            table = process.page_table
+            series.append(
+                now,
+                fault_rate=fault_rate,
+                resident=table.count_pages_in_ram() if table else 0,
+                swapped=table.count_pages_in_swap() if table else 0
+            )
+
+            # Acumular el tiempo en cada estado desde la última muestra
+            previous = self._last_state_times.get(process.pid, {})
+            for state, seconds in process.state_times.items():
+                self.state_times[state] = self.state_times.get(state, 0.0) + seconds - previous.get(state, 0.0)
+            self._last_state_times[process.pid] = dict(process.state_times)
+
+        # Descartar métricas de procesos terminados para mantener memoria constante
+        for pid in [pid for pid in self.process_series if pid not in live_pids]:
+            del self.process_series[pid]
+            self._last_process_faults.pop(pid, None)
+            self._last_state_times.pop(pid, None)
+
+        total_faults = self.memory_manager.total_page_faults
+        global_rate = (total_faults - self._last_total_faults) / elapsed if elapsed > 0 else 0.0
+        self._last_total_faults = total_faults
+
+        self.global_series.append(
+            now,
+            fault_rate=global_rate,
+            resident=sum(1 for f in self.memory_manager.ram_frames if not f.is_free),
+            swapped=sum(1 for f in self.memory_manager.swap_frames if not f.is_free)
+        )
+
+        self._last_sample_time = now
+        return True
+
+    #Obtiene las series de un proceso (o las globales si pid es None)
+    def get_series(self, pid=None):
+        if pid is None:
+            return self.global_series.to_dict()
+        series = self.process_series.get(pid)
+        return series.to_dict() if series else None
+
+    #Obtiene el histograma de una serie de un proceso (o global)
+    def get_histogram(self, field, pid=None):
+        series = self.global_series if pid is None else self.process_series.get(pid)
+        return series.histograms[field] if series else None
+
+    #Obtiene el tiempo en cada estado de un proceso (o el total global)
+    def get_state_times(self, pid=None):
+        if pid is None:
+            return dict(self.state_times)
+        process = self.memory_manager._find_process_by_pid(pid)
+        return dict(process.state_times) if process else None
+
+    #Obtiene un resumen de las métricas globales
+    def get_summary(self):
+        summary = {}
+        for field, histogram in self.global_series.histograms.items():
+            summary[field] = {
+                'mean': histogram.mean(),
+                'p50': histogram.percentile(50),
+                'p95': histogram.percentile(95),
+                'max': histogram.max or 0
+            }
+        summary['state_times'] = self.get_state_times()
+        return summary
+
+    #Exporta las series de un proceso (o globales) a un archivo CSV
+    def export_csv(self, path, pid=None):
+        data = self.get_series(pid)
+        if data is None:
+            return False
+
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            columns = ['time'] + list(SeriesSet.FIELDS)
+            writer.writerow(columns)
+            writer.writerows(zip(*(data[column] for column in columns)))
+
+        return True
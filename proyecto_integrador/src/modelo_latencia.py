@@ -0,0 +1,124 @@
+"""
+Módulo de Modelo de Latencia
+Asigna un costo en nanosegundos a cada acceso a memoria: acceso a RAM,
+fallo de TLB, lectura y escritura de SWAP y escritura diferida (write-back)
+de páginas modificadas al desalojarlas. El costo se carga a un reloj
+simulado por proceso y se resume como tiempo efectivo de acceso (EAT)
+"""
+from collections import OrderedDict
+
+from metricas import LogHistogram
+
+
+class TLB:
+    """
+    TLB totalmente asociativa con reemplazo LRU
+    Las entradas se identifican por (pid, página)
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    #Busca una traducción, la inserta si no estaba; retorna True si fue acierto
+    def lookup(self, pid, page_num):
+        key = (pid, page_num)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        self.entries[key] = True
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return False
+
+    #Invalida la traducción de una página (por ejemplo al desalojarla)
+    def invalidate(self, pid, page_num):
+        self.entries.pop((pid, page_num), None)
+
+    #Invalida todas las traducciones de un proceso
+    def flush_process(self, pid):
+        for key in [key for key in self.entries if key[0] == pid]:
+            del self.entries[key]
+
+    #Tasa de aciertos
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LatencyModel:
+    """
+    Modelo de costos de acceso a memoria, todos los valores en nanosegundos
+
+    ram_access: lectura o escritura de una página residente
+    tlb_miss: recorrido de la tabla de páginas cuando la traducción no está en la TLB
+    swap_read: traer una página desde SWAP
+    swap_write: escribir la página víctima en SWAP al desalojarla
+    dirty_writeback: costo adicional si la víctima fue modificada
+    """
+
+    def __init__(self, ram_access=100, tlb_miss=80, swap_read=100000, swap_write=100000,
+                 dirty_writeback=50000, tlb_entries=64):
+        self.ram_access = ram_access
+        self.tlb_miss = tlb_miss
+        self.swap_read = swap_read
+        self.swap_write = swap_write
+        self.dirty_writeback = dirty_writeback
+        self.tlb = TLB(tlb_entries)
+
+        # Distribución de la latencia de cada acceso
+        self.histogram = LogHistogram()
+
+    #Crea el modelo a partir de la configuración
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            ram_access=getattr(config, 'latency_ram_access', 100),
+            tlb_miss=getattr(config, 'latency_tlb_miss', 80),
+            swap_read=getattr(config, 'latency_swap_read', 100000),
+            swap_write=getattr(config, 'latency_swap_write', 100000),
+            dirty_writeback=getattr(config, 'latency_dirty_writeback', 50000),
+            tlb_entries=getattr(config, 'tlb_entries', 64)
+        )
+
+    #Costo de traducir una dirección (cero si la TLB acierta)
+    def translate(self, pid, page_num):
+        return 0 if self.tlb.lookup(pid, page_num) else self.tlb_miss
+
+    #Costo de desalojar una página a SWAP; limpia su bit de modificación
+    def eviction_cost(self, page_table, page_num):
+        self.tlb.invalidate(page_table.process.pid, page_num)
+        entry = page_table.entries[page_num]
+        cost = self.swap_write
+        if entry.modified:
+            cost += self.dirty_writeback
+            entry.modified = False
+        return cost
+
+    #Carga un costo al reloj simulado del proceso sin contarlo como acceso
+    def charge(self, process, cost):
+        process.memory_time_ns += cost
+
+    #Registra el costo total de un acceso y lo carga al proceso
+    def record_access(self, process, cost):
+        process.memory_time_ns += cost
+        self.histogram.add(cost)
+
+    #Tiempo efectivo de acceso promedio
+    def effective_access_time(self):
+        return self.histogram.mean()
+
+    #Obtiene el resumen de latencias
+    def get_statistics(self):
+        return {
+            'Tiempo Efectivo de Acceso (EAT)': f"{self.effective_access_time():.0f} ns",
+            'Latencia p50': f"{self.histogram.percentile(50):.0f} ns",
+            'Latencia p95': f"{self.histogram.percentile(95):.0f} ns",
+            'Latencia p99': f"{self.histogram.percentile(99):.0f} ns",
+            'Aciertos TLB': f"{self.tlb.hit_rate() * 100:.2f}%"
+        }
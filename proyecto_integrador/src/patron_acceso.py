@@ -0,0 +1,277 @@
+"""
+Módulo de Patrones de Acceso
+Modelos de carga que generan cadenas de referencias con localidad
+(páginas calientes Zipf, recorridos secuenciales, bucles y conjuntos de trabajo
+que se desplazan con el tiempo). Las referencias se generan en bloques completos;
+si NumPy está disponible se usa para vectorizar la generación
+"""
+import bisect
+import random
+
+# NumPy es opcional y se importa solo al generar el primer bloque,
+# para no retrasar el arranque de los puntos de entrada que no lo usan
+_numpy_module = None
+_numpy_checked = False
+
+
+#Retorna el módulo numpy si está instalado, o None
+def _numpy():
+    global _numpy_module, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = None
+        _numpy_checked = True
+    return _numpy_module
+
+
+class AccessPattern:
+    """
+    Patrón de acceso base: referencias uniformes sobre todas las páginas
+    Mantiene un búfer de referencias que se rellena por bloques
+    """
+
+    name = 'uniforme'
+
+    # Número de referencias generadas en cada bloque
+    BLOCK_SIZE = 256
+
+    #Inicializa el patrón con un generador aleatorio opcional
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self._np_rng = None
+        self._buffer = []
+        self._buffer_pos = 0
+        self._buffer_pages = 0
+
+    #Obtiene el generador de NumPy derivado del generador del patrón
+    def _numpy_rng(self):
+        if self._np_rng is None:
+            self._np_rng = _numpy().random.default_rng(self.rng.getrandbits(64))
+        return self._np_rng
+
+    #Genera un bloque de referencias (números de página) de una sola vez
+    def generate_block(self, num_pages, count):
+        np = _numpy()
+        if np is not None:
+            return self._numpy_rng().integers(0, num_pages, count).tolist()
+        randrange = self.rng.randrange
+        return [randrange(num_pages) for _ in range(count)]
+
+    #Retorna la siguiente página a acceder, rellenando el búfer si se agotó
+    def next_page(self, num_pages):
+        if self._buffer_pos >= len(self._buffer) or self._buffer_pages != num_pages:
+            self._buffer = self.generate_block(num_pages, self.BLOCK_SIZE)
+            self._buffer_pos = 0
+            self._buffer_pages = num_pages
+        page = self._buffer[self._buffer_pos]
+        self._buffer_pos += 1
+        return page
+
+    #Obtiene la especificación {'tipo': nombre, ...parámetros} que recrea el patrón con create_pattern
+    def get_spec(self):
+        return {'tipo': self.name}
+
+    #Obtiene el estado interno del patrón: generadores, búfer de referencias y cursor
+    def get_state(self):
+        return {
+            'rng': self.rng.getstate(),
+            'np_rng': self._np_rng.bit_generator.state if self._np_rng is not None else None,
+            'buffer': list(self._buffer),
+            'buffer_pos': self._buffer_pos,
+            'buffer_pages': self._buffer_pages,
+            'cursor': 0
+        }
+
+    #Restaura un estado obtenido con get_state
+    def set_state(self, state):
+        np = _numpy()
+        if state['np_rng'] is not None and np is not None:
+            # Se crea sin derivarlo de self.rng para no consumir números del generador
+            if self._np_rng is None:
+                self._np_rng = np.random.default_rng()
+            self._np_rng.bit_generator.state = state['np_rng']
+        else:
+            self._np_rng = None
+        self.rng.setstate(state['rng'])
+        self._buffer = list(state['buffer'])
+        self._buffer_pos = state['buffer_pos']
+        self._buffer_pages = state['buffer_pages']
+
+    def __str__(self):
+        return f"Patrón {self.name}"
+
+
+class ZipfPattern(AccessPattern):
+    """
+    Páginas calientes con distribución Zipf: la página de rango k
+    se referencia con probabilidad proporcional a 1 / k^s
+    """
+
+    name = 'zipf'
+
+    def __init__(self, rng=None, s=1.2):
+        super().__init__(rng)
+        self.s = s
+        self._cdf_cache = {}
+
+    def get_spec(self):
+        return {'tipo': self.name, 's': self.s}
+
+    #Calcula (y guarda) la distribución acumulada para un número de páginas
+    def _cdf(self, num_pages):
+        cdf = self._cdf_cache.get(num_pages)
+        if cdf is None:
+            weights = [1.0 / (k ** self.s) for k in range(1, num_pages + 1)]
+            total = sum(weights)
+            cdf = []
+            acc = 0.0
+            for w in weights:
+                acc += w / total
+                cdf.append(acc)
+            cdf[-1] = 1.0
+            self._cdf_cache[num_pages] = cdf
+        return cdf
+
+    def generate_block(self, num_pages, count):
+        np = _numpy()
+        cdf = self._cdf(num_pages)
+        if np is not None:
+            samples = self._numpy_rng().random(count)
+            return np.searchsorted(np.asarray(cdf), samples, side='right').clip(0, num_pages - 1).tolist()
+        rand = self.rng.random
+        last = num_pages - 1
+        return [min(bisect.bisect_right(cdf, rand()), last) for _ in range(count)]
+
+
+class SequentialPattern(AccessPattern):
+    """
+    Recorrido secuencial: recorre todas las páginas en orden y vuelve a empezar
+    """
+
+    name = 'secuencial'
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.position = 0
+
+    def get_state(self):
+        state = super().get_state()
+        state['cursor'] = self.position
+        return state
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.position = state['cursor']
+
+    def generate_block(self, num_pages, count):
+        np = _numpy()
+        start = self.position
+        self.position = (start + count) % num_pages
+        if np is not None:
+            return ((start + np.arange(count)) % num_pages).tolist()
+        return [(start + i) % num_pages for i in range(count)]
+
+
+class LoopPattern(AccessPattern):
+    """
+    Bucle: recorre repetidamente una región de páginas
+    La región ocupa una fracción de las páginas del proceso
+    """
+
+    name = 'bucle'
+
+    def __init__(self, rng=None, loop_fraction=0.5):
+        super().__init__(rng)
+        self.loop_fraction = loop_fraction
+        self.position = 0
+
+    def get_spec(self):
+        return {'tipo': self.name, 'loop_fraction': self.loop_fraction}
+
+    def get_state(self):
+        state = super().get_state()
+        state['cursor'] = self.position
+        return state
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.position = state['cursor']
+
+    def generate_block(self, num_pages, count):
+        np = _numpy()
+        loop_length = max(1, int(num_pages * self.loop_fraction))
+        start = self.position
+        self.position = (start + count) % loop_length
+        if np is not None:
+            return ((start + np.arange(count)) % loop_length).tolist()
+        return [(start + i) % loop_length for i in range(count)]
+
+
+class WorkingSetPattern(AccessPattern):
+    """
+    Conjunto de trabajo por fases: los accesos caen en una ventana de páginas
+    que se desplaza cada cierto número de referencias
+    """
+
+    name = 'conjunto_trabajo'
+
+    def __init__(self, rng=None, working_set_fraction=0.3, phase_length=200, drift=1):
+        super().__init__(rng)
+        self.working_set_fraction = working_set_fraction
+        self.phase_length = phase_length
+        self.drift = drift
+        self.references = 0
+
+    def get_spec(self):
+        return {'tipo': self.name, 'working_set_fraction': self.working_set_fraction,
+                'phase_length': self.phase_length, 'drift': self.drift}
+
+    def get_state(self):
+        state = super().get_state()
+        state['cursor'] = self.references
+        return state
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.references = state['cursor']
+
+    def generate_block(self, num_pages, count):
+        np = _numpy()
+        window = max(1, int(num_pages * self.working_set_fraction))
+        start = self.references
+        self.references += count
+        if np is not None:
+            gen = self._numpy_rng()
+            phases = (start + np.arange(count)) // self.phase_length
+            offsets = gen.integers(0, window, count)
+            return ((phases * self.drift + offsets) % num_pages).tolist()
+        randrange = self.rng.randrange
+        block = []
+        for i in range(count):
+            base = ((start + i) // self.phase_length) * self.drift
+            block.append((base + randrange(window)) % num_pages)
+        return block
+
+
+# Patrones disponibles por nombre
+PATTERNS = {
+    AccessPattern.name: AccessPattern,
+    ZipfPattern.name: ZipfPattern,
+    SequentialPattern.name: SequentialPattern,
+    LoopPattern.name: LoopPattern,
+    WorkingSetPattern.name: WorkingSetPattern,
+}
+
+
+#Crea un patrón a partir de una especificación {'tipo': nombre, ...parámetros}
+def create_pattern(spec, rng=None):
+    params = dict(spec)
+    pattern_type = params.pop('tipo', AccessPattern.name)
+
+    if pattern_type not in PATTERNS:
+        raise ValueError(f"Patrón de acceso desconocido: {pattern_type}")
+
+    return PATTERNS[pattern_type](rng, **params)
@@ -0,0 +1,391 @@
+"""
+Módulo de Planificación de CPU
+Capa de planificación (Round Robin, Prioridades y MLFQ) acoplada a la paginación:
+un proceso que provoca un fallo de página sobre una página en SWAP se bloquea
+durante la latencia de E/S mientras los demás usan la CPU
+
+Reporta utilización de CPU, throughput y tiempo de retorno (turnaround),
+para ver el efecto real de la hiperpaginación sobre el sistema
+"""
+import heapq
+from collections import deque
+
+from proceso import Process
+
+
+class RoundRobinPolicy:
+    """
+    Round Robin: cola circular con el mismo quantum para todos
+    """
+
+    name = 'RR'
+
+    def __init__(self, quantum):
+        self.quantum = quantum
+        self.queue = deque()
+
+    #Agrega un proceso listo al final de la cola
+    def add(self, process):
+        self.queue.append(process)
+
+    #Saca el siguiente proceso a ejecutar
+    def pick(self):
+        return self.queue.popleft() if self.queue else None
+
+    #Devuelve un proceso a la cola tras su turno
+    def requeue(self, process, used_full_quantum):
+        self.queue.append(process)
+
+    #Quantum asignado a un proceso
+    def quantum_for(self, process):
+        return self.quantum
+
+    #Se llama periódicamente con el tiempo simulado actual
+    def tick(self, now):
+        pass
+
+    #Olvida el estado guardado de un proceso terminado
+    def forget(self, pid):
+        pass
+
+    #Estado para los puntos de control: (escalares, colas de filas (pid, clave, secuencia))
+    def get_state(self):
+        return [], [[(process.pid, 0, 0) for process in self.queue]]
+
+    #Restaura un estado obtenido con get_state; resolve obtiene el proceso de cada PID
+    def set_state(self, scalars, queues, resolve):
+        self.queue = deque(resolve(pid) for pid, _, _ in queues[0])
+
+    def __len__(self):
+        return len(self.queue)
+
+
+class PriorityPolicy:
+    """
+    Prioridades: siempre ejecuta el proceso con menor número de prioridad
+    Los procesos de la misma prioridad se alternan en Round Robin
+    """
+
+    name = 'PRIORIDAD'
+
+    def __init__(self, quantum):
+        self.quantum = quantum
+        self.heap = []
+        self.sequence = 0
+
+    def add(self, process):
+        self.sequence += 1
+        heapq.heappush(self.heap, (process.priority, self.sequence, process))
+
+    def pick(self):
+        return heapq.heappop(self.heap)[2] if self.heap else None
+
+    def requeue(self, process, used_full_quantum):
+        self.add(process)
+
+    def quantum_for(self, process):
+        return self.quantum
+
+    def tick(self, now):
+        pass
+
+    def forget(self, pid):
+        pass
+
+    def get_state(self):
+        return [self.sequence], [[(process.pid, priority, sequence) for priority, sequence, process in self.heap]]
+
+    def set_state(self, scalars, queues, resolve):
+        self.sequence = int(scalars[0])
+        self.heap = [(int(priority), int(sequence), resolve(pid)) for pid, priority, sequence in queues[0]]
+        heapq.heapify(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class MLFQPolicy:
+    """
+    Colas multinivel con retroalimentación
+    Un proceso que agota su quantum baja de nivel; el que se bloquea antes conserva su nivel
+    Periódicamente todos los procesos suben al nivel más alto para evitar inanición
+    """
+
+    name = 'MLFQ'
+
+    def __init__(self, quantum, levels=3, boost_interval=10.0):
+        self.quantum = quantum
+        self.levels = [deque() for _ in range(levels)]
+        self.level_of = {}
+        self.boost_interval = boost_interval
+        self.last_boost = 0.0
+
+    def add(self, process):
+        level = self.level_of.setdefault(process.pid, 0)
+        self.levels[level].append(process)
+
+    def pick(self):
+        for queue in self.levels:
+            if queue:
+                return queue.popleft()
+        return None
+
+    def requeue(self, process, used_full_quantum):
+        level = self.level_of.get(process.pid, 0)
+        if used_full_quantum and level < len(self.levels) - 1:
+            level += 1
+        self.level_of[process.pid] = level
+        self.levels[level].append(process)
+
+    #El quantum se duplica en cada nivel
+    def quantum_for(self, process):
+        return self.quantum * (2 ** self.level_of.get(process.pid, 0))
+
+    #Sube todos los procesos al nivel más alto cada boost_interval
+    def tick(self, now):
+        if now - self.last_boost < self.boost_interval:
+            return
+        self.last_boost = now
+        for queue in self.levels[1:]:
+            while queue:
+                process = queue.popleft()
+                self.level_of[process.pid] = 0
+                self.levels[0].append(process)
+        for pid in self.level_of:
+            self.level_of[pid] = 0
+
+    def forget(self, pid):
+        self.level_of.pop(pid, None)
+
+    #Las colas de cada nivel y, al final, el nivel de cada PID
+    def get_state(self):
+        queues = [[(process.pid, 0, 0) for process in queue] for queue in self.levels]
+        queues.append([(pid, level, 0) for pid, level in self.level_of.items()])
+        return [self.last_boost], queues
+
+    def set_state(self, scalars, queues, resolve):
+        if len(queues) != len(self.levels) + 1:
+            raise ValueError("El punto de control no coincide con el número de niveles de MLFQ")
+        self.last_boost = scalars[0]
+        self.levels = [deque(resolve(pid) for pid, _, _ in rows) for rows in queues[:-1]]
+        self.level_of = {pid: int(level) for pid, level, _ in queues[-1]}
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.levels)
+
+
+# Políticas disponibles por nombre
+POLICIES = {
+    RoundRobinPolicy.name: RoundRobinPolicy,
+    PriorityPolicy.name: PriorityPolicy,
+    MLFQPolicy.name: MLFQPolicy,
+}
+
+
+class CPUScheduler:
+    """
+    Planificador de CPU sobre los procesos del gestor de memoria
+    Avanza en tiempo simulado: cada acceso a página consume access_time de CPU
+    y cada fallo sobre una página en SWAP bloquea al proceso io_latency segundos
+    """
+
+    # Estados en los que un proceso puede recibir la CPU
+    RUNNABLE = (Process.ACTIVE, Process.SWAPPED)
+
+    def __init__(self, memory_manager, policy='RR', quantum=0.1, io_latency=0.05, access_time=0.01):
+        """
+        Inicializa el planificador
+
+        Args:
+            memory_manager (MemoryManager): Gestor de memoria con los procesos
+            policy (str): RR, PRIORIDAD o MLFQ
+            quantum (float): Quantum base en segundos
+            io_latency (float): Tiempo bloqueado por un fallo de página desde SWAP
+            access_time (float): Tiempo de CPU por acceso a página
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Política de planificación desconocida: {policy}")
+
+        self.memory_manager = memory_manager
+        self.random = memory_manager.random
+        self.policy = POLICIES[policy](quantum)
+        self.io_latency = io_latency
+        self.access_time = access_time
+
+        # Fracción de accesos que son escrituras
+        self.write_ratio = 0.3
+
+        # Demanda de CPU de cada proceso (segundos)
+        self.min_cpu_demand = 2.0
+        self.max_cpu_demand = 8.0
+
+        self.now = 0.0
+        self.known = {}         # pid -> proceso admitido
+        self.scheduled = set()  # PIDs en la cola de listos, en ejecución o bloqueados
+        self.blocked = []       # heap de (instante de desbloqueo, secuencia, proceso)
+        self._sequence = 0
+
+        # Estadísticas
+        self.busy_time = 0.0
+        self.idle_time = 0.0
+        self.blocking_faults = 0
+        self.context_switches = 0
+        self.completed = 0
+        self.total_turnaround = 0.0
+
+    #Verifica que el proceso siga existiendo en el gestor
+    def _alive(self, process):
+        return self.memory_manager._find_process_by_pid(process.pid) is process
+
+    #Admite procesos nuevos, encola los que volvieron a ser ejecutables y olvida los terminados
+    def _sync_processes(self):
+        for process in self.memory_manager.processes:
+            if process.pid not in self.known:
+                self.known[process.pid] = process
+                process.arrival_time = self.now
+                if process.cpu_demand is None:
+                    process.cpu_demand = self.random.lifetimes.uniform(self.min_cpu_demand, self.max_cpu_demand)
+            if process.pid not in self.scheduled and process.state in self.RUNNABLE:
+                self.scheduled.add(process.pid)
+                self.policy.add(process)
+
+        for pid in [pid for pid, p in self.known.items() if not self._alive(p)]:
+            del self.known[pid]
+            self.scheduled.discard(pid)
+            self.policy.forget(pid)
+
+    #Desbloquea los procesos cuya E/S terminó
+    def _wake_blocked(self):
+        while self.blocked and self.blocked[0][0] <= self.now:
+            _, _, process = heapq.heappop(self.blocked)
+            if not self._alive(process):
+                self.scheduled.discard(process.pid)
+                continue
+            if process.page_table.count_pages_in_ram() > 0:
+                process.set_state(Process.ACTIVE)
+            else:
+                process.set_state(Process.SWAPPED)
+            self.policy.add(process)
+
+    #Saca el siguiente proceso ejecutable de la cola
+    def _pick(self):
+        while True:
+            process = self.policy.pick()
+            if process is None:
+                return None
+            if self._alive(process) and process.state in self.RUNNABLE and not process.is_finished():
+                return process
+            # Suspendidos o terminados: se vuelven a encolar al sincronizar si corresponde
+            self.scheduled.discard(process.pid)
+
+    #Ejecuta un turno de un proceso, retorna (tiempo usado, se bloqueó)
+    def _run_slice(self, process, budget):
+        used = 0.0
+        page_table = process.page_table
+
+        while used + self.access_time <= budget + 1e-12 and not process.is_finished():
+            page_num = process.next_page()
+            # Solo un fallo mayor (lectura de SWAP) espera E/S; el pool comprimido
+            # y el primer acceso con paginación por demanda se resuelven sin bloquear
+            major = page_table.is_page_in_swap(page_num)
+
+            write = self.random.accesses.random() < self.write_ratio
+            success, _ = self.memory_manager.simulate_page_access(process.pid, page_num, write)
+            used += self.access_time
+            process.cpu_time += self.access_time
+
+            if major and success:
+                # Fallo de página mayor: el proceso espera la E/S y cede la CPU
+                self.blocking_faults += 1
+                process.set_state(Process.BLOCKED)
+                self._sequence += 1
+                heapq.heappush(self.blocked, (self.now + used + self.io_latency, self._sequence, process))
+                return used, True
+
+        return used, False
+
+    #Avanza el planificador delta segundos de tiempo simulado
+    def run(self, delta):
+        end = self.now + delta
+        self._sync_processes()
+
+        while self.now < end - 1e-12:
+            self._wake_blocked()
+            self.policy.tick(self.now)
+
+            process = self._pick()
+            if process is None:
+                # CPU ociosa hasta el siguiente desbloqueo o el final del intervalo
+                next_wake = self.blocked[0][0] if self.blocked else end
+                idle_until = min(max(next_wake, self.now + 1e-9), end)
+                self.idle_time += idle_until - self.now
+                self.now = idle_until
+                continue
+
+            self.context_switches += 1
+            quantum = self.policy.quantum_for(process)
+            used, blocked = self._run_slice(process, min(quantum, end - self.now))
+
+            if used == 0.0:
+                # No alcanza para un acceso en este intervalo
+                self.policy.requeue(process, False)
+                self.idle_time += end - self.now
+                self.now = end
+                break
+
+            self.busy_time += used
+            self.now += used
+
+            if process.is_finished():
+                self.completed += 1
+                self.total_turnaround += self.now - process.arrival_time
+                self.scheduled.discard(process.pid)
+            elif not blocked:
+                self.policy.requeue(process, used >= quantum - 1e-12)
+
+    #Estado para los puntos de control: (escalares, colas de filas (pid, clave, secuencia))
+    #Incluye conocidos, planificados, bloqueados y las colas de la política
+    def get_state(self):
+        scalars = [self.now, self._sequence, self.busy_time, self.idle_time, self.blocking_faults,
+                   self.context_switches, self.completed, self.total_turnaround]
+        queues = [
+            [(pid, 0, 0) for pid in self.known],
+            [(pid, 0, 0) for pid in sorted(self.scheduled)],
+            [(process.pid, wake_at, sequence) for wake_at, sequence, process in self.blocked]
+        ]
+        policy_scalars, policy_queues = self.policy.get_state()
+        return scalars + policy_scalars, queues + policy_queues
+
+    #Restaura un estado obtenido con get_state; resolve obtiene el proceso de cada PID
+    def set_state(self, scalars, queues, resolve):
+        (self.now, sequence, self.busy_time, self.idle_time, blocking_faults,
+         context_switches, completed, self.total_turnaround) = scalars[:8]
+        self._sequence = int(sequence)
+        self.blocking_faults = int(blocking_faults)
+        self.context_switches = int(context_switches)
+        self.completed = int(completed)
+
+        known, scheduled, blocked = queues[:3]
+        self.known = {pid: resolve(pid) for pid, _, _ in known}
+        self.scheduled = {pid for pid, _, _ in scheduled}
+        self.blocked = [(wake_at, int(sequence), resolve(pid)) for pid, wake_at, sequence in blocked]
+        heapq.heapify(self.blocked)
+        self.policy.set_state(scalars[8:], queues[3:], resolve)
+
+    #Obtiene las estadísticas del planificador
+    def get_statistics(self):
+        elapsed = self.busy_time + self.idle_time
+        utilization = (self.busy_time / elapsed * 100) if elapsed > 0 else 0
+        throughput = self.completed / self.now if self.now > 0 else 0
+        turnaround = self.total_turnaround / self.completed if self.completed else 0
+
+        return {
+            'Planificador': self.policy.name,
+            'Utilización CPU': f"{utilization:.2f}%",
+            'Throughput': f"{throughput:.3f} procesos/s",
+            'Turnaround Promedio': f"{turnaround:.2f}s",
+            'Procesos Completados': self.completed,
+            'Procesos Bloqueados': len(self.blocked),
+            'Bloqueos por Fallo': self.blocking_faults,
+            'Cambios de Contexto': self.context_switches
+        }
@@ -14,30 +14,56 @@ class Process:
     ACTIVE = "Activo"
     SUSPENDED = "Suspendido"
     SWAPPED = "Intercambiado"
-
-    #Inicializa un nuevo proceso
-    def __init__(self, name, size, min_exec_time=10, max_exec_time=30):
-        Process._id_counter += 1
-        self.pid = Process._id_counter
+    BLOCKED = "Bloqueado"      # Esperando la E/S de un fallo de página
+
+    #Inicializa un nuevo proceso, con PID y generador aleatorio propios de la simulación
+    def __init__(self, name, size, min_exec_time=10, max_exec_time=30, pid=None, rng=None):
+        if pid is None:
+            Process._id_counter += 1
+            pid = Process._id_counter
+        self.pid = pid
+        self.rng = rng if rng is not None else random
         self.name = name
+        self.program = name     # Programa que ejecuta (un hijo de fork hereda el del padre)
         self.size = size
         self.state = Process.ACTIVE
         self.page_table = None  # Se asignará después
         self.num_pages = 0      # Se calculará al asignar memoria
         self.page_faults = 0    # Contador de fallos de página
+        self.access_pattern = None  # Patrón de acceso (se asigna al crearlo el simulador)
+        self.memory_group = None    # Grupo de memoria heredado del padre en un fork (None = según su nombre)
 
         # Tiempo de ejecución aleatorio
-        self.execution_time = random.uniform(min_exec_time, max_exec_time)
+        self.execution_time = self.rng.uniform(min_exec_time, max_exec_time)
         self.time_in_system = 0.0  # Tiempo que lleva en el sistema
 
         # Control de suspensión
         self.suspended_time = 0.0  # Tiempo que estará suspendido
         self.time_suspended = 0.0  # Tiempo que lleva suspendido
 
+        # Tiempo acumulado en cada estado
+        self.state_times = {Process.ACTIVE: 0.0, Process.SUSPENDED: 0.0,
+                            Process.SWAPPED: 0.0, Process.BLOCKED: 0.0}
+
+        # Planificación de CPU (solo se usa con un planificador de CPU habilitado)
+        self.priority = 2          # 0 = más alta, 4 = más baja
+        self.cpu_demand = None     # Segundos de CPU que necesita para terminar
+        self.cpu_time = 0.0        # Segundos de CPU consumidos
+        self.arrival_time = 0.0    # Instante de llegada al planificador
+
+        # Reloj simulado de memoria: latencia acumulada de sus accesos (ns)
+        self.memory_time_ns = 0
+
     #Calcula cuántas páginas necesita el proceso
-    def calculate_pages(self, page_size):
+    #Con páginas enormes, la última región se completa si está llena al menos en min_fill
+    def calculate_pages(self, page_size, pages_per_huge=1, min_fill=1.0):
         # Redondear hacia arriba si no es divisible exactamente
         self.num_pages = (self.size + page_size - 1) // page_size
+
+        tail = self.num_pages % pages_per_huge
+        if pages_per_huge > 1 and tail and tail >= pages_per_huge * min_fill:
+            self.num_pages += pages_per_huge - tail
+
         return self.num_pages
 
     #Cambia el estado del proceso
@@ -57,14 +83,24 @@ class Process:
     #Actualiza el tiempo del proceso
     def update_time(self, delta):
         self.time_in_system += delta
+        self.state_times[self.state] = self.state_times.get(self.state, 0.0) + delta
 
         if self.state == Process.SUSPENDED:
             self.time_suspended += delta
 
     #Verifica si el proceso terminó su ejecución
+    #Con planificador de CPU termina al consumir su demanda de CPU
     def is_finished(self):
+        if self.cpu_demand is not None:
+            return self.cpu_time >= self.cpu_demand
         return self.time_in_system >= self.execution_time
 
+    #Retorna la siguiente página que el proceso referencia según su patrón de acceso
+    def next_page(self):
+        if self.access_pattern is None:
+            return self.rng.randint(0, self.num_pages - 1)
+        return self.access_pattern.next_page(self.num_pages)
+
     #   Incrementa el contador de fallos de página
     def increment_page_fault(self):
         self.page_faults += 1
@@ -84,7 +120,9 @@ class Process:
             'Tamaño': f"{self.size} KB",
             'Páginas': self.num_pages,
             'Estado': self.state,
+            'Prioridad': self.priority,
             'Fallos de Página': self.page_faults,
+            'Tiempo en Memoria': f"{self.memory_time_ns / 1e6:.3f} ms",
             'Tiempo Ejecución': f"{self.execution_time:.1f}s",
             'Tiempo en Sistema': f"{self.time_in_system:.1f}s"
         }
@@ -92,4 +130,24 @@ class Process:
     #Reinicia el contador de IDs
     @staticmethod
     def reset_counter():
-        Process._id_counter = 0
\ No newline at end of file
+        Process._id_counter = 0
+
+
+class PidAllocator:
+    """
+    Asignador de PIDs propio de cada simulación
+    Evita que simulaciones paralelas compartan el contador global de Process
+    """
+
+    def __init__(self, start=1):
+        self.next_pid = start
+
+    #Retorna el siguiente PID disponible
+    def allocate(self):
+        pid = self.next_pid
+        self.next_pid += 1
+        return pid
+
+    #Reinicia la numeración de PIDs
+    def reset(self, start=1):
+        self.next_pid = start
\ No newline at end of file
@@ -0,0 +1,801 @@
+"""
+Módulo de Puntos de Control (checkpoint/restore)
+Guarda y restaura el estado completo del simulador en un formato binario compacto
+Los marcos, tablas de páginas y procesos se guardan como arreglos empaquetados
+(módulo array), no como grafos de objetos serializados con pickle
+"""
+import io
+import json
+import random
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+
+from metricas import RingBuffer, SeriesSet
+from patron_acceso import create_pattern
+from proceso import Process
+from tabla_paginas import PageTable
+
+MAGIC = b"SIMCKPT\x00"
+VERSION = 19
+
+# Codificación de los estados de proceso en un byte
+STATE_CODES = [Process.ACTIVE, Process.SUSPENDED, Process.SWAPPED, Process.BLOCKED]
+
+# Bits de bandera de cada entrada de la tabla de páginas
+FLAG_VALID = 1
+FLAG_IN_SWAP = 2
+FLAG_MODIFIED = 4
+FLAG_REFERENCED = 8
+FLAG_COMPRESSED = 16
+FLAG_HUGE = 32
+
+_HEADER = struct.Struct("<8sHiiiiiqqqq")
+_ARRAY_HEADER = struct.Struct("<cQ")
+_FRAME_COLUMNS = 5
+_PATTERN_FIELDS = 7
+_MASK_64 = (1 << 64) - 1
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+#Escribe un arreglo empaquetado precedido por su tipo y longitud
+def _write_array(out, values):
+    if _SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    out.write(_ARRAY_HEADER.pack(values.typecode.encode("ascii"), len(values)))
+    out.write(values.tobytes())
+
+
+#Lee un arreglo empaquetado escrito con _write_array
+def _read_array(data, offset):
+    typecode, count = _ARRAY_HEADER.unpack_from(data, offset)
+    offset += _ARRAY_HEADER.size
+    values = array(typecode.decode("ascii"))
+    nbytes = count * values.itemsize
+    values.frombytes(data[offset:offset + nbytes])
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values, offset + nbytes
+
+
+#Empaqueta una lista de cadenas como un bloque UTF-8 separado por NUL
+def _pack_strings(strings):
+    return array("B", "\x00".join(strings).encode("utf-8"))
+
+
+#Desempaqueta un bloque creado con _pack_strings
+def _unpack_strings(blob, count):
+    if count == 0:
+        return []
+    return blob.tobytes().decode("utf-8").split("\x00")
+
+
+#Empaqueta los marcos ocupados de una lista (RAM o SWAP), una columna por campo
+#Los marcos libres no se guardan: en una memoria grande casi vacía el costo es el de los ocupados
+def _pack_frames(occupied, out):
+    _write_array(out, array("i", [frame.frame_id for frame in occupied]))
+    _write_array(out, array("i", [frame.process.pid for frame in occupied]))
+    _write_array(out, array("i", [frame.page_number for frame in occupied]))
+    _write_array(out, array("d", [frame.load_time for frame in occupied]))
+    _write_array(out, array("d", [frame.last_access for frame in occupied]))
+
+
+#Restaura el estado de los marcos a partir de las columnas empaquetadas
+def _unpack_frames(frames, data, offset, processes_by_pid):
+    frame_ids, offset = _read_array(data, offset)
+    owners, offset = _read_array(data, offset)
+    pages, offset = _read_array(data, offset)
+    load_times, offset = _read_array(data, offset)
+    last_access, offset = _read_array(data, offset)
+
+    for frame in [frame for frame in frames if not frame.is_free]:
+        frame.free()
+
+    for frame_id, owner, page, loaded, accessed in zip(frame_ids, owners, pages, load_times, last_access):
+        frame = frames[frame_id]
+        frame.is_free = False
+        frame.process = processes_by_pid[owner]
+        frame.page_number = page
+        frame.load_time = loaded
+        frame.last_access = accessed
+
+    return offset
+
+
+#Empaqueta los patrones de acceso de los procesos: su especificación (tipo y parámetros)
+#y su estado (generadores, búfer y cursor)
+def _pack_patterns(processes, out):
+    specs = []
+    fields = array("q")
+    rng_states = array("I")
+    rng_extra = array("d")
+    buffers = array("i")
+    np_states = array("Q")
+
+    for process in processes:
+        pattern = process.access_pattern
+        if pattern is None:
+            specs.append("")
+            fields.extend([0] * _PATTERN_FIELDS)
+            continue
+        specs.append(json.dumps(pattern.get_spec(), sort_keys=True))
+        state = pattern.get_state()
+        version, internal_state, gauss_next = state['rng']
+        np_state = state['np_rng']
+        fields.extend([1, state['buffer_pos'], state['buffer_pages'], state['cursor'], len(state['buffer']),
+                       0 if np_state is None else 1, 0 if np_state is None else np_state['has_uint32']])
+        rng_states.extend(internal_state)
+        rng_extra.extend([version, 0.0 if gauss_next is None else 1.0, gauss_next or 0.0])
+        buffers.extend(state['buffer'])
+        if np_state is not None:
+            if np_state['bit_generator'] != "PCG64":
+                raise ValueError(f"Generador de NumPy no soportado: {np_state['bit_generator']}")
+            pcg = np_state['state']
+            np_states.extend([pcg['state'] >> 64, pcg['state'] & _MASK_64,
+                              pcg['inc'] >> 64, pcg['inc'] & _MASK_64, np_state['uinteger']])
+
+    for values in (_pack_strings(specs), fields, rng_states, rng_extra, buffers, np_states):
+        _write_array(out, values)
+
+
+#Lee los patrones de acceso empaquetados con _pack_patterns: una (especificación, estado) o None por proceso
+def _unpack_patterns(data, offset, num_processes):
+    specs_blob, offset = _read_array(data, offset)
+    specs = _unpack_strings(specs_blob, num_processes)
+    fields, offset = _read_array(data, offset)
+    rng_states, offset = _read_array(data, offset)
+    rng_extra, offset = _read_array(data, offset)
+    buffers, offset = _read_array(data, offset)
+    np_states, offset = _read_array(data, offset)
+
+    states = []
+    rng_pos = extra_pos = buffer_pos = np_pos = 0
+    for i in range(num_processes):
+        (has_pattern, position, pages, cursor, buffer_len,
+         has_np, has_uint32) = fields[i * _PATTERN_FIELDS:(i + 1) * _PATTERN_FIELDS]
+        if not has_pattern:
+            states.append(None)
+            continue
+        version, has_gauss, gauss_next = rng_extra[extra_pos:extra_pos + 3]
+        np_state = None
+        if has_np:
+            state_hi, state_lo, inc_hi, inc_lo, uinteger = np_states[np_pos:np_pos + 5]
+            np_state = {'bit_generator': "PCG64",
+                        'state': {'state': (state_hi << 64) | state_lo, 'inc': (inc_hi << 64) | inc_lo},
+                        'has_uint32': has_uint32, 'uinteger': uinteger}
+            np_pos += 5
+        states.append((json.loads(specs[i]), {
+            'rng': (int(version), tuple(rng_states[rng_pos:rng_pos + 625]), gauss_next if has_gauss else None),
+            'np_rng': np_state,
+            'buffer': buffers[buffer_pos:buffer_pos + buffer_len].tolist(),
+            'buffer_pos': position,
+            'buffer_pages': pages,
+            'cursor': cursor
+        }))
+        rng_pos += 625
+        extra_pos += 3
+        buffer_pos += buffer_len
+
+    return states, offset
+
+
+#Separa una lista plana en trozos con las longitudes dadas
+def _split(values, lengths):
+    chunks = []
+    start = 0
+    for length in lengths:
+        chunks.append(values[start:start + length])
+        start += length
+    return chunks
+
+
+#Escribe escalares y colas de filas (pid, clave, secuencia), el formato de get_state del planificador
+def _write_rows(out, scalars, queues):
+    rows = [row for queue in queues for row in queue]
+    _write_array(out, array("d", scalars))
+    _write_array(out, array("i", [len(queue) for queue in queues]))
+    _write_array(out, array("i", [pid for pid, _, _ in rows]))
+    _write_array(out, array("d", [key for _, key, _ in rows]))
+    _write_array(out, array("q", [sequence for _, _, sequence in rows]))
+
+
+#Lee escalares y colas escritos con _write_rows
+def _read_rows(data, offset):
+    scalars, offset = _read_array(data, offset)
+    lengths, offset = _read_array(data, offset)
+    pids, offset = _read_array(data, offset)
+    keys, offset = _read_array(data, offset)
+    sequences, offset = _read_array(data, offset)
+    rows = list(zip(pids, keys, sequences))
+    return list(scalars), _split(rows, lengths), offset
+
+
+#Empaqueta las listas del algoritmo de reemplazo (residentes, fantasmas y parámetros adaptativos)
+def _pack_policy(algorithm, out):
+    scalars, frame_lists, page_lists = algorithm.get_state()
+    entries = [entry for frame_list in frame_lists for entry in frame_list]
+    keys = [key for page_list in page_lists for key in page_list]
+
+    _write_array(out, _pack_strings([algorithm.get_algorithm_name()]))
+    _write_array(out, array("d", scalars))
+    _write_array(out, array("i", [len(frame_list) for frame_list in frame_lists]))
+    _write_array(out, array("i", [frame_id for frame_id, _ in entries]))
+    _write_array(out, array("d", [stamp for _, (stamp, _) in entries]))
+    _write_array(out, array("i", [pid for _, (_, (pid, _)) in entries]))
+    _write_array(out, array("i", [page_num for _, (_, (_, page_num)) in entries]))
+    _write_array(out, array("i", [len(page_list) for page_list in page_lists]))
+    _write_array(out, array("i", [pid for pid, _ in keys]))
+    _write_array(out, array("i", [page_num for _, page_num in keys]))
+
+
+#Lee el estado del algoritmo de reemplazo: (nombre, escalares, listas de marcos, listas de páginas)
+def _unpack_policy(data, offset):
+    name_blob, offset = _read_array(data, offset)
+    scalars, offset = _read_array(data, offset)
+    frame_lengths, offset = _read_array(data, offset)
+    frame_ids, offset = _read_array(data, offset)
+    stamps, offset = _read_array(data, offset)
+    frame_pids, offset = _read_array(data, offset)
+    frame_pages, offset = _read_array(data, offset)
+    page_lengths, offset = _read_array(data, offset)
+    pids, offset = _read_array(data, offset)
+    pages, offset = _read_array(data, offset)
+
+    entries = [(frame_id, (stamp, (pid, page_num)))
+               for frame_id, stamp, pid, page_num in zip(frame_ids, stamps, frame_pids, frame_pages)]
+    keys = list(zip(pids, pages))
+    state = (_unpack_strings(name_blob, 1)[0], list(scalars), _split(entries, frame_lengths), _split(keys, page_lengths))
+    return state, offset
+
+
+#Empaqueta un histograma logarítmico: cubetas y [total, suma, mínimo, máximo] (-1 = sin valores)
+#seguidos de si el mínimo y el máximo eran enteros, para restaurarlos con el mismo tipo
+def _pack_histogram(histogram, out):
+    _write_array(out, histogram.counts)
+    _write_array(out, array("d", [histogram.total, histogram.sum,
+                                  -1.0 if histogram.min is None else histogram.min,
+                                  -1.0 if histogram.max is None else histogram.max,
+                                  isinstance(histogram.min, int), isinstance(histogram.max, int)]))
+
+
+#Restaura un histograma empaquetado con _pack_histogram
+def _unpack_histogram(histogram, data, offset):
+    histogram.counts, offset = _read_array(data, offset)
+    (total, histogram.sum, minimum, maximum, min_is_int, max_is_int), offset = _read_array(data, offset)
+    histogram.total = int(total)
+    histogram.min = None if minimum < 0 else (int(minimum) if min_is_int else minimum)
+    histogram.max = None if maximum < 0 else (int(maximum) if max_is_int else maximum)
+    return offset
+
+
+#Empaqueta un conjunto de series: los búferes circulares (instantes y cada campo) y sus histogramas
+def _pack_series(series, out):
+    for ring in [series.times] + [series.series[field] for field in SeriesSet.FIELDS]:
+        _write_array(out, array("q", [ring.start, ring.count]))
+        _write_array(out, ring.values)
+    for field in SeriesSet.FIELDS:
+        _pack_histogram(series.histograms[field], out)
+
+
+#Lee un conjunto de series empaquetado con _pack_series
+def _unpack_series(data, offset):
+    series = SeriesSet(1)
+    rings = []
+    for _ in range(1 + len(SeriesSet.FIELDS)):
+        (start, count), offset = _read_array(data, offset)
+        ring = RingBuffer(1)
+        ring.values, offset = _read_array(data, offset)
+        ring.capacity, ring.start, ring.count = len(ring.values), start, count
+        rings.append(ring)
+    series.times = rings[0]
+    series.series = dict(zip(SeriesSet.FIELDS, rings[1:]))
+    for field in SeriesSet.FIELDS:
+        offset = _unpack_histogram(series.histograms[field], data, offset)
+    return series, offset
+
+
+#Empaqueta el registrador de métricas: escalares, series globales, series por proceso
+#y las últimas muestras de cada proceso
+def _pack_metrics(metrics, out):
+    last_sample = -1.0 if metrics._last_sample_time is None else metrics._last_sample_time
+    _write_array(out, array("d", [last_sample, metrics._last_total_faults]
+                            + [metrics.state_times.get(state, 0.0) for state in STATE_CODES]))
+    _pack_series(metrics.global_series, out)
+
+    _write_array(out, array("i", list(metrics.process_series)))
+    for series in metrics.process_series.values():
+        _pack_series(series, out)
+
+    _write_array(out, array("i", list(metrics._last_process_faults)))
+    _write_array(out, array("q", list(metrics._last_process_faults.values())))
+    _write_array(out, array("i", list(metrics._last_state_times)))
+    _write_array(out, array("d", [times.get(state, 0.0) for times in metrics._last_state_times.values()
+                                  for state in STATE_CODES]))
+
+
+#Restaura el registrador de métricas empaquetado con _pack_metrics
+def _unpack_metrics(metrics, data, offset):
+    scalars, offset = _read_array(data, offset)
+    last_sample, last_total_faults, *state_times = scalars
+    metrics._last_sample_time = None if last_sample < 0 else last_sample
+    metrics._last_total_faults = int(last_total_faults)
+    metrics.state_times = dict(zip(STATE_CODES, state_times))
+    metrics.global_series, offset = _unpack_series(data, offset)
+
+    series_pids, offset = _read_array(data, offset)
+    metrics.process_series = {}
+    for pid in series_pids:
+        metrics.process_series[pid], offset = _unpack_series(data, offset)
+
+    fault_pids, offset = _read_array(data, offset)
+    faults, offset = _read_array(data, offset)
+    metrics._last_process_faults = dict(zip(fault_pids, faults))
+    state_pids, offset = _read_array(data, offset)
+    times, offset = _read_array(data, offset)
+    width = len(STATE_CODES)
+    metrics._last_state_times = {pid: dict(zip(STATE_CODES, times[i * width:(i + 1) * width]))
+                                 for i, pid in enumerate(state_pids)}
+    return offset
+
+
+#Serializa el estado completo del simulador a bytes
+#Con controller se guardan también su planificador de CPU, control de carga y reclamador
+def dump_state(memory_manager, generator=None, controller=None):
+    if generator is None and controller is not None:
+        generator = controller.generator
+    out = io.BytesIO()
+    processes = memory_manager.processes
+
+    out.write(_HEADER.pack(
+        MAGIC, VERSION,
+        len(memory_manager.ram_frames),
+        len(memory_manager.swap_frames),
+        memory_manager.config.page_size,
+        memory_manager.pages_per_huge,
+        len(processes),
+        memory_manager.total_page_faults,
+        memory_manager.total_swaps,
+        memory_manager.pid_allocator.next_pid,
+        memory_manager.clock
+    ))
+
+    # Marcos ocupados de RAM y SWAP (se recorren una sola vez)
+    occupied = [[frame for frame in frames if not frame.is_free]
+                for frames in (memory_manager.ram_frames, memory_manager.swap_frames)]
+    for frames in occupied:
+        _pack_frames(frames, out)
+
+    # Procesos, un arreglo por campo
+    _write_array(out, array("i", [p.pid for p in processes]))
+    _write_array(out, array("i", [p.size for p in processes]))
+    _write_array(out, array("B", [STATE_CODES.index(p.state) for p in processes]))
+    _write_array(out, array("i", [p.num_pages for p in processes]))
+    _write_array(out, array("i", [p.page_faults for p in processes]))
+    _write_array(out, array("d", [p.execution_time for p in processes]))
+    _write_array(out, array("d", [p.time_in_system for p in processes]))
+    _write_array(out, array("d", [p.suspended_time for p in processes]))
+    _write_array(out, array("d", [p.time_suspended for p in processes]))
+    _write_array(out, array("b", [p.priority for p in processes]))
+    _write_array(out, array("d", [-1.0 if p.cpu_demand is None else p.cpu_demand for p in processes]))
+    _write_array(out, array("d", [p.cpu_time for p in processes]))
+    _write_array(out, array("q", [p.memory_time_ns for p in processes]))
+    _write_array(out, array("d", [p.arrival_time for p in processes]))
+    _write_array(out, array("d", [p.state_times.get(state, 0.0) for p in processes for state in STATE_CODES]))
+    _write_array(out, _pack_strings([p.name for p in processes]))
+    _write_array(out, _pack_strings([p.memory_group or "" for p in processes]))
+    _write_array(out, _pack_strings([p.program for p in processes]))
+
+    # Tablas de páginas concatenadas en el orden de los procesos
+    frame_numbers = array("i")
+    flags = array("B")
+    for process in processes:
+        page_table = process.page_table
+        for entry in page_table.entries:
+            frame_numbers.append(-1 if entry.frame_number is None else entry.frame_number)
+            flags.append(
+                (FLAG_VALID if entry.valid else 0)
+                | (FLAG_IN_SWAP if entry.in_swap else 0)
+                | (FLAG_MODIFIED if entry.modified else 0)
+                | (FLAG_REFERENCED if entry.referenced else 0)
+                | (FLAG_COMPRESSED if entry.compressed else 0)
+                | (FLAG_HUGE if page_table.is_page_huge(entry.page_number) else 0)
+            )
+    _write_array(out, frame_numbers)
+    _write_array(out, flags)
+
+    # Pool comprimido en orden LRU: (pid, página, KB comprimidos)
+    pool_entries = memory_manager.compressed_pool.entries.values() if memory_manager.compressed_pool else []
+    _write_array(out, array("i", [process.pid for process, _, _ in pool_entries]))
+    _write_array(out, array("i", [page_num for _, page_num, _ in pool_entries]))
+    _write_array(out, array("d", [kb for _, _, kb in pool_entries]))
+
+    # Referencias adicionales de marcos compartidos por fork: (0 RAM / 1 SWAP, marco, pid, página)
+    shared = [(location, frame.frame_id, process.pid, page_num)
+              for location, frames in enumerate(occupied)
+              for frame in frames if frame.sharers
+              for process, page_num in frame.sharers]
+    for column in range(4):
+        _write_array(out, array("B" if column == 0 else "i", [row[column] for row in shared]))
+
+    # Páginas escritas, que la deduplicación ya no puede fusionar
+    written = sorted(memory_manager.deduplicator.written) if memory_manager.deduplicator else []
+    _write_array(out, array("i", [pid for pid, _ in written]))
+    _write_array(out, array("i", [page_num for _, page_num in written]))
+
+    # Estado de los flujos aleatorios de la simulación, en el orden de STREAMS
+    for version, internal_state, gauss_next in memory_manager.random.get_state().values():
+        _write_array(out, array("I", internal_state))
+        _write_array(out, array("d", [version, 0.0 if gauss_next is None else 1.0, gauss_next or 0.0]))
+
+    # Estado del generador de procesos
+    if generator is not None:
+        used_names = sorted(generator.used_names)
+        next_arrival = -1.0 if generator.next_arrival_time is None else generator.next_arrival_time
+        _write_array(out, array("i", [1, generator.min_size, generator.max_size, generator.process_counter,
+                                      len(used_names), len(generator.free_names)]))
+        _write_array(out, array("d", [generator.min_interval, generator.max_interval, next_arrival]))
+        _write_array(out, _pack_strings(used_names))
+        _write_array(out, _pack_strings(generator.free_names))
+        _write_array(out, array("d", generator.arrivals.get_state()))
+    else:
+        _write_array(out, array("i", [0]))
+
+    # Estado interno de los patrones de acceso, en el orden de los procesos
+    _pack_patterns(processes, out)
+
+    # Listas del algoritmo de reemplazo
+    _pack_policy(memory_manager.replacement_algorithm, out)
+
+    # Contadores de eventos del gestor
+    _write_array(out, array("q", [memory_manager.total_forks, memory_manager.first_touch_faults,
+                                  memory_manager.cow_copies, memory_manager.direct_reclaims,
+                                  memory_manager.huge_splits]))
+
+    # TLB en orden LRU, contadores e histograma de latencias
+    latency_model = memory_manager.latency_model
+    tlb = latency_model.tlb
+    histogram = latency_model.histogram
+    _write_array(out, array("i", [pid for pid, _ in tlb.entries]))
+    _write_array(out, array("i", [page_num for _, page_num in tlb.entries]))
+    _write_array(out, array("q", [tlb.hits, tlb.misses, histogram.total]))
+    _write_array(out, histogram.counts)
+    _write_array(out, array("d", [histogram.sum,
+                                  -1.0 if histogram.min is None else histogram.min,
+                                  -1.0 if histogram.max is None else histogram.max]))
+
+    # Estado del controlador: planificador de CPU, control de carga y reclamador
+    scheduler = controller.cpu_scheduler if controller is not None else None
+    load_controller = controller.load_controller if controller is not None else None
+    reclaimer = controller.reclaimer if controller is not None else None
+    _write_array(out, array("i", [controller is not None, scheduler is not None,
+                                  load_controller is not None, reclaimer is not None]))
+    if controller is not None:
+        _write_array(out, array("d", [controller.sim_time, controller.completed_processes]))
+    if scheduler is not None:
+        _write_array(out, _pack_strings([scheduler.policy.name]))
+        _write_rows(out, *scheduler.get_state())
+    if load_controller is not None:
+        _write_rows(out, [
+            load_controller.fault_rate, load_controller.thrashing, load_controller._now,
+            load_controller._last_faults, load_controller.rejected_admissions,
+            load_controller.swapped_out_processes, load_controller.reactivated_processes,
+            load_controller.thrashing_time
+        ], [[(pid, held_at, 0) for pid, (_, held_at) in load_controller.held.items()]])
+    if reclaimer is not None:
+        _write_array(out, array("d", [reclaimer.active, reclaimer.wakeups, reclaimer.reclaimed_pages,
+                                      reclaimer.reclaim_cost, reclaimer.stalls]))
+
+    # Contadores del pool comprimido (vacío sin pool)
+    pool = memory_manager.compressed_pool
+    _write_array(out, array("q", pool.get_state() if pool is not None else []))
+
+    # Escáner de deduplicación: escalares y árbol estable (tipo, programa, página) -> marco
+    deduplicator = memory_manager.deduplicator
+    dedup_scalars, stable = deduplicator.get_state() if deduplicator is not None else ([], [])
+    _write_array(out, array("q", dedup_scalars))
+    _write_array(out, _pack_strings([kind for (kind, _, _), _ in stable]))
+    _write_array(out, _pack_strings([program for (_, program, _), _ in stable]))
+    _write_array(out, array("i", [page_num for (_, _, page_num), _ in stable]))
+    _write_array(out, array("i", [frame_id for _, frame_id in stable]))
+
+    # Contadores y listas de reclamo de los grupos de memoria
+    groups = memory_manager.groups
+    _write_rows(out, *(groups.get_state() if groups is not None else ([], [])))
+
+    # Series de tiempo e histogramas de las métricas
+    _pack_metrics(memory_manager.metrics, out)
+
+    return out.getvalue()
+
+
+#Restaura el estado completo del simulador desde bytes generados por dump_state
+#Con controller se restauran también su planificador de CPU, control de carga y reclamador
+def load_state(memory_manager, data, generator=None, controller=None):
+    if generator is None and controller is not None:
+        generator = controller.generator
+    data = memoryview(data)
+    (magic, version, ram_count, swap_count, page_size, pages_per_huge, num_processes,
+     total_page_faults, total_swaps, next_pid, clock) = _HEADER.unpack_from(data, 0)
+
+    if magic != MAGIC:
+        raise ValueError("El archivo no es un punto de control del simulador")
+    if version != VERSION:
+        raise ValueError(f"Versión de punto de control no soportada: {version}")
+    if ram_count != len(memory_manager.ram_frames) or swap_count != len(memory_manager.swap_frames):
+        raise ValueError("El punto de control no coincide con el número de marcos configurado")
+    if page_size != memory_manager.config.page_size:
+        raise ValueError("El punto de control no coincide con el tamaño de página configurado")
+    if pages_per_huge != memory_manager.pages_per_huge:
+        raise ValueError("El punto de control no coincide con el tamaño de página enorme configurado")
+
+    offset = _HEADER.size
+
+    # Los marcos se leen primero pero se aplican cuando existan los procesos
+    frames_offset = offset
+    for _ in range(2 * _FRAME_COLUMNS):
+        _, offset = _read_array(data, offset)
+
+    pids, offset = _read_array(data, offset)
+    sizes, offset = _read_array(data, offset)
+    states, offset = _read_array(data, offset)
+    num_pages, offset = _read_array(data, offset)
+    page_faults, offset = _read_array(data, offset)
+    exec_times, offset = _read_array(data, offset)
+    times_in_system, offset = _read_array(data, offset)
+    suspended_times, offset = _read_array(data, offset)
+    times_suspended, offset = _read_array(data, offset)
+    priorities, offset = _read_array(data, offset)
+    cpu_demands, offset = _read_array(data, offset)
+    cpu_times, offset = _read_array(data, offset)
+    memory_times, offset = _read_array(data, offset)
+    arrival_times, offset = _read_array(data, offset)
+    state_times, offset = _read_array(data, offset)
+    names_blob, offset = _read_array(data, offset)
+    names = _unpack_strings(names_blob, num_processes)
+    groups_blob, offset = _read_array(data, offset)
+    memory_groups = _unpack_strings(groups_blob, num_processes)
+    programs_blob, offset = _read_array(data, offset)
+    programs = _unpack_strings(programs_blob, num_processes)
+
+    frame_numbers, offset = _read_array(data, offset)
+    flags, offset = _read_array(data, offset)
+
+    pool_pids, offset = _read_array(data, offset)
+    pool_pages, offset = _read_array(data, offset)
+    pool_kbs, offset = _read_array(data, offset)
+
+    shared_columns = []
+    for _ in range(4):
+        column, offset = _read_array(data, offset)
+        shared_columns.append(column)
+
+    written_pids, offset = _read_array(data, offset)
+    written_pages, offset = _read_array(data, offset)
+
+    pool = memory_manager.compressed_pool
+    if len(pool_pids) and pool is None:
+        raise ValueError("El punto de control tiene páginas comprimidas pero el pool está deshabilitado")
+
+    rng_state = {}
+    for stream in memory_manager.random.STREAMS:
+        rng_internal, offset = _read_array(data, offset)
+        rng_version, has_gauss, gauss_next = _read_array(data, offset)[0]
+        offset = _read_array(data, offset)[1]
+        rng_state[stream] = (int(rng_version), tuple(rng_internal), gauss_next if has_gauss else None)
+
+    # Restaurar los flujos aleatorios antes de reconstruir nada; los objetos recreados
+    # usan un generador auxiliar para no consumir números de los flujos restaurados
+    memory_manager.random.set_state(rng_state)
+    scratch = random.Random(0)
+
+    generator_ints, offset = _read_array(data, offset)
+    generator_state = None
+    if generator_ints[0]:
+        generator_floats, offset = _read_array(data, offset)
+        used_blob, offset = _read_array(data, offset)
+        free_blob, offset = _read_array(data, offset)
+        arrival_state, offset = _read_array(data, offset)
+        generator_state = (generator_ints, generator_floats, used_blob, free_blob, arrival_state)
+
+    pattern_states, offset = _unpack_patterns(data, offset, num_processes)
+    policy_state, offset = _unpack_policy(data, offset)
+    manager_counts, offset = _read_array(data, offset)
+
+    tlb_pids, offset = _read_array(data, offset)
+    tlb_pages, offset = _read_array(data, offset)
+    latency_counts, offset = _read_array(data, offset)
+    histogram_counts, offset = _read_array(data, offset)
+    histogram_floats, offset = _read_array(data, offset)
+
+    # Reconstruir procesos y sus tablas de páginas
+    processes = []
+    processes_by_pid = {}
+    entry_index = 0
+    for i in range(num_processes):
+        process = Process(names[i], sizes[i], pid=pids[i], rng=scratch)
+        process.rng = memory_manager.random.lifetimes
+        process.state = STATE_CODES[states[i]]
+        process.page_faults = page_faults[i]
+        process.execution_time = exec_times[i]
+        process.time_in_system = times_in_system[i]
+        process.suspended_time = suspended_times[i]
+        process.time_suspended = times_suspended[i]
+        process.priority = priorities[i]
+        process.cpu_demand = None if cpu_demands[i] < 0 else cpu_demands[i]
+        process.cpu_time = cpu_times[i]
+        process.memory_time_ns = memory_times[i]
+        process.arrival_time = arrival_times[i]
+        process.state_times = dict(zip(STATE_CODES, state_times[i * len(STATE_CODES):(i + 1) * len(STATE_CODES)]))
+        process.num_pages = num_pages[i]
+        process.memory_group = memory_groups[i] or None
+        process.program = programs[i]
+
+        page_table = PageTable(process, num_pages[i], memory_manager.pages_per_huge)
+        for entry in page_table.entries:
+            frame_number = frame_numbers[entry_index]
+            entry_flags = flags[entry_index]
+            entry.frame_number = None if frame_number < 0 else frame_number
+            entry.valid = bool(entry_flags & FLAG_VALID)
+            entry.in_swap = bool(entry_flags & FLAG_IN_SWAP)
+            entry.modified = bool(entry_flags & FLAG_MODIFIED)
+            entry.referenced = bool(entry_flags & FLAG_REFERENCED)
+            entry.compressed = bool(entry_flags & FLAG_COMPRESSED)
+            if entry_flags & FLAG_HUGE:
+                page_table.set_huge_region(page_table.region_of(entry.page_number))
+            entry_index += 1
+        page_table.recount()
+        process.page_table = page_table
+
+        # El patrón se recrea con el tipo y los parámetros guardados (un hijo de fork usa el de su padre)
+        if pattern_states[i] is not None:
+            spec, pattern_state = pattern_states[i]
+            process.access_pattern = create_pattern(spec, rng=random.Random())
+            process.access_pattern.set_state(pattern_state)
+
+        processes.append(process)
+        processes_by_pid[process.pid] = process
+
+    frames_offset = _unpack_frames(memory_manager.ram_frames, data, frames_offset, processes_by_pid)
+    _unpack_frames(memory_manager.swap_frames, data, frames_offset, processes_by_pid)
+
+    shared_frames = set()
+    for location, frame_id, pid, page_num in zip(*shared_columns):
+        frame = (memory_manager.ram_frames, memory_manager.swap_frames)[location][frame_id]
+        frame.share(processes_by_pid[pid], page_num)
+        shared_frames.add(frame)
+    for frame in shared_frames:
+        memory_manager._refresh_cow(frame)
+
+    if memory_manager.deduplicator is not None:
+        memory_manager.deduplicator.written = set(zip(written_pids, written_pages))
+
+    if pool is not None:
+        pool.entries.clear()
+        pool.used_kb = 0.0
+        for pid, page_num, kb in zip(pool_pids, pool_pages, pool_kbs):
+            pool.entries[(pid, page_num)] = (processes_by_pid[pid], page_num, kb)
+            pool.used_kb += kb
+
+    memory_manager.processes = processes
+    memory_manager._reindex_processes()
+    # Todos los marcos pudieron cambiar: una grabación en curso debe revisarlos todos
+    if memory_manager.frame_changes is not None:
+        memory_manager.track_frame_changes()
+    memory_manager.total_page_faults = total_page_faults
+    memory_manager.total_swaps = total_swaps
+    memory_manager.pid_allocator.next_pid = next_pid
+    memory_manager.clock = clock
+    (memory_manager.total_forks, memory_manager.first_touch_faults, memory_manager.cow_copies,
+     memory_manager.direct_reclaims, memory_manager.huge_splits) = manager_counts
+
+    # Listas del algoritmo de reemplazo; con otro algoritmo configurado se registran los marcos al elegir víctima
+    algorithm = memory_manager.replacement_algorithm
+    name, *policy_lists = policy_state
+    if name == algorithm.get_algorithm_name():
+        algorithm.set_state(*policy_lists)
+
+    latency_model = memory_manager.latency_model
+    latency_model.tlb.entries = OrderedDict.fromkeys(zip(tlb_pids, tlb_pages), True)
+    while len(latency_model.tlb.entries) > latency_model.tlb.capacity:
+        latency_model.tlb.entries.popitem(last=False)
+    latency_model.tlb.hits, latency_model.tlb.misses, total = latency_counts
+    histogram = latency_model.histogram
+    histogram.total = total
+    histogram.counts = histogram_counts
+    histogram.sum, histogram_min, histogram_max = histogram_floats
+    histogram.min = None if histogram_min < 0 else histogram_min
+    histogram.max = None if histogram_max < 0 else histogram_max
+
+    # Los planificadores pueden referirse a procesos que ya terminaron y aún no descartaron:
+    # se resuelven con un proceso desligado del gestor, que descartan igual que antes
+    detached = {}
+
+    def resolve(pid):
+        process = processes_by_pid.get(pid)
+        if process is None:
+            process = detached.setdefault(pid, Process("", 0, pid=pid, rng=scratch))
+        return process
+
+    has_controller, has_scheduler, has_load_controller, has_reclaimer = _read_array(data, offset)[0]
+    offset = _read_array(data, offset)[1]
+    if has_controller:
+        controller_floats, offset = _read_array(data, offset)
+        if controller is not None:
+            controller.sim_time, completed_processes = controller_floats
+            controller.completed_processes = int(completed_processes)
+    if has_scheduler:
+        policy_blob, offset = _read_array(data, offset)
+        scalars, queues, offset = _read_rows(data, offset)
+        scheduler = controller.cpu_scheduler if controller is not None else None
+        if scheduler is not None and scheduler.policy.name == _unpack_strings(policy_blob, 1)[0]:
+            scheduler.set_state(scalars, queues, resolve)
+    if has_load_controller:
+        scalars, (held,), offset = _read_rows(data, offset)
+        load_controller = controller.load_controller if controller is not None else None
+        if load_controller is not None:
+            (load_controller.fault_rate, thrashing, load_controller._now, last_faults, rejected,
+             swapped_out, reactivated, load_controller.thrashing_time) = scalars
+            load_controller.thrashing = bool(thrashing)
+            load_controller._last_faults = int(last_faults)
+            load_controller.rejected_admissions = int(rejected)
+            load_controller.swapped_out_processes = int(swapped_out)
+            load_controller.reactivated_processes = int(reactivated)
+            load_controller.held = {pid: (processes_by_pid[pid], held_at)
+                                    for pid, held_at, _ in held if pid in processes_by_pid}
+    if has_reclaimer:
+        reclaimer_floats, offset = _read_array(data, offset)
+        reclaimer = controller.reclaimer if controller is not None else None
+        if reclaimer is not None:
+            active, wakeups, reclaimed_pages, reclaimer.reclaim_cost, stalls = reclaimer_floats
+            reclaimer.active = bool(active)
+            reclaimer.wakeups = int(wakeups)
+            reclaimer.reclaimed_pages = int(reclaimed_pages)
+            reclaimer.stalls = int(stalls)
+
+    pool_counters, offset = _read_array(data, offset)
+    if pool is not None and len(pool_counters):
+        pool.set_state(pool_counters)
+
+    dedup_scalars, offset = _read_array(data, offset)
+    kinds_blob, offset = _read_array(data, offset)
+    programs_blob, offset = _read_array(data, offset)
+    stable_pages, offset = _read_array(data, offset)
+    stable_frames, offset = _read_array(data, offset)
+    if memory_manager.deduplicator is not None and len(dedup_scalars):
+        count = len(stable_frames)
+        fingerprints = zip(_unpack_strings(kinds_blob, count), _unpack_strings(programs_blob, count), stable_pages)
+        memory_manager.deduplicator.set_state(dedup_scalars, list(zip(fingerprints, stable_frames)))
+
+    group_scalars, group_queues, offset = _read_rows(data, offset)
+    if memory_manager.groups is not None:
+        memory_manager.groups.set_state(group_scalars, group_queues)
+
+    offset = _unpack_metrics(memory_manager.metrics, data, offset)
+
+    if generator_state is not None and generator is not None:
+        generator_ints, generator_floats, used_blob, free_blob, arrival_state = generator_state
+        _, generator.min_size, generator.max_size, generator.process_counter, used_count, free_count = generator_ints
+        generator.min_interval, generator.max_interval, next_arrival = generator_floats
+        generator.next_arrival_time = None if next_arrival < 0 else next_arrival
+        generator.set_names(_unpack_strings(used_blob, used_count), _unpack_strings(free_blob, free_count))
+        generator.arrivals.set_state(arrival_state)
+
+    memory_manager._log_event(f"Punto de control restaurado ({num_processes} procesos)", "INFO")
+
+
+#Guarda un punto de control en un archivo, retorna el número de bytes escritos
+def save_checkpoint(memory_manager, path, generator=None, controller=None):
+    data = dump_state(memory_manager, generator, controller)
+    with open(path, "wb") as f:
+        f.write(data)
+    memory_manager._log_event(f"Punto de control guardado en {path}", "INFO")
+    return len(data)
+
+
+#Carga un punto de control desde un archivo sobre un gestor ya configurado
+def load_checkpoint(memory_manager, path, generator=None, controller=None):
+    with open(path, "rb") as f:
+        data = f.read()
+    load_state(memory_manager, data, generator, controller)
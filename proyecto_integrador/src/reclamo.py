@@ -0,0 +1,76 @@
+"""
+Módulo de Reclamo en Segundo Plano
+Reclamador de marcos al estilo de kswapd: cuando los marcos libres de RAM bajan
+de la marca de agua baja se despierta y, en cada ciclo, desaloja un lote de
+páginas con el algoritmo de reemplazo hasta volver a la marca alta. Así los
+fallos de página encuentran marcos libres y no pagan la selección de la víctima
+ni la escritura a SWAP (reclamo directo)
+"""
+import math
+
+
+class BackgroundReclaimer:
+    """
+    Reclamo con histéresis entre una marca de agua baja y una alta de marcos libres
+    """
+
+    def __init__(self, memory_manager, low_watermark=0.05, high_watermark=0.15, batch_size=4):
+        """
+        Inicializa el reclamador
+
+        Args:
+            memory_manager (MemoryManager): Gestor de memoria cuyos marcos se reclaman
+            low_watermark (float): Fracción de marcos de RAM libres bajo la cual se despierta
+            high_watermark (float): Fracción de marcos de RAM libres a la que vuelve a dormir
+            batch_size (int): Páginas desalojadas por ciclo como máximo
+        """
+        num_frames = len(memory_manager.ram_frames)
+
+        self.memory_manager = memory_manager
+        self.low_watermark = max(1, math.ceil(low_watermark * num_frames))
+        self.high_watermark = min(num_frames, max(self.low_watermark + 1, math.ceil(high_watermark * num_frames)))
+        self.batch_size = batch_size
+        self.active = False
+
+        # Estadísticas
+        self.wakeups = 0
+        self.reclaimed_pages = 0
+        self.reclaim_cost = 0.0
+        self.stalls = 0
+
+    #Marcos de RAM libres
+    def free_frames(self):
+        return self.memory_manager._count_free_frames(self.memory_manager.ram_frames)
+
+    #Revisa las marcas de agua y desaloja un lote si está despierto; retorna las páginas reclamadas
+    def update(self):
+        free = self.free_frames()
+
+        if not self.active:
+            if free >= self.low_watermark:
+                return 0
+            self.active = True
+            self.wakeups += 1
+
+        reclaimed, cost = self.memory_manager.reclaim_frames(min(self.batch_size, self.high_watermark - free))
+        self.reclaimed_pages += reclaimed
+        self.reclaim_cost += cost
+
+        # Se duerme al llegar a la marca alta, o si no pudo desalojar (SWAP lleno)
+        if reclaimed == 0:
+            self.stalls += 1
+            self.active = False
+        elif free + reclaimed >= self.high_watermark:
+            self.active = False
+
+        return reclaimed
+
+    #Obtiene las estadísticas del reclamador
+    def get_statistics(self):
+        return {
+            'Marcas de Agua (baja/alta)': f"{self.low_watermark}/{self.high_watermark} marcos",
+            'Despertares del Reclamador': self.wakeups,
+            'Páginas Reclamadas en Segundo Plano': self.reclaimed_pages,
+            'Costo del Reclamo en Segundo Plano': f"{self.reclaim_cost / 1e6:.2f} ms",
+            'Reclamos sin Progreso': self.stalls
+        }
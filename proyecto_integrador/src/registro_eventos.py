@@ -0,0 +1,255 @@
+"""
+Módulo de Registro de Eventos
+Guarda en disco el log de eventos del gestor de memoria sin frenar la simulación:
+los eventos se encolan como tuplas compactas y un hilo de fondo los escribe por
+lotes, en JSON lines o en registros binarios con prefijo de longitud, rotando
+el archivo por tamaño y comprimiendo opcionalmente con gzip los archivos rotados
+"""
+import gzip
+import json
+import os
+import queue
+import shutil
+import struct
+import threading
+import time
+
+
+# Tipos de evento con su código en el formato binario
+EVENT_TYPES = ('INFO', 'WARNING', 'ERROR', 'SUCCESS')
+
+# Encabezado de cada registro binario: longitud del resto, tick, instante y código de tipo
+_RECORD_HEADER = struct.Struct("<IqdB")
+
+# Los archivos binarios empiezan con esta marca para reconocerlos al leerlos
+BINARY_MAGIC = b"SIMEVT\x00\x01"
+
+
+#Codifica un evento en formato binario
+def _encode_binary(tick, timestamp, event_type, message):
+    payload = message.encode('utf-8')
+    code = EVENT_TYPES.index(event_type) if event_type in EVENT_TYPES else 255
+    return _RECORD_HEADER.pack(_RECORD_HEADER.size - 4 + len(payload), tick, timestamp, code) + payload
+
+
+#Codifica un evento como línea JSON
+def _encode_json(tick, timestamp, event_type, message):
+    record = {'tick': tick, 'time': timestamp, 'type': event_type, 'message': message}
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+#Lee los eventos de un archivo del registro (rotado o comprimido incluidos)
+#El formato se reconoce por la marca de los archivos binarios; fmt lo impone (json o binario)
+def read_events(path, fmt=None):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        data = f.read()
+
+    has_magic = data.startswith(BINARY_MAGIC)
+    if fmt is None:
+        fmt = 'binario' if has_magic else 'json'
+    if fmt not in EventSink.FORMATS:
+        raise ValueError(f"Formato de registro de eventos desconocido: {fmt}")
+
+    if fmt == 'json':
+        return [json.loads(line) for line in data.decode('utf-8').splitlines() if line]
+
+    events = []
+    offset = len(BINARY_MAGIC) if has_magic else 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        length, tick, timestamp, code = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        end = offset + 4 + length
+        event_type = EVENT_TYPES[code] if code < len(EVENT_TYPES) else 'OTRO'
+        events.append({'tick': tick, 'time': timestamp, 'type': event_type,
+                       'message': data[start:end].decode('utf-8')})
+        offset = end
+    return events
+
+
+class EventSink:
+    """
+    Destino asíncrono de eventos en disco con rotación por tamaño
+    El hilo de simulación solo encola; si la cola se llena los eventos se descartan y se cuentan
+    """
+
+    FORMATS = {'json': _encode_json, 'binario': _encode_binary}
+
+    def __init__(self, path, fmt='json', max_bytes=10 * 1024 * 1024, max_files=5, compress=False,
+                 batch_size=256, queue_size=65536):
+        """
+        Inicializa el registro y arranca el hilo escritor
+
+        Args:
+            path (str): Archivo del registro; los rotados se llaman path.1, path.2, ...
+            fmt (str): json o binario
+            max_bytes (int): Tamaño a partir del cual se rota el archivo
+            max_files (int): Archivos rotados que se conservan
+            compress (bool): Comprimir con gzip los archivos rotados
+            batch_size (int): Eventos escritos por lote como máximo
+            queue_size (int): Capacidad de la cola entre la simulación y el escritor
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Formato de registro de eventos desconocido: {fmt}")
+
+        self.path = path
+        self.format = fmt
+        self.encode = self.FORMATS[fmt]
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.compress = compress
+        self.batch_size = batch_size
+
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = None
+        self.file = None
+        self.size = 0
+
+        # Estadísticas
+        self.written_events = 0
+        self.dropped_events = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+        self.open()
+
+    #Abre el archivo (agregando al final) y arranca el hilo escritor
+    def open(self):
+        if self.thread is not None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open_file()
+        self.thread = threading.Thread(target=self._writer_loop, name="registro-eventos", daemon=True)
+        self.thread.start()
+
+    #Abre el archivo actual para agregar; un archivo binario nuevo empieza con su marca
+    def _open_file(self):
+        self.file = open(self.path, 'ab')
+        self.size = self.file.tell()
+        if self.size == 0 and self.format == 'binario':
+            self.file.write(BINARY_MAGIC)
+            self.size = len(BINARY_MAGIC)
+
+    #Encola un evento sin bloquear; retorna False si se descartó
+    #Si el registro estaba cerrado se vuelve a abrir
+    def emit(self, tick, event_type, message, timestamp=None):
+        if self.thread is None:
+            self.open()
+        try:
+            self.queue.put_nowait((tick, timestamp if timestamp is not None else time.time(), event_type, message))
+            return True
+        except queue.Full:
+            self.dropped_events += 1
+            return False
+
+    #Espera a que el escritor haya escrito todo lo encolado
+    def flush(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.join()
+
+    #Escribe lo pendiente, detiene el hilo y cierra el archivo
+    def close(self):
+        if self.thread is None:
+            return
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+
+    #Bucle del hilo escritor: toma un evento (bloqueando) y agrega los que ya esperan
+    def _writer_loop(self):
+        while True:
+            item = self.queue.get()
+            batch = [item]
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch([event for event in batch if event is not None])
+            except Exception:
+                # Ningún error detiene al escritor: flush() espera el task_done de cada evento
+                self.write_errors += 1
+                self._recover()
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+            if batch[-1] is None:
+                return
+
+    #Reabre el archivo si un error lo dejó cerrado (por ejemplo a mitad de una rotación)
+    def _recover(self):
+        if self.file is not None and not self.file.closed:
+            return
+        try:
+            self._open_file()
+        except OSError:
+            self.file = None
+
+    #Escribe un lote y rota si el archivo superó el tamaño máximo
+    def _write_batch(self, batch):
+        if not batch:
+            return
+        if self.file is None:
+            self._open_file()
+        # Un evento que no se puede codificar se cuenta como error sin perder el resto del lote
+        chunks = []
+        for event in batch:
+            try:
+                chunks.append(self.encode(*event))
+            except (TypeError, ValueError, AttributeError):
+                self.write_errors += 1
+        data = b"".join(chunks)
+        self.file.write(data)
+        self.file.flush()
+        self.size += len(data)
+        self.written_events += len(chunks)
+
+        if self.size >= self.max_bytes:
+            self._rotate()
+
+    #Nombre del archivo rotado número index
+    def _rotated_name(self, index):
+        return f"{self.path}.{index}" + (".gz" if self.compress else "")
+
+    #Desplaza los archivos rotados, comprime el actual si corresponde y empieza uno nuevo
+    def _rotate(self):
+        self.file.close()
+
+        oldest = self._rotated_name(self.max_files)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self.max_files - 1, 0, -1):
+            name = self._rotated_name(index)
+            if os.path.exists(name):
+                os.replace(name, self._rotated_name(index + 1))
+
+        if self.max_files > 0:
+            if self.compress:
+                with open(self.path, 'rb') as source, gzip.open(self._rotated_name(1), 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self._rotated_name(1))
+        else:
+            os.remove(self.path)
+
+        self._open_file()
+        self.rotations += 1
+
+    #Obtiene las estadísticas del registro
+    def get_statistics(self):
+        return {
+            'Eventos en Disco': self.written_events,
+            'Eventos Descartados': self.dropped_events,
+            'Rotaciones del Registro': self.rotations,
+            'Errores de Escritura del Registro': self.write_errors
+        }
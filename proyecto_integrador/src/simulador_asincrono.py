@@ -0,0 +1,173 @@
+"""
+Simulación Asíncrona (asyncio)
+Cada proceso simulado es una tarea ligera con su propio ciclo de accesos,
+suspensiones y salida, de modo que decenas de miles de procesos se intercalan
+en un único bucle de eventos sin necesitar un hilo por proceso
+"""
+import asyncio
+
+from generador_proceso import ProcessGenerator
+from proceso import Process
+
+
+class AsyncSimulation:
+    """
+    Controlador de simulación basado en asyncio
+    El tiempo simulado avanza time_scale veces más rápido que el tiempo real
+    """
+
+    def __init__(self, memory_manager, generator=None, time_scale=1.0):
+        """
+        Inicializa la simulación asíncrona
+
+        Args:
+            memory_manager (MemoryManager): Gestor de memoria compartido por todas las tareas
+            generator (ProcessGenerator): Generador de procesos (opcional)
+            time_scale (float): Segundos simulados por segundo real
+        """
+        self.memory_manager = memory_manager
+        self.random = memory_manager.random
+        self.generator = generator or ProcessGenerator(
+            min_size=200,
+            max_size=800,
+            min_interval=0.05,
+            max_interval=0.2,
+            rng=self.random
+        )
+        self.time_scale = time_scale
+
+        # Tiempo de ejecución de procesos
+        self.min_exec_time = 15.0   # Segundos
+        self.max_exec_time = 40.0   # Segundos
+
+        # Tiempo entre accesos de un mismo proceso
+        self.min_think_time = 0.05  # Segundos
+        self.max_think_time = 0.5   # Segundos
+
+        # Suspensiones
+        self.prob_suspend = 0.02    # Probabilidad por acceso
+        self.min_suspend_time = 3.0
+        self.max_suspend_time = 8.0
+
+        # Latencia de un fallo de página (E/S de SWAP)
+        self.fault_latency = 0.01   # Segundos
+
+        # Límite de procesos simultáneos
+        self.max_processes = 10000
+
+        self.running = False
+        self.tasks = set()
+        self.completed_processes = 0
+        self.rejected_processes = 0
+
+    #Duerme una cantidad de tiempo simulado
+    async def _sleep(self, sim_seconds):
+        await asyncio.sleep(max(0.0, sim_seconds) / self.time_scale)
+
+    #Crea un proceso y lanza su tarea
+    def _spawn_process(self):
+        name = self.generator.generate_process_name()
+        size = self.generator.generate_process_size()
+
+        success, message, process = self.memory_manager.create_process(name, size)
+
+        if not success:
+            self.generator.release_name(name)
+            self.rejected_processes += 1
+            return None
+
+        process.execution_time = self.random.lifetimes.uniform(self.min_exec_time, self.max_exec_time)
+        process.time_in_system = 0.0
+        process.access_pattern = self.generator.create_access_pattern(name)
+
+        task = asyncio.create_task(self._process_lifecycle(process))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return process
+
+    #Ciclo de vida de un proceso: accesos, suspensiones y salida
+    async def _process_lifecycle(self, process):
+        loop = asyncio.get_running_loop()
+        last = loop.time()
+
+        try:
+            while self.running and not process.is_finished():
+                if process.state == Process.SUSPENDED:
+                    await self._sleep(process.suspended_time - process.time_suspended)
+                    if process.page_table.count_pages_in_ram() > 0:
+                        process.set_state(Process.ACTIVE)
+                    else:
+                        process.set_state(Process.SWAPPED)
+
+                elif self.random.suspensions.random() < self.prob_suspend:
+                    duration = self.random.suspensions.uniform(self.min_suspend_time, self.max_suspend_time)
+                    process.suspend(duration)
+                    self.memory_manager._log_event(f"{process} SUSPENDIDO por {duration:.1f}s", "WARNING")
+
+                elif process.num_pages > 0:
+                    page_num = process.next_page()
+                    await self.memory_manager.simulate_page_access_async(
+                        process.pid, page_num, self.fault_latency / self.time_scale
+                    )
+                    if process.state == Process.SWAPPED:
+                        self.memory_manager._update_process_state(process)
+                    await self._sleep(self.random.accesses.uniform(self.min_think_time, self.max_think_time))
+
+                now = loop.time()
+                process.update_time((now - last) * self.time_scale)
+                last = now
+
+            if process.is_finished():
+                self.completed_processes += 1
+        finally:
+            if self.memory_manager._find_process_by_pid(process.pid) is process:
+                self.generator.release_name(process.name)
+                self.memory_manager.terminate_process(process.pid)
+
+    #Crea procesos según los intervalos del generador
+    async def _arrivals(self):
+        while self.running:
+            if len(self.memory_manager.processes) < self.max_processes:
+                self._spawn_process()
+            await self._sleep(self.generator.get_next_interval())
+
+    async def run(self, duration):
+        """
+        Ejecuta la simulación durante un tiempo simulado
+
+        Args:
+            duration (float): Tiempo simulado en segundos
+
+        Returns:
+            dict: Estado de la simulación al terminar
+        """
+        self.running = True
+        arrivals = asyncio.create_task(self._arrivals())
+
+        try:
+            await self._sleep(duration)
+        finally:
+            self.running = False
+            arrivals.cancel()
+            pending = list(self.tasks)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(arrivals, *pending, return_exceptions=True)
+
+        return self.get_status()
+
+    #Ejecuta la simulación en un bucle de eventos nuevo
+    def run_blocking(self, duration):
+        return asyncio.run(self.run(duration))
+
+    #Obtiene el estado actual de la simulación
+    def get_status(self):
+        return {
+            'running': self.running,
+            'tasks': len(self.tasks),
+            'total_processes': len(self.memory_manager.processes),
+            'completed': self.completed_processes,
+            'rejected': self.rejected_processes,
+            'page_faults': self.memory_manager.total_page_faults,
+            'swaps': self.memory_manager.total_swaps
+        }
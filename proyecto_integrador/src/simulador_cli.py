@@ -0,0 +1,275 @@
+"""
+Punto de entrada de línea de comandos (sin interfaz gráfica)
+Ejecuta un escenario durante un tiempo simulado o un número de eventos
+y escribe las estadísticas en la salida estándar como JSON lines o CSV
+
+No importa tkinter, por lo que funciona en servidores sin pantalla
+y arranca en decenas de milisegundos
+
+Uso:
+    python simulador_cli.py --config config.ini --tiempo 300 --formato csv
+    python simulador_cli.py --eventos 10000 --semilla 42 --cada 100
+    python simulador_cli.py --eventos 2000 --curva-fallos curva.csv
+    python simulador_cli.py --traza accesos.csv --curva-fallos curva.csv
+    python simulador_cli.py --asignadores 20000 --formato csv
+    python simulador_cli.py --eventos 5000 --guardar-estado estado.ckpt
+    python simulador_cli.py --eventos 5000 --cargar-estado estado.ckpt
+    python simulador_cli.py --eventos 2000 --verificar-estado 1000
+"""
+import argparse
+import csv
+import json
+import struct
+import sys
+
+from config import Config
+from administrador_memoria import MemoryManager
+from controlador_simulador import SimulationController
+from asignador_fisico import MIN_REPRESENTATIVE_FRAMES, benchmark_allocators
+from curva_fallos import SampledStackAnalyzer, StackDistanceAnalyzer
+from punto_control import dump_state, load_checkpoint, load_state, save_checkpoint
+
+
+#Construye el analizador de argumentos
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Simulador de gestión de memoria RAM y SWAP sin interfaz gráfica"
+    )
+    parser.add_argument('--config', default='config.ini',
+                        help="Archivo de configuración (por defecto config.ini)")
+    parser.add_argument('--tiempo', type=float, default=None,
+                        help="Tiempo simulado a ejecutar en segundos")
+    parser.add_argument('--eventos', type=int, default=None,
+                        help="Número de ciclos de simulación a ejecutar")
+    parser.add_argument('--paso', type=float, default=0.5,
+                        help="Tiempo simulado por ciclo en segundos (por defecto 0.5)")
+    parser.add_argument('--cada', type=int, default=1,
+                        help="Escribir estadísticas cada N ciclos (por defecto 1)")
+    parser.add_argument('--formato', choices=('json', 'csv'), default='json',
+                        help="Formato de salida (por defecto json)")
+    parser.add_argument('--semilla', type=int, default=None,
+                        help="Semilla de la simulación (reemplaza la del archivo)")
+    parser.add_argument('--curva-fallos', default=None, metavar='RUTA',
+                        help="Escribir la curva de fallos contra número de marcos (LRU y FIFO) en CSV")
+    parser.add_argument('--traza', default=None, metavar='RUTA',
+                        help="Calcular la curva a partir de una traza CSV (pid, pagina) sin simular")
+    parser.add_argument('--muestreo', type=int, default=None, metavar='PAGINAS',
+                        help="Curva aproximada (SHARDS) con a lo sumo PAGINAS páginas en la muestra, memoria constante")
+    parser.add_argument('--fifo-marcos', type=int, default=64, metavar='MARCOS',
+                        help="Simular FIFO en la curva hasta MARCOS marcos (por defecto 64, 0 = no simular)")
+    parser.add_argument('--guardar-traza', default=None, metavar='RUTA',
+                        help="Guardar la traza de accesos de la simulación en CSV")
+    parser.add_argument('--asignadores', type=int, default=None, metavar='OPERACIONES',
+                        help="Comparar los asignadores buddy y slab contra la paginación con OPERACIONES operaciones, sin simular")
+    parser.add_argument('--cargar-estado', default=None, metavar='RUTA',
+                        help="Continuar desde un punto de control guardado con --guardar-estado")
+    parser.add_argument('--guardar-estado', default=None, metavar='RUTA',
+                        help="Guardar un punto de control al terminar la ejecución")
+    parser.add_argument('--verificar-estado', type=int, default=None, metavar='CICLO',
+                        help="Verificar que cortar la ejecución con un punto de control en CICLO y continuar "
+                             "desde él da las mismas estadísticas que la ejecución sin cortes")
+    return parser
+
+
+#Crea la función que escribe una fila de estadísticas en el formato elegido
+def make_writer(fmt, stream):
+    if fmt == 'json':
+        def write(row):
+            stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+        return write
+
+    writer = None
+
+    def write(row):
+        nonlocal writer
+        if writer is None:
+            writer = csv.DictWriter(stream, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(row)
+
+    return write
+
+
+#Ejecuta el escenario, retorna el código de salida
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.muestreo is not None and args.muestreo <= 0:
+        print("--muestreo debe ser positivo", file=sys.stderr)
+        return 2
+    if args.fifo_marcos < 0:
+        print("--fifo-marcos no puede ser negativo", file=sys.stderr)
+        return 2
+
+    if args.traza is not None:
+        return analyze_trace(args)
+
+    if args.asignadores is not None:
+        return compare_allocators(args)
+
+    if args.tiempo is None and args.eventos is None:
+        print("Se debe indicar --tiempo o --eventos", file=sys.stderr)
+        return 2
+    if args.paso <= 0 or args.cada <= 0:
+        print("--paso y --cada deben ser positivos", file=sys.stderr)
+        return 2
+
+    try:
+        config = Config(args.config)
+    except ValueError as e:
+        print(f"Configuración inválida: {e}", file=sys.stderr)
+        return 1
+
+    if args.semilla is not None:
+        config.seed = args.semilla
+
+    steps = args.eventos
+    if args.tiempo is not None:
+        time_steps = int(round(args.tiempo / args.paso))
+        steps = time_steps if steps is None else min(steps, time_steps)
+
+    if args.verificar_estado is not None:
+        if not 0 < args.verificar_estado < steps:
+            print("--verificar-estado debe estar entre 1 y el número de ciclos menos uno", file=sys.stderr)
+            return 2
+        return verify_checkpoint(config, steps, args)
+
+    memory_manager = MemoryManager(config)
+    simulation = SimulationController(memory_manager)
+    write = make_writer(args.formato, sys.stdout)
+
+    if args.cargar_estado:
+        try:
+            load_checkpoint(memory_manager, args.cargar_estado, controller=simulation)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"No se pudo cargar el punto de control: {e}", file=sys.stderr)
+            return 1
+
+    if args.muestreo is not None and args.guardar_traza:
+        print("--guardar-traza no está disponible con --muestreo", file=sys.stderr)
+        return 2
+
+    analyzer = None
+    if args.curva_fallos or args.guardar_traza:
+        analyzer = create_analyzer(args)
+        memory_manager.add_access_listener(analyzer)
+
+    for step in range(1, steps + 1):
+        simulation.step(args.paso)
+
+        if step % args.cada == 0 or step == steps:
+            row = {'Ciclo': step, 'Tiempo Simulado': round(simulation.sim_time, 6)}
+            row.update(simulation.get_statistics())
+            write(row)
+
+    # El punto de control se guarda antes de detener: stop() reinicia el generador de procesos
+    if args.guardar_estado:
+        try:
+            save_checkpoint(memory_manager, args.guardar_estado, controller=simulation)
+        except OSError as e:
+            print(f"No se pudo guardar el punto de control: {e}", file=sys.stderr)
+            return 1
+
+    simulation.stop()
+    if analyzer is not None:
+        write_curve(analyzer, args)
+    sys.stdout.flush()
+    return 0
+
+
+#Estadísticas de una ejecución que deben coincidir entre la ejecución cortada y la continua
+def comparable_statistics(simulation):
+    stats = simulation.get_statistics()
+    stats['Métricas'] = json.dumps(simulation.memory_manager.metrics.get_summary(), sort_keys=True)
+    return stats
+
+
+#Ejecuta el escenario sin cortes y cortado por un punto de control en --verificar-estado,
+#y compara las estadísticas finales; retorna 0 si coinciden y 1 si no
+def verify_checkpoint(config, steps, args):
+    memory_manager = MemoryManager(config)
+    simulation = SimulationController(memory_manager)
+    for step in range(1, steps + 1):
+        simulation.step(args.paso)
+        if step == args.verificar_estado:
+            data = dump_state(memory_manager, controller=simulation)
+    expected = comparable_statistics(simulation)
+    simulation.stop()
+
+    memory_manager = MemoryManager(config)
+    simulation = SimulationController(memory_manager)
+    load_state(memory_manager, data, controller=simulation)
+    for _ in range(steps - args.verificar_estado):
+        simulation.step(args.paso)
+    actual = comparable_statistics(simulation)
+    simulation.stop()
+
+    differences = [key for key in expected if expected[key] != actual.get(key)]
+    write = make_writer(args.formato, sys.stdout)
+    write({'Ciclos': steps, 'Corte': args.verificar_estado, 'Bytes del Punto de Control': len(data),
+           'Coincide': not differences, 'Diferencias': ", ".join(differences)})
+    sys.stdout.flush()
+    return 0 if not differences else 1
+
+
+#Compara los asignadores físicos contra la paginación y escribe una fila por carga y motor
+def compare_allocators(args):
+    if args.asignadores <= 0:
+        print("--asignadores debe ser positivo", file=sys.stderr)
+        return 2
+
+    try:
+        config = Config(args.config)
+    except ValueError as e:
+        print(f"Configuración inválida: {e}", file=sys.stderr)
+        return 1
+
+    if config.ram_frames < MIN_REPRESENTATIVE_FRAMES:
+        print(f"Aviso: con {config.ram_frames} marcos de RAM la comparación de asignadores es poco representativa "
+              f"(se recomiendan al menos {MIN_REPRESENTATIVE_FRAMES})", file=sys.stderr)
+
+    write = make_writer(args.formato, sys.stdout)
+    seed = args.semilla if args.semilla is not None else (config.seed or 0)
+    for row in benchmark_allocators(config, args.asignadores, seed):
+        write(row)
+    sys.stdout.flush()
+    return 0
+
+
+#Crea el analizador de la curva de fallos: exacto, o muestreado si se pidió --muestreo
+def create_analyzer(args):
+    if args.muestreo is not None:
+        return SampledStackAnalyzer(max_pages=args.muestreo)
+    return StackDistanceAnalyzer(fifo_max_frames=args.fifo_marcos)
+
+
+#Escribe la curva de fallos y la traza pedidas, con el resumen en la salida de errores
+def write_curve(analyzer, args):
+    if args.curva_fallos:
+        analyzer.export_csv(args.curva_fallos)
+    if args.guardar_traza:
+        analyzer.save_trace(args.guardar_traza)
+    print(json.dumps(analyzer.get_statistics(), ensure_ascii=False), file=sys.stderr)
+
+
+#Calcula la curva de fallos de una traza sin ejecutar la simulación
+def analyze_trace(args):
+    if not args.curva_fallos:
+        print("--traza requiere --curva-fallos", file=sys.stderr)
+        return 2
+
+    try:
+        if args.muestreo is not None:
+            analyzer = SampledStackAnalyzer.from_trace(args.traza, max_pages=args.muestreo)
+        else:
+            analyzer = StackDistanceAnalyzer.from_trace(args.traza, fifo_max_frames=args.fifo_marcos)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"No se pudo leer la traza: {e}", file=sys.stderr)
+        return 1
+
+    write_curve(analyzer, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,16 +11,21 @@ class PageTableEntry:
         self.frame_number = None    # Marco físico asignado
         self.valid = False          # Bit de validación (presente en RAM)
         self.in_swap = False        # Está en área de intercambio
+        self.compressed = False     # Está en el pool de memoria comprimida
         self.modified = False       # Bit de modificación (dirty bit)
         self.referenced = False     # Bit de referencia
+        self.cow = False            # Marco compartido de solo lectura (copy-on-write)
     
     def __str__(self):
         if self.valid:
-            location = "RAM"
+            location = "RAM, COW" if self.cow else "RAM"
             frame = self.frame_number
         elif self.in_swap:
-            location = "SWAP"
+            location = "SWAP, COW" if self.cow else "SWAP"
             frame = self.frame_number
+        elif self.compressed:
+            location = "Comprimida"
+            frame = "N/A"
         else:
             location = "No asignada"
             frame = "N/A"
@@ -35,18 +40,47 @@ class PageTable:
     """
 
     #Inicializa la tabla de páginas para un proceso
-    def __init__(self, process, num_pages):
+    def __init__(self, process, num_pages, pages_per_huge=1):
         self.process = process
         self.num_pages = num_pages
         self.entries = []
+
+        # Regiones alineadas de pages_per_huge páginas mapeadas con una sola página enorme
+        self.pages_per_huge = pages_per_huge
+        self.huge_regions = set()
+
+        # Contadores de páginas en RAM y en SWAP, mantenidos en cada cambio
+        self.ram_count = 0
+        self.swap_count = 0
+        self.compressed_count = 0
         
         # Crear todas las entradas
         for i in range(num_pages):
             self.entries.append(PageTableEntry(i))
 
+    #Descuenta la ubicación actual de una entrada antes de cambiarla
+    #La nueva ubicación empieza sin compartir; el gestor marca cow si la comparte
+    def _uncount(self, entry):
+        if entry.valid:
+            self.ram_count -= 1
+        if entry.in_swap:
+            self.swap_count -= 1
+        if entry.compressed:
+            self.compressed_count -= 1
+            entry.compressed = False
+        entry.cow = False
+
+    #Recalcula los contadores a partir de las entradas (tras modificarlas directamente)
+    def recount(self):
+        self.ram_count = sum(1 for entry in self.entries if entry.valid)
+        self.swap_count = sum(1 for entry in self.entries if entry.in_swap)
+        self.compressed_count = sum(1 for entry in self.entries if entry.compressed)
+
     #Marca una página como presente en RAM
     def set_page_in_ram(self, page_number, frame_number):
         entry = self.entries[page_number]
+        self._uncount(entry)
+        self.ram_count += 1
         entry.frame_number = frame_number
         entry.valid = True
         entry.in_swap = False
@@ -55,17 +89,59 @@ class PageTable:
     #   Marca una página como presente en SWAP
     def set_page_in_swap(self, page_number, frame_number):
         entry = self.entries[page_number]
+        self._uncount(entry)
+        self.swap_count += 1
         entry.frame_number = frame_number
         entry.valid = False
         entry.in_swap = True
 
+    #Marca una página como guardada en el pool de memoria comprimida
+    def set_page_compressed(self, page_number):
+        entry = self.entries[page_number]
+        self._uncount(entry)
+        self.compressed_count += 1
+        entry.frame_number = None
+        entry.valid = False
+        entry.in_swap = False
+        entry.compressed = True
+
     #Invalida una página, la marca como no presente
     def invalidate_page(self, page_number):
         entry = self.entries[page_number]
+        self._uncount(entry)
         entry.valid = False
         entry.in_swap = False
         entry.frame_number = None
 
+    #Región de página enorme a la que pertenece una página
+    def region_of(self, page_number):
+        return page_number // self.pages_per_huge
+
+    #Marca una región como mapeada con una página enorme
+    def set_huge_region(self, region):
+        self.huge_regions.add(region)
+
+    #Divide una página enorme en páginas base, retorna True si la región era enorme
+    def split_huge_region(self, region):
+        if region in self.huge_regions:
+            self.huge_regions.discard(region)
+            return True
+        return False
+
+    #Verifica si una página está mapeada dentro de una página enorme
+    def is_page_huge(self, page_number):
+        return bool(self.huge_regions) and page_number // self.pages_per_huge in self.huge_regions
+
+    #Clave de traducción en la TLB: las páginas enormes comparten una entrada (negativa)
+    def tlb_key(self, page_number):
+        if self.is_page_huge(page_number):
+            return -(page_number // self.pages_per_huge) - 1
+        return page_number
+
+    #Número de entradas de la tabla: una por página base y una por página enorme
+    def count_entries(self):
+        return self.num_pages - len(self.huge_regions) * (self.pages_per_huge - 1)
+
     #Obtiene el marco físico de una página
     def get_frame(self, page_number):
         entry = self.entries[page_number]
@@ -79,6 +155,10 @@ class PageTable:
     def is_page_in_swap(self, page_number):
         return self.entries[page_number].in_swap
 
+    #Verifica si una página está en el pool comprimido
+    def is_page_compressed(self, page_number):
+        return self.entries[page_number].compressed
+
     #Obtiene lista de páginas presentes en RAM
     def get_pages_in_ram(self):
         return [entry.page_number for entry in self.entries if entry.valid]
@@ -87,6 +167,18 @@ class PageTable:
     def get_pages_in_swap(self):
         return [entry.page_number for entry in self.entries if entry.in_swap]
 
+    #Cuenta las páginas presentes en RAM sin recorrer la tabla
+    def count_pages_in_ram(self):
+        return self.ram_count
+
+    #Cuenta las páginas en SWAP sin recorrer la tabla
+    def count_pages_in_swap(self):
+        return self.swap_count
+
+    #Cuenta las páginas en el pool comprimido
+    def count_pages_compressed(self):
+        return self.compressed_count
+
     #Obtiene información completa de la tabla
     def get_table_info(self):
         return [str(entry) for entry in self.entries]